@@ -0,0 +1,109 @@
+"""Shared helpers for the benchmark scripts: statistics, result files and baselines."""
+
+from __future__ import annotations
+
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def summarize(samples_ms: list[float]) -> dict[str, float]:
+  """Reduce raw samples to the statistics stored in result files."""
+  ordered = sorted(samples_ms)
+  return {
+    'median_ms': round(statistics.median(ordered), 3),
+    'min_ms': round(ordered[0], 3),
+    'p90_ms': round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.9))], 3),
+    'runs': len(ordered),
+  }
+
+
+def _git_revision() -> str | None:
+  try:
+    out = subprocess.run(
+      ['git', 'rev-parse', '--short', 'HEAD'], cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+  except (OSError, subprocess.CalledProcessError):
+    return None
+  return out.stdout.strip() or None
+
+
+def metadata(suite: str) -> dict[str, Any]:
+  return {
+    'suite': suite,
+    'timestamp': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+    'revision': _git_revision(),
+    'python': platform.python_version(),
+    'implementation': platform.python_implementation(),
+    'platform': platform.platform(),
+    'cpu_count': os.cpu_count(),
+  }
+
+
+def write_results(path: str | Path, suite: str, results: dict[str, dict[str, Any]], **meta: Any) -> None:
+  """Write results as JSON: ``{"meta": {...}, "results": {name: stats}}``.
+
+  Extra keyword arguments are stored in ``meta``, e.g. the benchmark setup.
+  """
+  document = {'meta': {**metadata(suite), **meta}, 'results': results}
+  Path(path).write_text(json.dumps(document, indent=2, sort_keys=True) + '\n')
+
+
+def print_table(results: dict[str, dict[str, float]], *, metric: str = 'median_ms') -> None:
+  width = max((len(name) for name in results), default=10)
+  for name, stats in results.items():
+    print(f'{name:<{width}}  {stats[metric]:>10.3f} ms  (min {stats["min_ms"]:.3f}, n={stats["runs"]})')
+
+
+def compare(
+  results: dict[str, dict[str, float]],
+  baseline_path: str | Path,
+  *,
+  threshold: float,
+  metric: str = 'median_ms',
+) -> list[str]:
+  """Print the change against a baseline file and return regressed benchmark names.
+
+  A benchmark regresses when ``metric`` grew by more than ``threshold``
+  (a fraction, e.g. ``0.2`` for 20%). Benchmarks missing from either side
+  are reported but never count as regressions.
+  """
+  baseline = json.loads(Path(baseline_path).read_text())['results']
+  regressions = []
+  width = max((len(name) for name in results | baseline), default=10)
+  for name in sorted(results | baseline):
+    if name not in baseline or name not in results:
+      print(f'{name:<{width}}  {"only in " + ("current" if name in results else "baseline"):>24}')
+      continue
+    before, after = baseline[name][metric], results[name][metric]
+    change = (after - before) / before if before else 0.0
+    flag = ''
+    if change > threshold:
+      flag = '  REGRESSION'
+      regressions.append(name)
+    print(f'{name:<{width}}  {before:>10.3f} -> {after:>10.3f} ms  {change:>+7.1%}{flag}')
+  return regressions
+
+
+def python_env() -> dict[str, str]:
+  """Environment for child interpreters that import the in-tree package."""
+  env = dict(os.environ)
+  env['PYTHONPATH'] = str(ROOT / 'src') + (os.pathsep + env['PYTHONPATH'] if env.get('PYTHONPATH') else '')
+  env.pop('PYTHONDONTWRITEBYTECODE', None)
+  return env
+
+
+def run_python(code: str, *args: str) -> str:
+  """Run ``code`` in a fresh interpreter and return its stdout."""
+  out = subprocess.run(
+    [sys.executable, '-c', code, *args], capture_output=True, text=True, check=True, env=python_env(),
+  )
+  return out.stdout
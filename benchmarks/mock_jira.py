@@ -0,0 +1,402 @@
+"""Mock Jira Cloud server for benchmarks.
+
+Serves generated, deterministic payloads over real sockets so benchmarks
+exercise connection handling, HTTP parsing, JSON decoding and model
+validation without network variance. Payload size, latency and throttling
+are configured through ``MockConfig``.
+
+``MockJira`` runs the server on a thread of the current process, which is
+convenient but shares the GIL with the code being measured. ``spawn()``
+runs it in a child process instead and is what the throughput benchmarks
+use. The child can also be started by hand::
+
+  python -m benchmarks.mock_jira --issues 5000 --latency-ms 20 --port 8080
+
+Besides the Jira endpoints it serves ``GET /__stats`` (request and 429
+counts) and ``POST /__reset``.
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import dataclasses
+import functools
+import json
+import random
+import re
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+from urllib.parse import parse_qs, urlsplit
+
+PROJECT = {'id': '10000', 'key': 'PROJ', 'name': 'Project', 'projectTypeKey': 'software'}
+USER = {
+  'accountId': '5b10a2844c20165700ede21g',
+  'accountType': 'atlassian',
+  'displayName': 'Mia Krystof',
+  'emailAddress': 'mia@example.com',
+  'active': True,
+  'timeZone': 'UTC',
+}
+_STATUSES = [
+  {'id': '1', 'name': 'To Do', 'statusCategory': {'id': 2, 'key': 'new'}},
+  {'id': '3', 'name': 'In Progress', 'statusCategory': {'id': 4, 'key': 'indeterminate'}},
+  {'id': '5', 'name': 'Done', 'statusCategory': {'id': 3, 'key': 'done'}},
+]
+_WORDS = 'the export pipeline fails when a worker restarts during reindex of large projects'.split()
+
+
+@dataclass(frozen=True)
+class MockConfig:
+  """Shape of the data served and of the injected latency and throttling.
+
+  ``issue_count`` issues ``PROJ-1`` .. ``PROJ-<issue_count>`` exist, each
+  with ``comments_per_issue`` comments and one attachment of
+  ``attachment_bytes``. ``description_bytes`` and ``custom_fields`` scale
+  the issue payload. Every response is delayed by ``latency_ms`` plus a
+  uniform ``jitter_ms``, and with probability ``slow_probability`` by
+  ``slow_ms`` instead, to model a long tail.
+
+  Throttling: every ``rate_limit_every``-th API request, and any request
+  beyond ``max_rps`` requests per second (token bucket, one second of
+  burst), is answered with 429 and ``Retry-After: <retry_after>``. With
+  ``max_rps`` API responses also carry Jira's ``X-RateLimit-*`` headers
+  for the bucket, with ``X-RateLimit-NearLimit`` below 20% of it.
+  """
+
+  issue_count: int = 1000
+  description_bytes: int = 2000
+  custom_fields: int = 20
+  comments_per_issue: int = 10
+  attachment_bytes: int = 256 * 1024
+  max_page_size: int = 100
+  latency_ms: float = 0.0
+  jitter_ms: float = 0.0
+  slow_probability: float = 0.0
+  slow_ms: float = 0.0
+  rate_limit_every: int = 0
+  max_rps: float = 0.0
+  retry_after: int = 1
+  seed: int = 0
+
+
+def _text(n: int, size: int) -> str:
+  words = [_WORDS[(n + i) % len(_WORDS)] for i in range(size // 6 + 1)]
+  return ' '.join(words)[:size]
+
+
+def _adf(text: str) -> dict[str, Any]:
+  return {'type': 'doc', 'version': 1, 'content': [{'type': 'paragraph', 'content': [{'type': 'text', 'text': text}]}]}
+
+
+def make_issue(n: int, config: MockConfig = MockConfig()) -> dict[str, Any]:
+  """Return a representative issue payload for issue number ``n``."""
+  fields: dict[str, Any] = {
+    'summary': f'Issue {n}: ' + _text(n, 60),
+    'status': _STATUSES[n % len(_STATUSES)],
+    'issuetype': {'id': '10001', 'name': 'Task', 'subtask': False},
+    'priority': {'id': str(1 + n % 5), 'name': ['Highest', 'High', 'Medium', 'Low', 'Lowest'][n % 5]},
+    'project': PROJECT,
+    'assignee': USER,
+    'reporter': USER,
+    'labels': ['backend', 'export'][: n % 3],
+    'created': '2024-01-15T10:30:00.000+0000',
+    'updated': f'2024-03-{1 + n % 28:02d}T16:45:12.000+0000',
+    'description': _adf(_text(n, config.description_bytes)),
+    'attachment': [make_attachment(n, config)],
+    'comment': {'total': config.comments_per_issue, 'maxResults': 0, 'startAt': 0, 'comments': []},
+  }
+  for i in range(config.custom_fields):
+    fields[f'customfield_{10_100 + i}'] = (n * 7 + i) % 13 if i % 2 else f'value {i}'
+  return {
+    'id': str(10_000 + n),
+    'key': f'PROJ-{n}',
+    'self': f'https://mock.atlassian.net/rest/api/3/issue/{10_000 + n}',
+    'fields': fields,
+  }
+
+
+def make_attachment(n: int, config: MockConfig = MockConfig()) -> dict[str, Any]:
+  return {
+    'id': str(20_000 + n),
+    'filename': f'trace-{n}.log',
+    'author': USER,
+    'created': '2024-01-16T08:00:00.000+0000',
+    'size': config.attachment_bytes,
+    'mimeType': 'text/plain',
+    'content': f'https://mock.atlassian.net/rest/api/3/attachment/content/{20_000 + n}',
+  }
+
+
+def make_comment(n: int, index: int) -> dict[str, Any]:
+  return {
+    'id': str(n * 1000 + index),
+    'author': USER,
+    'updateAuthor': USER,
+    'body': _adf(_text(n + index, 200)),
+    'created': '2024-02-01T12:00:00.000+0000',
+    'updated': '2024-02-01T12:00:00.000+0000',
+    'jsdPublic': True,
+  }
+
+
+class _Throttle:
+  """Decides which requests are answered with 429."""
+
+  def __init__(self, config: MockConfig) -> None:
+    self._every = config.rate_limit_every
+    self._rate = config.max_rps
+    self._tokens = config.max_rps
+    self._updated = time.monotonic()
+    self._count = 0
+    self._lock = threading.Lock()
+
+  def reject(self) -> bool:
+    with self._lock:
+      self._count += 1
+      if self._every and self._count % self._every == 0:
+        return True
+      if self._rate:
+        now = time.monotonic()
+        self._tokens = min(self._rate, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+        if self._tokens < 1:
+          return True
+        self._tokens -= 1
+      return False
+
+  def headers(self) -> dict[str, str]:
+    if not self._rate:
+      return {}
+    with self._lock:
+      remaining = max(0, int(self._tokens))
+    headers = {'X-RateLimit-Limit': str(int(self._rate)), 'X-RateLimit-Remaining': str(remaining)}
+    if remaining < 0.2 * self._rate:
+      headers['X-RateLimit-NearLimit'] = 'true'
+    return headers
+
+
+_ISSUE = re.compile(r'^/rest/api/3/issue/PROJ-(\d+)$')
+_COMMENTS = re.compile(r'^/rest/api/3/issue/PROJ-(\d+)/comment$')
+_ATTACHMENT = re.compile(r'^/rest/api/3/attachment/(\d+)$')
+_CONTENT = re.compile(r'^/rest/api/3/attachment/content/(\d+)$')
+
+
+class _Handler(BaseHTTPRequestHandler):
+  protocol_version = 'HTTP/1.1'
+  # Headers and body are separate writes; with Nagle enabled the body waits
+  # for the client's delayed ACK and every response gains ~40 ms.
+  disable_nagle_algorithm = True
+  server: MockJira
+  _limit_headers: dict[str, str] = {}
+
+  def log_message(self, format: str, *args: Any) -> None:
+    pass
+
+  def _send(self, status: int, body: bytes, content_type: str, headers: dict[str, str] | None = None) -> None:
+    self.send_response(status)
+    self.send_header('Content-Type', content_type)
+    self.send_header('Content-Length', str(len(body)))
+    for name, value in {**self._limit_headers, **(headers or {})}.items():
+      self.send_header(name, value)
+    self.end_headers()
+    self.wfile.write(body)
+
+  def _send_json(self, status: int, payload: Any, headers: dict[str, str] | None = None) -> None:
+    body = payload if isinstance(payload, bytes) else json.dumps(payload).encode()
+    self._send(status, body, 'application/json', headers)
+
+  def _not_found(self) -> None:
+    self._send_json(404, {'errorMessages': ['Issue does not exist or you do not have permission to see it.'], 'errors': {}})
+
+  def do_POST(self) -> None:
+    self.rfile.read(int(self.headers.get('Content-Length') or 0))
+    if self.path == '/__reset':
+      self.server.reset()
+      return self._send_json(204, b'')
+    self._not_found()
+
+  def do_GET(self) -> None:
+    url = urlsplit(self.path)
+    path = url.path
+    if path == '/__stats':
+      return self._send_json(200, self.server.stats())
+    server = self.server
+    server.count('requests')
+    rejected = server.throttle.reject()
+    self._limit_headers = server.throttle.headers()
+    if rejected:
+      server.count('throttled')
+      return self._send_json(
+        429,
+        {'errorMessages': ['Rate limit exceeded.'], 'errors': {}},
+        {'Retry-After': str(server.config.retry_after)},
+      )
+    server.delay()
+    query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+    if path == '/rest/api/3/search':
+      return self._send_json(200, server.search_page(int(query.get('startAt', 0)), int(query.get('maxResults', 50))))
+    if path == '/rest/api/3/myself':
+      return self._send_json(200, USER)
+    if path == '/rest/api/3/serverInfo':
+      return self._send_json(200, {'baseUrl': server.url, 'version': '1001.0.0', 'deploymentType': 'Cloud'})
+    if match := _ISSUE.match(path):
+      n = int(match.group(1))
+      return self._send_json(200, server.issue_body(n)) if server.has_issue(n) else self._not_found()
+    if match := _COMMENTS.match(path):
+      n = int(match.group(1))
+      if not server.has_issue(n):
+        return self._not_found()
+      return self._send_json(200, server.comment_page(n, int(query.get('startAt', 0)), int(query.get('maxResults', 50))))
+    if match := _ATTACHMENT.match(path):
+      n = int(match.group(1)) - 20_000
+      return self._send_json(200, make_attachment(n, server.config)) if server.has_issue(n) else self._not_found()
+    if match := _CONTENT.match(path):
+      n = int(match.group(1)) - 20_000
+      if not server.has_issue(n):
+        return self._not_found()
+      return self._send(200, server.attachment_content, 'text/plain')
+    self._not_found()
+
+
+class MockJira(ThreadingHTTPServer):
+  """Mock Jira bound to ``127.0.0.1``, in a thread of this process.
+
+  Usage:
+    with MockJira(MockConfig(issue_count=100)) as server:
+      client = JiraClient(base_url=server.url, email='a', api_token='b')
+  """
+
+  daemon_threads = True
+  request_queue_size = 512
+
+  def __init__(self, config: MockConfig | None = None, *, port: int = 0) -> None:
+    super().__init__(('127.0.0.1', port), _Handler)
+    self.config = config or MockConfig()
+    self.throttle = _Throttle(self.config)
+    self.attachment_content = (_text(0, 1024) + '\n').encode() * (self.config.attachment_bytes // 1025 + 1)
+    self.attachment_content = self.attachment_content[: self.config.attachment_bytes]
+    self._random = random.Random(self.config.seed)
+    self._counts: dict[str, int] = {}
+    self._lock = threading.Lock()
+    self._thread: threading.Thread | None = None
+    self.issue_body = functools.lru_cache(maxsize=None)(self._issue_body)
+
+  @property
+  def url(self) -> str:
+    host, port = self.server_address[:2]
+    return f'http://{host}:{port}'
+
+  def has_issue(self, n: int) -> bool:
+    return 1 <= n <= self.config.issue_count
+
+  def _issue_body(self, n: int) -> bytes:
+    return json.dumps(make_issue(n, self.config)).encode()
+
+  def search_page(self, start_at: int, max_results: int) -> bytes:
+    total = self.config.issue_count
+    end = min(total, start_at + min(max_results, self.config.max_page_size))
+    issues = b','.join(self.issue_body(n) for n in range(start_at + 1, end + 1))
+    head = json.dumps({'startAt': start_at, 'maxResults': max_results, 'total': total})
+    return head[:-1].encode() + b', "issues": [' + issues + b']}'
+
+  def comment_page(self, n: int, start_at: int, max_results: int) -> dict[str, Any]:
+    total = self.config.comments_per_issue
+    end = min(total, start_at + min(max_results, self.config.max_page_size))
+    return {
+      'startAt': start_at,
+      'maxResults': max_results,
+      'total': total,
+      'comments': [make_comment(n, index) for index in range(start_at, end)],
+    }
+
+  def delay(self) -> None:
+    config = self.config
+    with self._lock:
+      slow = config.slow_probability and self._random.random() < config.slow_probability
+      jitter = self._random.uniform(0, config.jitter_ms) if config.jitter_ms else 0.0
+    ms = config.slow_ms if slow else config.latency_ms + jitter
+    if ms:
+      time.sleep(ms / 1000)
+
+  def count(self, name: str) -> None:
+    with self._lock:
+      self._counts[name] = self._counts.get(name, 0) + 1
+
+  def stats(self) -> dict[str, int]:
+    with self._lock:
+      return {'requests': 0, 'throttled': 0, **self._counts}
+
+  def reset(self) -> None:
+    with self._lock:
+      self._counts.clear()
+    self.throttle = _Throttle(self.config)
+
+  def start(self) -> MockJira:
+    self._thread = threading.Thread(target=self.serve_forever, name='mock-jira', daemon=True)
+    self._thread.start()
+    return self
+
+  def stop(self) -> None:
+    self.shutdown()
+    self.server_close()
+    if self._thread is not None:
+      self._thread.join()
+
+  def __enter__(self) -> MockJira:
+    return self.start()
+
+  def __exit__(self, *args: object) -> None:
+    self.stop()
+
+
+def _config_args(config: MockConfig) -> list[str]:
+  args = []
+  for item in dataclasses.fields(config):
+    args += [f'--{item.name.replace("_", "-")}', str(getattr(config, item.name))]
+  return args
+
+
+@contextlib.contextmanager
+def spawn(config: MockConfig | None = None) -> Iterator[str]:
+  """Run the mock server in a child process and yield its base URL."""
+  from benchmarks._common import python_env
+
+  process = subprocess.Popen(
+    [sys.executable, '-m', 'benchmarks.mock_jira', *_config_args(config or MockConfig())],
+    stdout=subprocess.PIPE, text=True, env=python_env(),
+  )
+  try:
+    assert process.stdout is not None
+    url = process.stdout.readline().strip()
+    if not url:
+      raise RuntimeError('Mock Jira server failed to start')
+    yield url
+  finally:
+    process.terminate()
+    process.wait()
+
+
+def main(argv: list[str] | None = None) -> None:
+  parser = argparse.ArgumentParser(prog='python -m benchmarks.mock_jira', description='Serve a mock Jira Cloud API.')
+  parser.add_argument('--port', type=int, default=0)
+  parser.add_argument('--issues', dest='issue_count', type=int)
+  for item in dataclasses.fields(MockConfig):
+    parser.add_argument(f'--{item.name.replace("_", "-")}', dest=item.name, type=type(item.default))
+  args = vars(parser.parse_args(argv))
+  port = args.pop('port')
+  config = MockConfig(**{name: value for name, value in args.items() if value is not None})
+  server = MockJira(config, port=port)
+  print(server.url, flush=True)
+  with contextlib.suppress(KeyboardInterrupt):
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+  main()
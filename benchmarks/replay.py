@@ -0,0 +1,121 @@
+"""Client-side benchmarks replaying recorded mock Jira traffic.
+
+Each ``benchmarks.throughput`` scenario is recorded once against the mock
+server into a ``Cassette`` and then replayed without a network: no
+sockets, no server and no injected latency. What is left is the client's
+own cost (pagination, JSON decoding and model validation), which makes
+these numbers the ones to watch when working on parsing or paginators.
+
+Cassettes are recorded into a temporary directory unless ``--cassettes``
+names one to keep them in; existing cassettes there are reused until
+``--record`` is passed.
+
+Usage:
+  python -m benchmarks.replay
+  python -m benchmarks.replay search_export bulk_get --cassettes .cassettes --profile
+  python -m benchmarks.replay --compare replay.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from benchmarks._common import compare, summarize, write_results
+from benchmarks.mock_jira import MockConfig, spawn
+from benchmarks.throughput import SCENARIOS, Context
+from pyjira.replay import Cassette
+
+# attachment_download is left out by default: its cassette holds every
+# attachment body.
+DEFAULT_SCENARIOS = ['search_export', 'search_export_async', 'bulk_get', 'bulk_get_threads', 'comment_fanout']
+
+
+def _run(name: str, ctx: Context) -> Any:
+  result = SCENARIOS[name][0](ctx)
+  return asyncio.run(result) if asyncio.iscoroutine(result) else result
+
+
+def record(name: str, path: Path, config: MockConfig, **options: Any) -> None:
+  with spawn(config) as url:
+    _run(name, Context(url, config, cassette=Cassette(path, mode='record'), **options))
+
+
+def replay(name: str, path: Path, config: MockConfig, runs: int, *, profile: bool = False, **options: Any) -> dict[str, Any]:
+  ctx = Context('http://replay.invalid', config, cassette=Cassette(path), **options)
+  if profile:
+    with ctx.instrumentation.profile() as result:
+      _run(name, ctx)
+    print(f'{name}: {result.report()}\n')
+  durations = []
+  items = 0
+  for _ in range(runs):
+    started = time.perf_counter()
+    items = _run(name, ctx)
+    durations.append((time.perf_counter() - started) * 1000)
+  summary: dict[str, Any] = summarize(durations)
+  summary.update({
+    'items': items,
+    'unit': SCENARIOS[name][1],
+    'items_per_s': round(items / (summary['median_ms'] / 1000), 1),
+    'responses': len(ctx.cassette) if ctx.cassette is not None else 0,
+    'cassette_bytes': path.stat().st_size,
+  })
+  return summary
+
+
+def print_results(results: dict[str, dict[str, Any]]) -> None:
+  width = max(len(name) for name in results)
+  for name, stats in results.items():
+    print(
+      f'{name:<{width}}  {stats["median_ms"]:>10.1f} ms  {stats["items_per_s"]:>14,.1f} {stats["unit"]}/s'
+      f'  {stats["responses"]:>6} responses  {stats["cassette_bytes"] / 1024:>9,.0f} KiB'
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+  parser = argparse.ArgumentParser(prog='python -m benchmarks.replay', description=__doc__.splitlines()[0])
+  parser.add_argument('scenarios', nargs='*', metavar='SCENARIO', help=f'One of {", ".join(SCENARIOS)}.')
+  parser.add_argument('--runs', type=int, default=5, help='Replays per scenario (default: 5).')
+  parser.add_argument('--issues', type=int, default=500, help='Issues served while recording (default: 500).')
+  parser.add_argument('--concurrency', type=int, default=20)
+  parser.add_argument('--page-size', type=int, default=100)
+  parser.add_argument('--cassettes', metavar='DIR', help='Keep cassettes in this directory.')
+  parser.add_argument('--record', action='store_true', help='Re-record cassettes that already exist.')
+  parser.add_argument('--profile', action='store_true', help='Print decode/validation time per scenario.')
+  parser.add_argument('-o', '--output', help='Write results as JSON to this file.')
+  parser.add_argument('--compare', metavar='BASELINE', help='Compare with an earlier results file.')
+  parser.add_argument('--threshold', type=float, default=0.2, help='Regression threshold as a fraction (default: 0.2).')
+  args = parser.parse_args(argv)
+  if unknown := set(args.scenarios) - set(SCENARIOS):
+    parser.error(f'unknown scenario: {", ".join(sorted(unknown))}')
+
+  config = MockConfig(issue_count=args.issues)
+  options = {'concurrency': args.concurrency, 'page_size': args.page_size}
+  results = {}
+  with tempfile.TemporaryDirectory() as scratch:
+    directory = Path(args.cassettes or scratch)
+    directory.mkdir(parents=True, exist_ok=True)
+    for name in args.scenarios or DEFAULT_SCENARIOS:
+      path = directory / f'{name}.cassette'
+      if args.record or not path.exists():
+        record(name, path, config, **options)
+      results[name] = replay(name, path, config, args.runs, profile=args.profile, **options)
+  print_results(results)
+  if args.output:
+    write_results(args.output, 'replay', results, mock=dataclasses.asdict(config))
+  if args.compare:
+    print()
+    if compare(results, args.compare, threshold=args.threshold):
+      return 1
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,104 @@
+"""Import-time and cold-start benchmarks.
+
+Every sample runs in a fresh interpreter so module caches never carry over:
+
+* ``import:<module>`` -- cumulative ``-X importtime`` cost of importing the
+  module, for ``pyjira`` and each model and resource module.
+* ``client:construct`` -- ``from pyjira import JiraClient`` plus building a
+  client.
+* ``client:first_call`` / ``client:second_call`` -- ``client.issues.get``
+  against the in-process mock server, cold and then warm.
+
+Usage:
+  python -m benchmarks.startup --runs 7 --output startup.json
+  python -m benchmarks.startup --compare startup.json --threshold 0.25
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import subprocess
+import sys
+
+from benchmarks._common import ROOT, compare, print_table, python_env, run_python, summarize, write_results
+from benchmarks.mock_jira import MockJira
+
+_IMPORTTIME = re.compile(r'^import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$')
+
+_CLIENT_CODE = '''
+import json, sys, time
+started = time.perf_counter()
+from pyjira import JiraClient
+client = JiraClient(base_url=sys.argv[1], email="bench@example.com", api_token="token")
+constructed = time.perf_counter()
+timings = {"client:construct": (constructed - started) * 1000}
+if sys.argv[2] == "1":
+  client.issues.get("PROJ-1")
+  first = time.perf_counter()
+  client.issues.get("PROJ-2")
+  second = time.perf_counter()
+  timings["client:first_call"] = (first - constructed) * 1000
+  timings["client:second_call"] = (second - first) * 1000
+client.close()
+print(json.dumps(timings))
+'''
+
+
+def default_modules() -> list[str]:
+  modules = ['pyjira', 'pyjira.client', 'pyjira.exceptions', 'pyjira.pagination']
+  for package in ('models', 'resources'):
+    for path in sorted((ROOT / 'src' / 'pyjira' / package).glob('*.py')):
+      modules.append(f'pyjira.{package}' if path.stem == '__init__' else f'pyjira.{package}.{path.stem}')
+  return modules
+
+
+def import_time_ms(module: str) -> float:
+  """Cumulative import time of ``module`` in a fresh interpreter."""
+  out = subprocess.run(
+    [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+    capture_output=True, text=True, check=True, env=python_env(),
+  )
+  for line in out.stderr.splitlines():
+    match = _IMPORTTIME.match(line)
+    if match and match.group(2) == module:
+      return int(match.group(1)) / 1000
+  raise RuntimeError(f'No importtime entry for {module}')
+
+
+def run(modules: list[str], runs: int, *, first_call: bool = True) -> dict[str, dict[str, float]]:
+  samples: dict[str, list[float]] = {}
+  for module in modules:
+    samples[f'import:{module}'] = [import_time_ms(module) for _ in range(runs)]
+  with MockJira() as server:
+    for _ in range(runs):
+      timings = json.loads(run_python(_CLIENT_CODE, server.url, '1' if first_call else '0'))
+      for name, value in timings.items():
+        samples.setdefault(name, []).append(value)
+  return {name: summarize(values) for name, values in samples.items()}
+
+
+def main(argv: list[str] | None = None) -> int:
+  parser = argparse.ArgumentParser(prog='python -m benchmarks.startup', description=__doc__.splitlines()[0])
+  parser.add_argument('--runs', type=int, default=5, help='Fresh interpreters per benchmark (default: 5).')
+  parser.add_argument('--module', action='append', dest='modules', help='Module to time (repeatable; default: all).')
+  parser.add_argument('--no-first-call', action='store_true', help='Skip the mock-server call benchmarks.')
+  parser.add_argument('-o', '--output', help='Write results as JSON to this file.')
+  parser.add_argument('--compare', metavar='BASELINE', help='Compare with an earlier results file.')
+  parser.add_argument('--threshold', type=float, default=0.2, help='Regression threshold as a fraction (default: 0.2).')
+  args = parser.parse_args(argv)
+
+  results = run(args.modules or default_modules(), args.runs, first_call=not args.no_first_call)
+  print_table(results)
+  if args.output:
+    write_results(args.output, 'startup', results)
+  if args.compare:
+    print()
+    if compare(results, args.compare, threshold=args.threshold):
+      return 1
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
@@ -0,0 +1,280 @@
+"""Throughput benchmarks against the mock Jira server.
+
+Scenarios:
+
+* ``search_export`` / ``search_export_async`` -- page through every issue
+  with ``Paginator``/``AsyncPaginator`` over ``search.jql`` (prefetching).
+* ``bulk_get`` / ``bulk_get_threads`` -- ``issues.get`` for every issue via
+  ``AsyncJiraClient.map`` / ``JiraClient.map``.
+* ``comment_fanout`` -- every comment of every issue, one paginator per
+  issue, fanned out with ``AsyncJiraClient.map``.
+* ``attachment_download`` -- download every issue's attachment content.
+
+The server runs in a child process (see ``benchmarks.mock_jira.spawn``) so
+it does not compete with the client for the GIL. The client has no retry
+policy of its own; scenarios retry 429s after ``Retry-After``, and the
+number of throttled requests is reported with each result.
+
+Usage:
+  python -m benchmarks.throughput --issues 2000 --latency-ms 20 -o throughput.json
+  python -m benchmarks.throughput search_export --rate-limit-every 50
+  python -m benchmarks.throughput bulk_get --profile
+  python -m benchmarks.throughput --compare throughput.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import dataclasses
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+import httpx
+
+from benchmarks._common import compare, summarize, write_results
+from benchmarks.mock_jira import MockConfig, spawn
+from pyjira import AsyncJiraClient, JiraClient
+from pyjira.exceptions import RateLimitError
+from pyjira.instrumentation import Instrumentation
+from pyjira.pagination import AsyncPaginator, Paginator
+from pyjira.ratelimit import AdaptiveConcurrency
+from pyjira.replay import Cassette
+
+R = TypeVar('R')
+
+MAX_RETRIES = 10
+
+
+@dataclass
+class Context:
+  url: str
+  config: MockConfig
+  concurrency: int = 20
+  page_size: int = 100
+  prefetch: int = 2
+  adaptive: bool = False
+  hedge: bool = False
+  cassette: Cassette | None = None
+  instrumentation: Instrumentation = dataclasses.field(default_factory=lambda: Instrumentation(metrics=False))
+
+  def keys(self) -> list[str]:
+    return [f'PROJ-{n}' for n in range(1, self.config.issue_count + 1)]
+
+  def client(self) -> JiraClient:
+    return JiraClient(
+      base_url=self.url,
+      email='bench@example.com',
+      api_token='token',
+      instrumentation=self.instrumentation,
+      hedging=self.hedge,
+      cassette=self.cassette,
+    )
+
+  def async_client(self) -> AsyncJiraClient:
+    return AsyncJiraClient(
+      base_url=self.url,
+      email='bench@example.com',
+      api_token='token',
+      instrumentation=self.instrumentation,
+      adaptive_concurrency=AdaptiveConcurrency(max_limit=self.concurrency) if self.adaptive else None,
+      hedging=self.hedge,
+      cassette=self.cassette,
+    )
+
+
+def retrying(func: Callable[..., R]) -> Callable[..., R]:
+  """Wrap ``func`` to retry 429 responses after their ``Retry-After``."""
+
+  def call(*args: Any, **kwargs: Any) -> R:
+    for _ in range(MAX_RETRIES):
+      try:
+        return func(*args, **kwargs)
+      except RateLimitError as exc:
+        time.sleep(exc.retry_after or 1)
+    return func(*args, **kwargs)
+
+  return call
+
+
+def aretrying(func: Callable[..., Awaitable[R]]) -> Callable[..., Awaitable[R]]:
+  """Async counterpart of ``retrying``."""
+
+  async def call(*args: Any, **kwargs: Any) -> R:
+    for _ in range(MAX_RETRIES):
+      try:
+        return await func(*args, **kwargs)
+      except RateLimitError as exc:
+        await asyncio.sleep(exc.retry_after or 1)
+    return await func(*args, **kwargs)
+
+  return call
+
+
+def search_export(ctx: Context) -> int:
+  with ctx.client() as client:
+    jql = retrying(client.search.jql)
+
+    def fetch_page(start_at: int, max_results: int) -> tuple[list[Any], int]:
+      page = jql('project = PROJ', start_at=start_at, max_results=max_results)
+      return page.issues, page.total
+
+    return sum(1 for _ in Paginator(fetch_page, page_size=ctx.page_size, prefetch=ctx.prefetch))
+
+
+async def search_export_async(ctx: Context) -> int:
+  async with ctx.async_client() as client:
+    jql = aretrying(client.search.jql)
+
+    async def fetch_page(start_at: int, max_results: int) -> tuple[list[Any], int]:
+      page = await jql('project = PROJ', start_at=start_at, max_results=max_results)
+      return page.issues, page.total
+
+    count = 0
+    async for _ in AsyncPaginator(fetch_page, page_size=ctx.page_size, prefetch=ctx.prefetch):
+      count += 1
+    return count
+
+
+async def bulk_get(ctx: Context) -> int:
+  async with ctx.async_client() as client:
+    get = aretrying(client.issues.get)
+    count = 0
+    async for _ in client.map(get, ctx.keys(), concurrency=ctx.concurrency):
+      count += 1
+    return count
+
+
+def bulk_get_threads(ctx: Context) -> int:
+  with ctx.client() as client:
+    get = retrying(client.issues.get)
+    return sum(1 for _ in client.map(get, ctx.keys(), workers=ctx.concurrency))
+
+
+async def comment_fanout(ctx: Context) -> int:
+  async with ctx.async_client() as client:
+    list_page = aretrying(client.comments.list)
+
+    async def comments(key: str) -> int:
+      async def fetch_page(start_at: int, max_results: int) -> tuple[list[Any], int]:
+        page = await list_page(key, start_at=start_at, max_results=max_results)
+        return page.comments, page.total
+
+      return len([comment async for comment in AsyncPaginator(fetch_page, page_size=ctx.page_size)])
+
+    total = 0
+    async for count in client.map(comments, ctx.keys(), concurrency=ctx.concurrency):
+      total += count
+    return total
+
+
+async def attachment_download(ctx: Context) -> int:
+  async with ctx.async_client() as client:
+    get_content = aretrying(client.attachments.get_content)
+    ids = [str(20_000 + n) for n in range(1, ctx.config.issue_count + 1)]
+    total = 0
+    async for content in client.map(get_content, ids, concurrency=ctx.concurrency):
+      total += len(content)
+    return total
+
+
+# name -> (scenario, unit counted by its return value)
+SCENARIOS: dict[str, tuple[Callable[[Context], Any], str]] = {
+  'search_export': (search_export, 'issues'),
+  'search_export_async': (search_export_async, 'issues'),
+  'bulk_get': (bulk_get, 'issues'),
+  'bulk_get_threads': (bulk_get_threads, 'issues'),
+  'comment_fanout': (comment_fanout, 'comments'),
+  'attachment_download': (attachment_download, 'bytes'),
+}
+
+
+def run_scenario(name: str, ctx: Context, runs: int, *, profile: bool = False) -> dict[str, Any]:
+  scenario, unit = SCENARIOS[name]
+  if profile:
+    # One extra, untimed run to show where the time goes.
+    with ctx.instrumentation.profile() as result:
+      outcome = scenario(ctx)
+      if asyncio.iscoroutine(outcome):
+        asyncio.run(outcome)
+    print(f'{name}: {result.report()}\n')
+  durations = []
+  requests = throttled = items = 0
+  for _ in range(runs):
+    httpx.post(f'{ctx.url}/__reset')
+    started = time.perf_counter()
+    result = scenario(ctx)
+    items = asyncio.run(result) if asyncio.iscoroutine(result) else result
+    durations.append((time.perf_counter() - started) * 1000)
+    stats = httpx.get(f'{ctx.url}/__stats').json()
+    requests, throttled = stats['requests'], stats['throttled']
+  summary: dict[str, Any] = summarize(durations)
+  summary.update({
+    'items': items,
+    'unit': unit,
+    'items_per_s': round(items / (summary['median_ms'] / 1000), 1),
+    'requests': requests,
+    'throttled': throttled,
+  })
+  return summary
+
+
+def print_results(results: dict[str, dict[str, Any]]) -> None:
+  width = max(len(name) for name in results)
+  for name, stats in results.items():
+    print(
+      f'{name:<{width}}  {stats["median_ms"]:>10.1f} ms  {stats["items_per_s"]:>14,.1f} {stats["unit"]}/s'
+      f'  {stats["requests"]:>6} req  {stats["throttled"]:>5} 429'
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+  parser = argparse.ArgumentParser(prog='python -m benchmarks.throughput', description=__doc__.splitlines()[0])
+  parser.add_argument('scenarios', nargs='*', metavar='SCENARIO', help=f'One of {", ".join(SCENARIOS)} (default: all).')
+  parser.add_argument('--runs', type=int, default=3, help='Runs per scenario (default: 3).')
+  parser.add_argument('--concurrency', type=int, default=20, help='In-flight calls for fan-out scenarios.')
+  parser.add_argument('--page-size', type=int, default=100)
+  parser.add_argument('--prefetch', type=int, default=2)
+  parser.add_argument('--adaptive', action='store_true', help='Let async scenarios adapt concurrency to rate limits.')
+  parser.add_argument('--hedge', action='store_true', help='Hedge slow GETs with the default HedgePolicy.')
+  parser.add_argument('--profile', action='store_true', help='Print network/decode/validation time per scenario.')
+  mock = parser.add_argument_group('mock server')
+  for item in dataclasses.fields(MockConfig):
+    mock.add_argument(f'--{item.name.replace("_", "-")}', dest=item.name, type=type(item.default), default=item.default)
+  mock.add_argument('--issues', dest='issue_count', type=int)
+  parser.add_argument('-o', '--output', help='Write results as JSON to this file.')
+  parser.add_argument('--compare', metavar='BASELINE', help='Compare with an earlier results file.')
+  parser.add_argument('--threshold', type=float, default=0.2, help='Regression threshold as a fraction (default: 0.2).')
+  args = parser.parse_args(argv)
+  if unknown := set(args.scenarios) - set(SCENARIOS):
+    parser.error(f'unknown scenario: {", ".join(sorted(unknown))}')
+
+  config = MockConfig(**{item.name: getattr(args, item.name) for item in dataclasses.fields(MockConfig)})
+  results = {}
+  with spawn(config) as url:
+    ctx = Context(
+      url,
+      config,
+      concurrency=args.concurrency,
+      page_size=args.page_size,
+      prefetch=args.prefetch,
+      adaptive=args.adaptive,
+      hedge=args.hedge,
+    )
+    for name in args.scenarios or SCENARIOS:
+      results[name] = run_scenario(name, ctx, args.runs, profile=args.profile)
+  print_results(results)
+  if args.output:
+    write_results(args.output, 'throughput', results, mock=dataclasses.asdict(config))
+  if args.compare:
+    print()
+    if compare(results, args.compare, threshold=args.threshold):
+      return 1
+  return 0
+
+
+if __name__ == '__main__':
+  sys.exit(main())
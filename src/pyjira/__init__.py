@@ -1,65 +1,150 @@
 """pyJira - A modern, fully-typed Python client for the Jira Cloud REST API v3."""
 
-from pyjira.client import AsyncJiraClient, JiraClient
-from pyjira.config import JiraConfig
-from pyjira.exceptions import (
-    AuthenticationError,
-    ForbiddenError,
-    JiraError,
-    NotFoundError,
-    RateLimitError,
-    ServerError,
-    ValidationError,
-)
-from pyjira.models import (
-    Attachment,
-    Comment,
-    Component,
-    Dashboard,
-    FieldDetail,
-    Filter,
-    Group,
-    Issue,
-    IssueFields,
-    IssueLink,
-    IssueLinkType,
-    IssueType,
-    IssueTypeDetail,
-    NotificationScheme,
-    PermissionScheme,
-    Priority,
-    PriorityDetail,
-    Project,
-    ProjectRole,
-    RemoteIssueLink,
-    Resolution,
-    ResolutionDetail,
-    Screen,
-    SearchResults,
-    Status,
-    StatusDetail,
-    Transition,
-    User,
-    Version,
-    Votes,
-    Watchers,
-    Workflow,
-    WorkflowScheme,
-    Worklog,
-    WorklogPage,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pyjira._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pyjira.bulk import BulkResult
+    from pyjira.cache import MetadataCache
+    from pyjira.circuit import CircuitBreaker
+    from pyjira.client import AsyncJiraClient, JiraClient
+    from pyjira.config import JiraConfig
+    from pyjira.exceptions import (
+        AuthenticationError,
+        CircuitOpenError,
+        ForbiddenError,
+        JiraError,
+        NotFoundError,
+        RateLimitError,
+        ServerError,
+        ValidationError,
+    )
+    from pyjira.hedging import HedgePolicy
+    from pyjira.instrumentation import CallEvent, Instrumentation
+    from pyjira.models import (
+        Attachment,
+        Comment,
+        Component,
+        Dashboard,
+        FieldDetail,
+        FieldMetadata,
+        Filter,
+        Group,
+        Issue,
+        IssueFields,
+        IssueLink,
+        IssueLinkType,
+        IssueType,
+        IssueTypeDetail,
+        NotificationScheme,
+        PermissionScheme,
+        Priority,
+        PriorityDetail,
+        Project,
+        ProjectRole,
+        RemoteIssueLink,
+        Resolution,
+        ResolutionDetail,
+        Screen,
+        SearchResults,
+        Status,
+        StatusDetail,
+        Transition,
+        User,
+        Version,
+        Votes,
+        Watchers,
+        Workflow,
+        WorkflowScheme,
+        Worklog,
+        WorklogPage,
+    )
+    from pyjira.ratelimit import AdaptiveConcurrency, RateLimitInfo
+    from pyjira.replay import Cassette
+
+# Public name -> defining module, imported on first attribute access.
+_EXPORTS: dict[str, str] = {
+    "AdaptiveConcurrency": "pyjira.ratelimit",
+    "AsyncJiraClient": "pyjira.client",
+    "Attachment": "pyjira.models.issue",
+    "AuthenticationError": "pyjira.exceptions",
+    "BulkResult": "pyjira.bulk",
+    "CallEvent": "pyjira.instrumentation",
+    "Cassette": "pyjira.replay",
+    "CircuitBreaker": "pyjira.circuit",
+    "CircuitOpenError": "pyjira.exceptions",
+    "Comment": "pyjira.models.comment",
+    "Component": "pyjira.models.component",
+    "Dashboard": "pyjira.models.dashboard",
+    "FieldDetail": "pyjira.models.field",
+    "FieldMetadata": "pyjira.models.issue_metadata",
+    "Filter": "pyjira.models.filter",
+    "ForbiddenError": "pyjira.exceptions",
+    "HedgePolicy": "pyjira.hedging",
+    "Instrumentation": "pyjira.instrumentation",
+    "Group": "pyjira.models.group",
+    "Issue": "pyjira.models.issue",
+    "IssueFields": "pyjira.models.issue",
+    "IssueLink": "pyjira.models.issue_link",
+    "IssueLinkType": "pyjira.models.issue_link",
+    "IssueType": "pyjira.models.issue",
+    "IssueTypeDetail": "pyjira.models.issuetype_full",
+    "JiraClient": "pyjira.client",
+    "JiraConfig": "pyjira.config",
+    "JiraError": "pyjira.exceptions",
+    "MetadataCache": "pyjira.cache",
+    "NotFoundError": "pyjira.exceptions",
+    "NotificationScheme": "pyjira.models.notification_scheme",
+    "PermissionScheme": "pyjira.models.permission",
+    "Priority": "pyjira.models.issue",
+    "PriorityDetail": "pyjira.models.priority_full",
+    "Project": "pyjira.models.project",
+    "ProjectRole": "pyjira.models.role",
+    "RateLimitError": "pyjira.exceptions",
+    "RateLimitInfo": "pyjira.ratelimit",
+    "RemoteIssueLink": "pyjira.models.issue",
+    "Resolution": "pyjira.models.issue",
+    "ResolutionDetail": "pyjira.models.resolution_full",
+    "Screen": "pyjira.models.screen",
+    "SearchResults": "pyjira.models.search",
+    "ServerError": "pyjira.exceptions",
+    "Status": "pyjira.models.issue",
+    "StatusDetail": "pyjira.models.status_full",
+    "Transition": "pyjira.models.issue",
+    "User": "pyjira.models.user",
+    "ValidationError": "pyjira.exceptions",
+    "Version": "pyjira.models.version",
+    "Votes": "pyjira.models.issue",
+    "Watchers": "pyjira.models.issue",
+    "Workflow": "pyjira.models.workflow",
+    "WorkflowScheme": "pyjira.models.workflow",
+    "Worklog": "pyjira.models.issue",
+    "WorklogPage": "pyjira.models.issue",
+}
 
 __all__ = [
+    "AdaptiveConcurrency",
     "AsyncJiraClient",
     "Attachment",
     "AuthenticationError",
+    "BulkResult",
+    "CallEvent",
+    "Cassette",
+    "CircuitBreaker",
+    "CircuitOpenError",
     "Comment",
     "Component",
     "Dashboard",
     "FieldDetail",
+    "FieldMetadata",
     "Filter",
     "ForbiddenError",
     "Group",
+    "HedgePolicy",
+    "Instrumentation",
     "Issue",
     "IssueFields",
     "IssueLink",
@@ -69,6 +154,7 @@ __all__ = [
     "JiraClient",
     "JiraConfig",
     "JiraError",
+    "MetadataCache",
     "NotFoundError",
     "NotificationScheme",
     "PermissionScheme",
@@ -77,6 +163,7 @@ __all__ = [
     "Project",
     "ProjectRole",
     "RateLimitError",
+    "RateLimitInfo",
     "RemoteIssueLink",
     "Resolution",
     "ResolutionDetail",
@@ -96,3 +183,5 @@ __all__ = [
     "Worklog",
     "WorklogPage",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
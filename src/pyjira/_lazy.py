@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import importlib
+from collections.abc import Callable
+from typing import Any
+
+
+def lazy_exports(
+  package: str,
+  namespace: dict[str, Any],
+  exports: dict[str, str],
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+  """Build a module ``__getattr__``/``__dir__`` pair for deferred re-exports.
+
+  ``exports`` maps each public name to the submodule defining it. The
+  submodule is imported on first access and the value cached in
+  ``namespace`` so later lookups are plain globals.
+  """
+
+  def __getattr__(name: str) -> Any:
+    module = exports.get(name)
+    if module is None:
+      raise AttributeError(f'module {package!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(module), name)
+    namespace[name] = value
+    return value
+
+  def __dir__() -> list[str]:
+    return sorted(set(namespace) | set(exports))
+
+  return __getattr__, __dir__
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import Any
+
+from pyjira.exceptions import JiraError
+
+ProgressCallback = Callable[[int, int], None]
+"""Called as ``on_progress(done, total)`` after each unit of work finishes."""
+
+# Upper bound on issues per request accepted by the bulk operation endpoints.
+BULK_CHUNK_SIZE = 1000
+
+
+@dataclass
+class BulkResult:
+  """Outcome of a bulk operation for a single issue."""
+
+  issue: str
+  ok: bool = True
+  error_messages: list[str] = field(default_factory=list)
+  exception: Exception | None = None
+
+  @classmethod
+  def from_exception(cls, issue: str, exc: Exception) -> BulkResult:
+    messages = [str(exc)]
+    if isinstance(exc, JiraError):
+      details = exc.error_messages + [f'{k}: {v}' for k, v in exc.errors.items()]
+      messages = details or messages
+    return cls(issue, ok=False, error_messages=messages, exception=exc)
+
+
+def run_per_issue(
+  func: Callable[[str], object],
+  issues: Iterable[str],
+  *,
+  max_workers: int = 8,
+  on_progress: ProgressCallback | None = None,
+) -> dict[str, BulkResult]:
+  """Apply ``func`` to every issue on a thread pool, collecting per-issue results.
+
+  Exceptions never propagate; they are recorded on the issue's ``BulkResult``.
+  """
+  keys = list(dict.fromkeys(issues))
+  results: dict[str, BulkResult] = {}
+  if not keys:
+    return results
+  with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(keys)))) as pool:
+    futures = {pool.submit(func, key): key for key in keys}
+    for done, future in enumerate(as_completed(futures), start=1):
+      key = futures[future]
+      exc = future.exception()
+      results[key] = BulkResult(key) if exc is None else BulkResult.from_exception(key, exc)  # type: ignore[arg-type]
+      if on_progress:
+        on_progress(done, len(keys))
+  return {key: results[key] for key in keys}
+
+
+async def arun_per_issue(
+  func: Callable[[str], Awaitable[object]],
+  issues: Iterable[str],
+  *,
+  max_workers: int = 8,
+  on_progress: ProgressCallback | None = None,
+) -> dict[str, BulkResult]:
+  """Async counterpart of ``run_per_issue`` bounded by a semaphore."""
+  keys = list(dict.fromkeys(issues))
+  results: dict[str, BulkResult] = {}
+  semaphore = asyncio.Semaphore(max(1, max_workers))
+
+  async def run(key: str) -> None:
+    async with semaphore:
+      try:
+        await func(key)
+      except Exception as exc:
+        results[key] = BulkResult.from_exception(key, exc)
+      else:
+        results[key] = BulkResult(key)
+    if on_progress:
+      on_progress(len(results), len(keys))
+
+  await asyncio.gather(*(run(key) for key in keys))
+  return {key: results[key] for key in keys}
+
+
+def chunked(items: list[str], size: int = BULK_CHUNK_SIZE) -> list[list[str]]:
+  return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def unresolved_keys(chunk: list[str]) -> list[str]:
+  """Identifiers in ``chunk`` that are issue keys rather than numeric IDs."""
+  return [key for key in chunk if not key.isdigit()]
+
+
+def key_lookup_jql(keys: list[str]) -> str:
+  return f'key in ({", ".join(keys)})'
+
+
+def match_issue_ids(chunk: list[str], issues: Iterable[dict[str, Any]]) -> dict[str, str]:
+  """Map issue IDs to the identifiers submitted in ``chunk``.
+
+  ``issues`` are search results (``id`` and ``key``) for the keys in the
+  chunk. Numeric identifiers are taken as IDs; a key matches the issue
+  that has it. When exactly one key and one issue are left over (the key
+  belongs to a moved issue) they are paired.
+  """
+  submitted = set(chunk)
+  ids = {key: key for key in chunk if key.isdigit()}
+  leftover = []
+  for issue in issues:
+    issue_id, key = str(issue.get('id')), issue.get('key')
+    if key in submitted:
+      ids[issue_id] = key
+    elif issue_id not in ids:
+      leftover.append(issue_id)
+  missing = [key for key in unresolved_keys(chunk) if key not in ids.values()]
+  if len(missing) == 1 and len(leftover) == 1:
+    ids[leftover[0]] = missing[0]
+  return ids
+
+
+def merge_task_results(
+  chunk: list[str],
+  status: str | None,
+  processed: list[int] | None,
+  failed: dict[str, list[str]] | None,
+  ids: dict[str, str] | None = None,
+) -> dict[str, BulkResult]:
+  """Map a finished bulk task onto per-issue results for the submitted chunk.
+
+  Jira reports processed and failed issues by ID; ``ids`` maps those IDs to
+  the submitted identifiers (numeric identifiers map to themselves). A
+  failure for an ID that cannot be matched fails every identifier whose ID
+  is unknown, and an identifier Jira reported neither as processed nor as
+  failed is failed too, so an issue is never reported as ok by omission.
+  """
+  ids = {**{key: key for key in chunk if key.isdigit()}, **(ids or {})}
+  known = set(ids.values())
+  results = {key: BulkResult(key) for key in chunk}
+  unmatched = []
+  for issue_id, messages in (failed or {}).items():
+    key = ids.get(str(issue_id))
+    if key in results:
+      results[key] = BulkResult(key, ok=False, error_messages=list(messages))
+    else:
+      unmatched.append(str(issue_id))
+  if unmatched:
+    message = f'Bulk task reported failures for issues {", ".join(unmatched)} that could not be matched to a submitted key'
+    for key, result in results.items():
+      if result.ok and key not in known:
+        result.ok = False
+        result.error_messages = [message]
+  # Issues Jira neither processed nor failed were invalid or inaccessible,
+  # whatever status the task finished with.
+  reported = {ids.get(str(i)) for i in [*(processed or []), *(failed or {})]}
+  if status == 'COMPLETE':
+    message = 'Issue was not processed by the bulk task (invalid or inaccessible)'
+  else:
+    message = f'Bulk task ended with status {status}'
+  for key, result in results.items():
+    if result.ok and key not in reported:
+      result.ok = False
+      result.error_messages = [message]
+  return results
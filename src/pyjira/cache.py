@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Hashable
+from typing import Any
+
+
+class MetadataCache:
+  """Thread-safe TTL cache for issue metadata keyed by (kind, project, issue type).
+
+  Create and edit metadata rarely changes and is nearly identical for every
+  issue of the same project and issue type, so it is cached per pair rather
+  than per issue. A ``ttl`` of ``None`` keeps entries until invalidated.
+  """
+
+  def __init__(self, ttl: float | None = 300.0) -> None:
+    self.ttl = ttl
+    self._entries: dict[tuple[str, str, str], tuple[float, Any]] = {}
+    self._lock = threading.Lock()
+
+  def get(self, kind: str, project: str, issue_type: str) -> Any | None:
+    key = (kind, project, issue_type)
+    with self._lock:
+      entry = self._entries.get(key)
+      if entry is None:
+        return None
+      stored_at, value = entry
+      if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+        del self._entries[key]
+        return None
+      return value
+
+  def set(self, kind: str, project: str, issue_type: str, value: Any) -> None:
+    with self._lock:
+      self._entries[(kind, project, issue_type)] = (time.monotonic(), value)
+
+  def invalidate(
+    self,
+    *,
+    kind: str | None = None,
+    project: str | None = None,
+    issue_type: str | None = None,
+  ) -> int:
+    """Drop matching entries; unset filters match everything. Returns the count removed."""
+    wanted: tuple[Hashable | None, ...] = (kind, project, issue_type)
+    with self._lock:
+      stale = [
+        key for key in self._entries
+        if all(w is None or w == k for w, k in zip(wanted, key))
+      ]
+      for key in stale:
+        del self._entries[key]
+      return len(stale)
+
+  def clear(self) -> None:
+    with self._lock:
+      self._entries.clear()
+
+  def __len__(self) -> int:
+    return len(self._entries)
@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Callable, Collection
+from functools import partial
+
+import httpx
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+_FAILURE_STATUSES = frozenset({500, 502, 503, 504})
+
+
+def endpoint_group(path: str) -> str:
+  """Circuit a request path belongs to: its resource, e.g. ``issue`` or ``search``.
+
+  Paths outside the platform API keep their API name: ``agile/board``.
+  """
+  parts = path.strip('/').split('/')
+  if len(parts) < 4 or parts[0] != 'rest':
+    return parts[0] if parts[0] else '/'
+  api, resource = parts[1], parts[3]
+  return resource if api == 'api' else f'{api}/{resource}'
+
+
+def _open_error(message: str, group: str, retry_after: float | None = None) -> Exception:
+  # pyjira.exceptions loads the models package; keep it off client construction.
+  from pyjira.exceptions import CircuitOpenError
+
+  return CircuitOpenError(message, group=group, retry_after=retry_after)
+
+
+class _Circuit:
+  __slots__ = ('group', 'state', 'failures', 'opened_at', 'probes')
+
+  def __init__(self, group: str) -> None:
+    self.group = group
+    self.state = CLOSED
+    self.failures = 0
+    self.opened_at = 0.0
+    self.probes = 0
+
+
+class CircuitBreaker:
+  """Fails calls fast while an endpoint group keeps failing.
+
+  Requests are grouped by ``group(path)`` (default: ``endpoint_group``).
+  After ``failure_threshold`` consecutive failures (a status in
+  ``failure_statuses`` or a transport error such as a timeout) the group's
+  circuit opens and its requests raise ``CircuitOpenError`` without being
+  sent. After ``recovery_time`` seconds up to ``half_open_probes``
+  requests are let through: a success closes the circuit, a failure opens
+  it for another ``recovery_time``.
+
+  Usage:
+    client = JiraClient(..., circuit_breaker=CircuitBreaker(failure_threshold=3))
+  """
+
+  def __init__(
+    self,
+    failure_threshold: int = 5,
+    recovery_time: float = 30.0,
+    *,
+    half_open_probes: int = 1,
+    failure_statuses: Collection[int] = _FAILURE_STATUSES,
+    group: Callable[[str], str] = endpoint_group,
+  ) -> None:
+    if failure_threshold < 1 or half_open_probes < 1:
+      raise ValueError('failure_threshold and half_open_probes must be at least 1')
+    self.failure_threshold = failure_threshold
+    self.recovery_time = recovery_time
+    self.half_open_probes = half_open_probes
+    self.failure_statuses = frozenset(failure_statuses)
+    self._group = group
+    self._circuits: dict[str, _Circuit] = {}
+    self._lock = threading.Lock()
+
+  def state(self, group: str) -> str:
+    """``'closed'``, ``'open'`` or ``'half_open'``."""
+    circuit = self._circuits.get(group)
+    return circuit.state if circuit is not None else CLOSED
+
+  def states(self) -> dict[str, str]:
+    return {group: circuit.state for group, circuit in self._circuits.items()}
+
+  def reset(self, group: str | None = None) -> None:
+    """Close one group's circuit, or all of them."""
+    with self._lock:
+      if group is None:
+        self._circuits.clear()
+      else:
+        self._circuits.pop(group, None)
+
+  def check(self, path: str) -> Callable[..., None]:
+    """Admit a request to ``path`` or raise ``CircuitOpenError``.
+
+    Returns ``record`` bound to the request's circuit, to be called with
+    its outcome.
+    """
+    group = self._group(path)
+    with self._lock:
+      circuit = self._circuits.get(group)
+      if circuit is None:
+        circuit = self._circuits[group] = _Circuit(group)
+      if circuit.state == CLOSED:
+        return partial(self.record, circuit, False)
+      if circuit.state == OPEN:
+        remaining = circuit.opened_at + self.recovery_time - time.monotonic()
+        if remaining > 0:
+          raise _open_error(
+            f'Circuit open for {group!r} after repeated failures; retry in {remaining:.1f}s', group, remaining,
+          )
+        circuit.state = HALF_OPEN
+      if circuit.probes >= self.half_open_probes:
+        raise _open_error(f'Circuit for {group!r} is half-open; waiting for a probe request', group)
+      circuit.probes += 1
+      return partial(self.record, circuit, True)
+
+  def record(self, circuit: _Circuit, probe: bool, status_code: int | None = None, error: BaseException | None = None) -> None:
+    """Report the outcome of a request admitted by ``check``.
+
+    ``probe`` marks half-open probes. ``status_code`` is the response status, or ``None`` with ``error`` set
+    if no response arrived. Errors other than transport errors (e.g.
+    cancellation) say nothing about the endpoint and only free the probe.
+    """
+    if status_code is not None:
+      failed = status_code in self.failure_statuses
+    elif isinstance(error, httpx.TransportError):
+      failed = True
+    else:
+      failed = None
+    with self._lock:
+      if probe:
+        circuit.probes -= 1
+      if failed is None:
+        return
+      if not failed:
+        if probe or circuit.state == CLOSED:
+          circuit.state = CLOSED
+          circuit.failures = 0
+        return
+      # Late results of requests admitted before the circuit opened do not
+      # restart the recovery timer.
+      if not probe and circuit.state != CLOSED:
+        return
+      circuit.failures += 1
+      if probe or circuit.failures >= self.failure_threshold:
+        circuit.state = OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.failures = 0
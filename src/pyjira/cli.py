@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import IO, Any
+
+import httpx
+
+from pyjira.client import JiraClient
+from pyjira.exceptions import JiraError
+from pyjira.resources.search import SearchResource
+
+PageCallback = Callable[[int, int, int], None]
+"""Called as ``on_page(next_start, written, total)`` after each page is flushed."""
+
+
+def _build_parser() -> argparse.ArgumentParser:
+  parser = argparse.ArgumentParser(prog='python -m pyjira', description='pyJira command line tools.')
+  commands = parser.add_subparsers(dest='command', required=True)
+
+  export = commands.add_parser('export', help='Stream JQL results as NDJSON.')
+  export.add_argument('jql', help='JQL query to export.')
+  export.add_argument('-o', '--output', help='Output file (default: stdout). A .gz suffix implies --gzip.')
+  export.add_argument('--gzip', action='store_true', help='Gzip-compress the output.')
+  export.add_argument('--fields', help='Comma-separated fields to fetch (default: all navigable fields).')
+  export.add_argument('--expand', help='Comma-separated expansions, e.g. changelog.')
+  export.add_argument('--page-size', type=int, default=100, help='Issues per request (default: 100).')
+  export.add_argument('--workers', type=int, default=4, help='Pages fetched in parallel (default: 4).')
+  export.add_argument('--checkpoint', help='Checkpoint file; resumes from it when it exists.')
+  export.add_argument('--progress', action=argparse.BooleanOptionalAction, default=None,
+                      help='Show progress on stderr (default: when stderr is a terminal).')
+
+  auth = export.add_argument_group('connection')
+  auth.add_argument('--domain', default=os.environ.get('JIRA_DOMAIN'), help='Atlassian domain [$JIRA_DOMAIN].')
+  auth.add_argument('--base-url', default=os.environ.get('JIRA_BASE_URL'), help='Jira base URL [$JIRA_BASE_URL].')
+  auth.add_argument('--email', default=os.environ.get('JIRA_EMAIL'), help='Account email [$JIRA_EMAIL].')
+  auth.add_argument('--api-token', default=os.environ.get('JIRA_API_TOKEN'), help='API token [$JIRA_API_TOKEN].')
+  return parser
+
+
+def _split(value: str | None) -> list[str] | None:
+  return [v.strip() for v in value.split(',') if v.strip()] if value else None
+
+
+class _Checkpoint:
+  """Export position persisted after every flushed page.
+
+  ``offset`` is the size of the output file once the page was written;
+  anything past it on resume belongs to a page that was not committed.
+  """
+
+  def __init__(self, path: str | None, query: dict[str, Any]) -> None:
+    self.path = Path(path) if path else None
+    self.query = query
+    self.next_start = 0
+    self.written = 0
+    self.offset = 0
+    if self.path and self.path.exists():
+      state = json.loads(self.path.read_text())
+      if state.get('query') != query:
+        raise SystemExit(f'Checkpoint {self.path} was written for a different export; remove it to start over.')
+      self.next_start = state['next_start']
+      self.written = state['written']
+      self.offset = state['offset']
+
+  @property
+  def resuming(self) -> bool:
+    return self.written > 0
+
+  def save(self, next_start: int, written: int, offset: int) -> None:
+    self.next_start, self.written, self.offset = next_start, written, offset
+    if self.path:
+      tmp = self.path.with_suffix(self.path.suffix + '.tmp')
+      tmp.write_text(json.dumps({'query': self.query, 'next_start': next_start, 'written': written, 'offset': offset}))
+      tmp.replace(self.path)
+
+
+def _open_output(path: str | None, resume_offset: int | None) -> IO[bytes]:
+  if path is None:
+    return sys.stdout.buffer
+  if resume_offset is None:
+    return open(path, 'wb')
+  output = open(path, 'r+b')
+  size = output.seek(0, os.SEEK_END)
+  if size < resume_offset:
+    output.close()
+    raise SystemExit(f'{path} is shorter than its checkpoint ({size} < {resume_offset} bytes); remove the checkpoint to start over.')
+  # Drop whatever a crash left of the page after the last checkpoint.
+  output.truncate(resume_offset)
+  output.seek(resume_offset)
+  return output
+
+
+class _Progress:
+  def __init__(self, enabled: bool) -> None:
+    self.enabled = enabled
+    self.started = time.monotonic()
+
+  def update(self, written: int, total: int, *, final: bool = False) -> None:
+    if not self.enabled:
+      return
+    rate = written / max(time.monotonic() - self.started, 1e-9)
+    count = f'{written}/{total}' if total else str(written)
+    sys.stderr.write(f'\rExported {count} issues ({rate:,.0f}/s)')
+    if final:
+      sys.stderr.write('\n')
+    sys.stderr.flush()
+
+
+def export_ndjson(
+  search: SearchResource,
+  jql: str,
+  output: IO[bytes],
+  *,
+  fields: list[str] | None = None,
+  expand: list[str] | None = None,
+  page_size: int = 100,
+  workers: int = 4,
+  compress: bool = False,
+  start_at: int = 0,
+  written: int = 0,
+  on_page: PageCallback | None = None,
+) -> int:
+  """Write every issue matching ``jql`` to ``output`` as one JSON object per line.
+
+  Pages are fetched ``workers`` at a time but written strictly in order, so
+  memory stays bounded by ``workers * page_size`` issues. With
+  ``compress`` every page is written as a complete gzip member, so the
+  output is a valid gzip stream after each page. ``on_page`` is called
+  after each page is flushed. Returns the number of issues written.
+  """
+  def fetch(offset: int) -> dict[str, Any]:
+    return search.jql_raw(jql, start_at=offset, max_results=page_size, fields=fields, expand=expand)
+
+  first = fetch(start_at)
+  total = first.get('total', 0)
+  stride = min(page_size, first.get('maxResults') or page_size)
+  with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+    in_flight: deque[tuple[int, Future[dict[str, Any]]]] = deque()
+    next_offset = start_at + stride
+    done: Future[dict[str, Any]] = Future()
+    done.set_result(first)
+    in_flight.append((start_at, done))
+    while in_flight:
+      while len(in_flight) < max(1, workers) and next_offset < total:
+        in_flight.append((next_offset, pool.submit(fetch, next_offset)))
+        next_offset += stride
+      offset, future = in_flight.popleft()
+      issues = future.result().get('issues') or []
+      data = b''.join(json.dumps(i, separators=(',', ':')).encode() + b'\n' for i in issues)
+      output.write(gzip.compress(data) if compress else data)
+      output.flush()
+      written += len(issues)
+      if on_page:
+        on_page(offset + len(issues), written, total)
+      if not issues:
+        break
+  return written
+
+
+def _export(args: argparse.Namespace) -> int:
+  if not args.email or not args.api_token or not (args.domain or args.base_url):
+    print('error: --domain or --base-url, --email and --api-token are required', file=sys.stderr)
+    return 2
+  fields, expand = _split(args.fields), _split(args.expand)
+  compress = args.gzip or bool(args.output and args.output.endswith('.gz'))
+  checkpoint = _Checkpoint(args.checkpoint, {'jql': args.jql, 'fields': fields, 'expand': expand})
+  if checkpoint.resuming and not args.output:
+    print('error: resuming from a checkpoint requires --output', file=sys.stderr)
+    return 2
+  progress = _Progress(sys.stderr.isatty() if args.progress is None else args.progress)
+
+  output = _open_output(args.output, checkpoint.offset if checkpoint.resuming else None)
+  total = 0
+
+  def on_page(next_start: int, written: int, page_total: int) -> None:
+    nonlocal total
+    total = page_total
+    if output is not sys.stdout.buffer:
+      # The page must be on disk before the checkpoint says it is.
+      os.fsync(output.fileno())
+      checkpoint.save(next_start, written, output.tell())
+    progress.update(written, page_total)
+
+  try:
+    with JiraClient(
+      domain=args.domain,
+      base_url=args.base_url,
+      email=args.email,
+      api_token=args.api_token,
+    ) as client:
+      written = export_ndjson(
+        client.search,
+        args.jql,
+        output,
+        fields=fields,
+        expand=expand,
+        page_size=args.page_size,
+        workers=args.workers,
+        compress=compress,
+        start_at=checkpoint.next_start,
+        written=checkpoint.written,
+        on_page=on_page,
+      )
+  except (JiraError, httpx.TransportError) as exc:
+    if progress.enabled:
+      sys.stderr.write('\n')
+    if isinstance(exc, httpx.TransportError):
+      print(f'error: could not reach Jira: {exc}', file=sys.stderr)
+    else:
+      print(f'error: {exc}', file=sys.stderr)
+    if checkpoint.path and checkpoint.path.exists():
+      print(f'Run the same command again to resume from {checkpoint.path}.', file=sys.stderr)
+    return 1
+  finally:
+    if output is not sys.stdout.buffer:
+      output.close()
+  progress.update(written, total, final=True)
+  if checkpoint.path and checkpoint.path.exists():
+    checkpoint.path.unlink()
+  return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+  args = _build_parser().parse_args(argv)
+  if args.command == 'export':
+    return _export(args)
+  return 2
@@ -1,71 +1,132 @@
 from __future__ import annotations
 
+import importlib
+import threading
+from contextlib import AbstractContextManager
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, overload
+
 import httpx
 
 from pyjira.auth import build_auth
+from pyjira.cache import MetadataCache
+from pyjira.circuit import CircuitBreaker
 from pyjira.config import JiraConfig
-from pyjira.resources.attachments import (
-    AsyncAttachmentResource,
-    AttachmentResource,
-)
-from pyjira.resources.comments import AsyncCommentResource, CommentResource
-from pyjira.resources.components import (
-    AsyncComponentResource,
-    ComponentResource,
-)
-from pyjira.resources.dashboards import (
-    AsyncDashboardResource,
-    DashboardResource,
-)
-from pyjira.resources.fields import AsyncFieldResource, FieldResource
-from pyjira.resources.filters import AsyncFilterResource, FilterResource
-from pyjira.resources.groups import AsyncGroupResource, GroupResource
-from pyjira.resources.issue_links import (
-    AsyncIssueLinkResource,
-    IssueLinkResource,
-)
-from pyjira.resources.issue_types import (
-    AsyncIssueTypeResource,
-    IssueTypeResource,
-)
-from pyjira.resources.issues import AsyncIssueResource, IssueResource
-from pyjira.resources.notification_schemes import (
-    AsyncNotificationSchemeResource,
-    NotificationSchemeResource,
-)
-from pyjira.resources.permissions import (
-    AsyncPermissionResource,
-    PermissionResource,
-)
-from pyjira.resources.priorities import (
-    AsyncPriorityResource,
-    PriorityResource,
-)
-from pyjira.resources.projects import AsyncProjectResource, ProjectResource
-from pyjira.resources.resolutions import (
-    AsyncResolutionResource,
-    ResolutionResource,
-)
-from pyjira.resources.roles import AsyncRoleResource, RoleResource
-from pyjira.resources.screens import AsyncScreenResource, ScreenResource
-from pyjira.resources.search import AsyncSearchResource, SearchResource
-from pyjira.resources.server_info import (
-    AsyncServerInfoResource,
-    ServerInfoResource,
-)
-from pyjira.resources.statuses import AsyncStatusResource, StatusResource
-from pyjira.resources.users import AsyncUserResource, UserResource
-from pyjira.resources.versions import AsyncVersionResource, VersionResource
-from pyjira.resources.workflows import (
-    AsyncWorkflowResource,
-    WorkflowResource,
-)
+from pyjira.fanout import amap, map_threads, resolve_concurrency
+from pyjira.hedging import HedgePolicy
+from pyjira.instrumentation import Instrumentation, Profile, instrumented_resource
+from pyjira.ratelimit import AdaptiveConcurrency, RateLimitTracker
+from pyjira.transport import AsyncJiraTransport, JiraTransport
+
+if TYPE_CHECKING:
+    from pyjira.replay import Cassette
+    from pyjira.resources.attachments import (
+        AsyncAttachmentResource,
+        AttachmentResource,
+    )
+    from pyjira.resources.comments import AsyncCommentResource, CommentResource
+    from pyjira.resources.components import (
+        AsyncComponentResource,
+        ComponentResource,
+    )
+    from pyjira.resources.dashboards import (
+        AsyncDashboardResource,
+        DashboardResource,
+    )
+    from pyjira.resources.fields import AsyncFieldResource, FieldResource
+    from pyjira.resources.filters import AsyncFilterResource, FilterResource
+    from pyjira.resources.groups import AsyncGroupResource, GroupResource
+    from pyjira.resources.issue_links import (
+        AsyncIssueLinkResource,
+        IssueLinkResource,
+    )
+    from pyjira.resources.issue_metadata import (
+        AsyncIssueMetadataResource,
+        IssueMetadataResource,
+    )
+    from pyjira.resources.issue_types import (
+        AsyncIssueTypeResource,
+        IssueTypeResource,
+    )
+    from pyjira.resources.issues import AsyncIssueResource, IssueResource
+    from pyjira.resources.notification_schemes import (
+        AsyncNotificationSchemeResource,
+        NotificationSchemeResource,
+    )
+    from pyjira.resources.permissions import (
+        AsyncPermissionResource,
+        PermissionResource,
+    )
+    from pyjira.resources.priorities import (
+        AsyncPriorityResource,
+        PriorityResource,
+    )
+    from pyjira.resources.projects import AsyncProjectResource, ProjectResource
+    from pyjira.resources.resolutions import (
+        AsyncResolutionResource,
+        ResolutionResource,
+    )
+    from pyjira.resources.roles import AsyncRoleResource, RoleResource
+    from pyjira.resources.screens import AsyncScreenResource, ScreenResource
+    from pyjira.resources.search import AsyncSearchResource, SearchResource
+    from pyjira.resources.server_info import (
+        AsyncServerInfoResource,
+        ServerInfoResource,
+    )
+    from pyjira.resources.statuses import AsyncStatusResource, StatusResource
+    from pyjira.resources.users import AsyncUserResource, UserResource
+    from pyjira.resources.versions import AsyncVersionResource, VersionResource
+    from pyjira.resources.workflows import (
+        AsyncWorkflowResource,
+        WorkflowResource,
+    )
 
 _DEFAULT_HEADERS = {
     "Accept": "application/json",
     "Content-Type": "application/json",
 }
 
+# Same pool sizes httpx uses by default.
+_DEFAULT_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+T = TypeVar("T")
+R = TypeVar("R")
+ResourceT = TypeVar("ResourceT")
+
+
+class _Resource(Generic[ResourceT]):
+    """Client attribute built on first access.
+
+    ``path`` is ``"<module>:<class>"`` within ``pyjira.resources``; the module
+    is only imported when the attribute is first read. Resources declared
+    with ``metadata_cache=True`` share the client's ``MetadataCache``.
+    """
+
+    def __init__(self, path: str, *, metadata_cache: bool = False) -> None:
+        module, _, self._class_name = path.partition(":")
+        self._module = f"pyjira.resources.{module}"
+        self._metadata_cache = metadata_cache
+        self._name = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self._name = name
+
+    @overload
+    def __get__(self, instance: None, owner: type) -> _Resource[ResourceT]: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type) -> ResourceT: ...
+
+    def __get__(self, instance: Any, owner: type) -> Any:
+        if instance is None:
+            return self
+        cls = instrumented_resource(getattr(importlib.import_module(self._module), self._class_name))
+        options = {"cache": instance._metadata_cache} if self._metadata_cache else {}
+        resource = cls(instance._http, instrumentation=instance._instrumentation, **options)
+        # Cached in the instance dict, which shadows this non-data descriptor.
+        return instance.__dict__.setdefault(self._name, resource)
+
 
 class JiraClient:
     """Synchronous Jira REST API v3 client.
@@ -79,6 +140,35 @@ class JiraClient:
       issue = client.issues.get('PROJ-123')
     """
 
+    attachments: _Resource[AttachmentResource] = _Resource("attachments:AttachmentResource")
+    comments: _Resource[CommentResource] = _Resource("comments:CommentResource")
+    components: _Resource[ComponentResource] = _Resource("components:ComponentResource")
+    dashboards: _Resource[DashboardResource] = _Resource("dashboards:DashboardResource")
+    fields: _Resource[FieldResource] = _Resource("fields:FieldResource")
+    filters: _Resource[FilterResource] = _Resource("filters:FilterResource")
+    groups: _Resource[GroupResource] = _Resource("groups:GroupResource")
+    issue_links: _Resource[IssueLinkResource] = _Resource("issue_links:IssueLinkResource")
+    issue_metadata: _Resource[IssueMetadataResource] = _Resource(
+        "issue_metadata:IssueMetadataResource", metadata_cache=True
+    )
+    issue_types: _Resource[IssueTypeResource] = _Resource("issue_types:IssueTypeResource")
+    issues: _Resource[IssueResource] = _Resource("issues:IssueResource", metadata_cache=True)
+    notification_schemes: _Resource[NotificationSchemeResource] = _Resource(
+        "notification_schemes:NotificationSchemeResource"
+    )
+    permissions: _Resource[PermissionResource] = _Resource("permissions:PermissionResource")
+    priorities: _Resource[PriorityResource] = _Resource("priorities:PriorityResource")
+    projects: _Resource[ProjectResource] = _Resource("projects:ProjectResource")
+    resolutions: _Resource[ResolutionResource] = _Resource("resolutions:ResolutionResource")
+    roles: _Resource[RoleResource] = _Resource("roles:RoleResource")
+    screens: _Resource[ScreenResource] = _Resource("screens:ScreenResource")
+    search: _Resource[SearchResource] = _Resource("search:SearchResource")
+    server_info: _Resource[ServerInfoResource] = _Resource("server_info:ServerInfoResource")
+    statuses: _Resource[StatusResource] = _Resource("statuses:StatusResource")
+    users: _Resource[UserResource] = _Resource("users:UserResource")
+    versions: _Resource[VersionResource] = _Resource("versions:VersionResource")
+    workflows: _Resource[WorkflowResource] = _Resource("workflows:WorkflowResource")
+
     def __init__(
         self,
         *,
@@ -88,6 +178,12 @@ class JiraClient:
         api_token: str,
         timeout: float = 30.0,
         headers: dict[str, str] | None = None,
+        limits: httpx.Limits | None = None,
+        max_retries: int | None = None,
+        instrumentation: Instrumentation | bool | None = None,
+        circuit_breaker: CircuitBreaker | bool | None = None,
+        hedging: HedgePolicy | bool | None = None,
+        cassette: Cassette | None = None,
     ) -> None:
         if domain:
             resolved_base_url = f"https://{domain}.atlassian.net"
@@ -101,47 +197,143 @@ class JiraClient:
             email=email,
             api_token=api_token,
             timeout=timeout,
+            **({} if max_retries is None else {"max_retries": max_retries}),
         )
 
         merged_headers = {**_DEFAULT_HEADERS, **(headers or {})}
         auth = build_auth(email, api_token)
 
+        self._limits = limits or _DEFAULT_LIMITS
+        if not isinstance(instrumentation, Instrumentation):
+            instrumentation = Instrumentation(metrics=bool(instrumentation))
+        self._instrumentation = instrumentation
+        self._rate_limit = RateLimitTracker()
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        self._circuit_breaker = circuit_breaker or None
+        if hedging is True:
+            hedging = HedgePolicy()
+        self._hedging = hedging or None
+        self._cassette = cassette
+        self._metadata_cache = MetadataCache()
+        http_transport: httpx.BaseTransport = httpx.HTTPTransport(limits=self._limits)
+        if cassette is not None:
+            http_transport = cassette.transport(http_transport)
+        transport = JiraTransport(
+            http_transport,
+            max_retries=max_retries or 0,
+            instrumentation=instrumentation,
+            rate_limit=self._rate_limit,
+            circuit_breaker=self._circuit_breaker,
+            hedging=self._hedging,
+            hedge_workers=2 * (self._limits.max_connections or 100),
+        )
         self._http = httpx.Client(
             base_url=resolved_base_url,
             auth=auth,
             headers=merged_headers,
             timeout=timeout,
+            limits=self._limits,
+            transport=transport,
         )
 
-        self.attachments = AttachmentResource(self._http)
-        self.comments = CommentResource(self._http)
-        self.components = ComponentResource(self._http)
-        self.dashboards = DashboardResource(self._http)
-        self.fields = FieldResource(self._http)
-        self.filters = FilterResource(self._http)
-        self.groups = GroupResource(self._http)
-        self.issue_links = IssueLinkResource(self._http)
-        self.issue_types = IssueTypeResource(self._http)
-        self.issues = IssueResource(self._http)
-        self.notification_schemes = NotificationSchemeResource(self._http)
-        self.permissions = PermissionResource(self._http)
-        self.priorities = PriorityResource(self._http)
-        self.projects = ProjectResource(self._http)
-        self.resolutions = ResolutionResource(self._http)
-        self.roles = RoleResource(self._http)
-        self.screens = ScreenResource(self._http)
-        self.search = SearchResource(self._http)
-        self.server_info = ServerInfoResource(self._http)
-        self.statuses = StatusResource(self._http)
-        self.users = UserResource(self._http)
-        self.versions = VersionResource(self._http)
-        self.workflows = WorkflowResource(self._http)
+        self._executor: ThreadPoolExecutor | None = None
+        self._executor_lock = threading.Lock()
+        # Set on the executor's own threads, where map() would deadlock.
+        self._map_worker = threading.local()
 
     @property
     def config(self) -> JiraConfig:
         return self._config
 
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Per-call events; ``metrics`` is only kept with ``instrumentation=True``."""
+        return self._instrumentation
+
+    @property
+    def rate_limit(self) -> RateLimitTracker:
+        """Rate-limit headers of the latest response and throttling counts."""
+        return self._rate_limit
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """Per-endpoint-group circuit breaker, if the client was created with one."""
+        return self._circuit_breaker
+
+    @property
+    def hedging(self) -> HedgePolicy | None:
+        """Hedging policy for slow GETs, with its counters, if enabled."""
+        return self._hedging
+
+    @property
+    def cassette(self) -> Cassette | None:
+        """Record/replay store requests go through, if the client has one."""
+        return self._cassette
+
+    def profile(self) -> AbstractContextManager[Profile]:
+        """Time network, JSON decoding and validation of calls made in the block.
+
+        Usage:
+          with client.profile() as profile:
+              client.issues.get('PROJ-1')
+          print(profile.report())
+        """
+        return self._instrumentation.profile()
+
+    def map(
+        self,
+        func: Callable[[T], R],
+        items: Iterable[T],
+        *,
+        workers: int | None = None,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> Iterator[R | Exception]:
+        """Run ``func`` over ``items`` on a thread pool, yielding the results.
+
+        Calls share this client's thread-safe connection pool. At most
+        ``workers`` calls (default 10, never more than the pool's
+        ``max_connections``) run at once. Results come back in input order,
+        or as they complete with ``ordered=False``. The first failure stops
+        new calls and is raised, unless ``return_exceptions`` is set.
+        Calling ``map`` from inside a mapped function raises ``RuntimeError``:
+        the inner calls would wait for threads the outer ones hold.
+
+        Usage:
+          def fetch(key):
+              return client.issues.get(key), client.comments.list(key)
+
+          for issue, comments in client.map(fetch, keys, workers=8):
+              ...
+        """
+        if getattr(self._map_worker, "active", False):
+            raise RuntimeError("client.map() cannot be called from a function it is running")
+        return map_threads(
+            self._get_executor(),
+            func,
+            items,
+            concurrency=resolve_concurrency(workers, self._limits.max_connections),
+            ordered=ordered,
+            return_exceptions=return_exceptions,
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._limits.max_connections or 100,
+                    thread_name_prefix="pyjira",
+                    initializer=setattr,
+                    initargs=(self._map_worker, "active", True),
+                )
+            return self._executor
+
     def close(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
         self._http.close()
 
     def __enter__(self) -> JiraClient:
@@ -163,6 +355,43 @@ class AsyncJiraClient:
         issue = await client.issues.get('PROJ-123')
     """
 
+    attachments: _Resource[AsyncAttachmentResource] = _Resource(
+        "attachments:AsyncAttachmentResource"
+    )
+    comments: _Resource[AsyncCommentResource] = _Resource("comments:AsyncCommentResource")
+    components: _Resource[AsyncComponentResource] = _Resource("components:AsyncComponentResource")
+    dashboards: _Resource[AsyncDashboardResource] = _Resource("dashboards:AsyncDashboardResource")
+    fields: _Resource[AsyncFieldResource] = _Resource("fields:AsyncFieldResource")
+    filters: _Resource[AsyncFilterResource] = _Resource("filters:AsyncFilterResource")
+    groups: _Resource[AsyncGroupResource] = _Resource("groups:AsyncGroupResource")
+    issue_links: _Resource[AsyncIssueLinkResource] = _Resource("issue_links:AsyncIssueLinkResource")
+    issue_metadata: _Resource[AsyncIssueMetadataResource] = _Resource(
+        "issue_metadata:AsyncIssueMetadataResource", metadata_cache=True
+    )
+    issue_types: _Resource[AsyncIssueTypeResource] = _Resource("issue_types:AsyncIssueTypeResource")
+    issues: _Resource[AsyncIssueResource] = _Resource("issues:AsyncIssueResource", metadata_cache=True)
+    notification_schemes: _Resource[AsyncNotificationSchemeResource] = _Resource(
+        "notification_schemes:AsyncNotificationSchemeResource"
+    )
+    permissions: _Resource[AsyncPermissionResource] = _Resource(
+        "permissions:AsyncPermissionResource"
+    )
+    priorities: _Resource[AsyncPriorityResource] = _Resource("priorities:AsyncPriorityResource")
+    projects: _Resource[AsyncProjectResource] = _Resource("projects:AsyncProjectResource")
+    resolutions: _Resource[AsyncResolutionResource] = _Resource(
+        "resolutions:AsyncResolutionResource"
+    )
+    roles: _Resource[AsyncRoleResource] = _Resource("roles:AsyncRoleResource")
+    screens: _Resource[AsyncScreenResource] = _Resource("screens:AsyncScreenResource")
+    search: _Resource[AsyncSearchResource] = _Resource("search:AsyncSearchResource")
+    server_info: _Resource[AsyncServerInfoResource] = _Resource(
+        "server_info:AsyncServerInfoResource"
+    )
+    statuses: _Resource[AsyncStatusResource] = _Resource("statuses:AsyncStatusResource")
+    users: _Resource[AsyncUserResource] = _Resource("users:AsyncUserResource")
+    versions: _Resource[AsyncVersionResource] = _Resource("versions:AsyncVersionResource")
+    workflows: _Resource[AsyncWorkflowResource] = _Resource("workflows:AsyncWorkflowResource")
+
     def __init__(
         self,
         *,
@@ -172,6 +401,13 @@ class AsyncJiraClient:
         api_token: str,
         timeout: float = 30.0,
         headers: dict[str, str] | None = None,
+        limits: httpx.Limits | None = None,
+        max_retries: int | None = None,
+        instrumentation: Instrumentation | bool | None = None,
+        circuit_breaker: CircuitBreaker | bool | None = None,
+        hedging: HedgePolicy | bool | None = None,
+        cassette: Cassette | None = None,
+        adaptive_concurrency: AdaptiveConcurrency | bool | None = None,
     ) -> None:
         if domain:
             resolved_base_url = f"https://{domain}.atlassian.net"
@@ -185,46 +421,128 @@ class AsyncJiraClient:
             email=email,
             api_token=api_token,
             timeout=timeout,
+            **({} if max_retries is None else {"max_retries": max_retries}),
         )
 
         merged_headers = {**_DEFAULT_HEADERS, **(headers or {})}
         auth = build_auth(email, api_token)
 
+        self._limits = limits or _DEFAULT_LIMITS
+        if not isinstance(instrumentation, Instrumentation):
+            instrumentation = Instrumentation(metrics=bool(instrumentation))
+        self._instrumentation = instrumentation
+        self._rate_limit = RateLimitTracker()
+        if circuit_breaker is True:
+            circuit_breaker = CircuitBreaker()
+        self._circuit_breaker = circuit_breaker or None
+        if hedging is True:
+            hedging = HedgePolicy()
+        self._hedging = hedging or None
+        self._cassette = cassette
+        self._metadata_cache = MetadataCache()
+        if adaptive_concurrency is True:
+            adaptive_concurrency = AdaptiveConcurrency(
+                max_limit=self._limits.max_connections or 100
+            )
+        self._adaptive_concurrency = adaptive_concurrency or None
+        http_transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(limits=self._limits)
+        if cassette is not None:
+            http_transport = cassette.async_transport(http_transport)
+        transport = AsyncJiraTransport(
+            http_transport,
+            max_retries=max_retries or 0,
+            instrumentation=instrumentation,
+            rate_limit=self._rate_limit,
+            circuit_breaker=self._circuit_breaker,
+            hedging=self._hedging,
+            concurrency=self._adaptive_concurrency,
+        )
         self._http = httpx.AsyncClient(
             base_url=resolved_base_url,
             auth=auth,
             headers=merged_headers,
             timeout=timeout,
+            limits=self._limits,
+            transport=transport,
         )
 
-        self.attachments = AsyncAttachmentResource(self._http)
-        self.comments = AsyncCommentResource(self._http)
-        self.components = AsyncComponentResource(self._http)
-        self.dashboards = AsyncDashboardResource(self._http)
-        self.fields = AsyncFieldResource(self._http)
-        self.filters = AsyncFilterResource(self._http)
-        self.groups = AsyncGroupResource(self._http)
-        self.issue_links = AsyncIssueLinkResource(self._http)
-        self.issue_types = AsyncIssueTypeResource(self._http)
-        self.issues = AsyncIssueResource(self._http)
-        self.notification_schemes = AsyncNotificationSchemeResource(self._http)
-        self.permissions = AsyncPermissionResource(self._http)
-        self.priorities = AsyncPriorityResource(self._http)
-        self.projects = AsyncProjectResource(self._http)
-        self.resolutions = AsyncResolutionResource(self._http)
-        self.roles = AsyncRoleResource(self._http)
-        self.screens = AsyncScreenResource(self._http)
-        self.search = AsyncSearchResource(self._http)
-        self.server_info = AsyncServerInfoResource(self._http)
-        self.statuses = AsyncStatusResource(self._http)
-        self.users = AsyncUserResource(self._http)
-        self.versions = AsyncVersionResource(self._http)
-        self.workflows = AsyncWorkflowResource(self._http)
-
     @property
     def config(self) -> JiraConfig:
         return self._config
 
+    @property
+    def instrumentation(self) -> Instrumentation:
+        """Per-call events; ``metrics`` is only kept with ``instrumentation=True``."""
+        return self._instrumentation
+
+    @property
+    def rate_limit(self) -> RateLimitTracker:
+        """Rate-limit headers of the latest response and throttling counts."""
+        return self._rate_limit
+
+    @property
+    def circuit_breaker(self) -> CircuitBreaker | None:
+        """Per-endpoint-group circuit breaker, if the client was created with one."""
+        return self._circuit_breaker
+
+    @property
+    def hedging(self) -> HedgePolicy | None:
+        """Hedging policy for slow GETs, with its counters, if enabled."""
+        return self._hedging
+
+    @property
+    def cassette(self) -> Cassette | None:
+        """Record/replay store requests go through, if the client has one."""
+        return self._cassette
+
+    @property
+    def adaptive_concurrency(self) -> AdaptiveConcurrency | None:
+        """The AIMD request limit, if the client was created with one."""
+        return self._adaptive_concurrency
+
+    def profile(self) -> AbstractContextManager[Profile]:
+        """Time network, JSON decoding and validation of calls made in the block.
+
+        Usage:
+          with client.profile() as profile:
+              client.issues.get('PROJ-1')
+          print(profile.report())
+        """
+        return self._instrumentation.profile()
+
+    def map(
+        self,
+        func: Callable[[T], Awaitable[R]],
+        items: Iterable[T],
+        *,
+        concurrency: int | None = None,
+        ordered: bool = True,
+        return_exceptions: bool = False,
+    ) -> AsyncIterator[R | Exception]:
+        """Run ``func`` over ``items`` concurrently, yielding the results.
+
+        At most ``concurrency`` calls (default 10, never more than the
+        connection pool's ``max_connections``) are in flight at once.
+        With ``adaptive_concurrency`` the default is its ``max_limit`` and
+        the adaptive limit decides how many requests are actually sent.
+        Results come back in input order, or as they complete with
+        ``ordered=False``. The first failure cancels the remaining calls
+        and is raised, unless ``return_exceptions`` is set.
+
+        Usage:
+          async for issue in client.map(client.issues.get, keys, concurrency=20):
+              print(issue.key)
+        """
+        if concurrency is None and self._adaptive_concurrency is not None:
+            concurrency = self._adaptive_concurrency.max_limit
+        return amap(
+            func,
+            items,
+            concurrency=resolve_concurrency(concurrency, self._limits.max_connections),
+            ordered=ordered,
+            return_exceptions=return_exceptions,
+        )
+
     async def close(self) -> None:
         await self._http.aclose()
 
@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import math
 from typing import Any
 
 import httpx
 
 from pyjira.models.errors import ErrorResponse
+from pyjira.ratelimit import RateLimitInfo
 
 
 class JiraError(Exception):
@@ -50,16 +52,34 @@ class RateLimitError(JiraError):
     message: str,
     *,
     retry_after: int | None = None,
+    rate_limit: RateLimitInfo | None = None,
     **kwargs: Any,
   ) -> None:
     super().__init__(message, **kwargs)
     self.retry_after = retry_after
+    self.rate_limit = rate_limit
 
 
 class ServerError(JiraError):
   """Raised on 5xx Server Error."""
 
 
+class CircuitOpenError(ServerError):
+  """Raised without sending the request while its endpoint group's circuit is open."""
+
+  def __init__(
+    self,
+    message: str,
+    *,
+    group: str,
+    retry_after: float | None = None,
+    **kwargs: Any,
+  ) -> None:
+    super().__init__(message, **kwargs)
+    self.group = group
+    self.retry_after = retry_after
+
+
 _STATUS_MAP: dict[int, type[JiraError]] = {
   400: ValidationError,
   401: AuthenticationError,
@@ -99,9 +119,10 @@ def raise_for_response(response: httpx.Response) -> None:
   }
 
   if status_code == 429:
-    retry_after_header = response.headers.get('Retry-After')
-    retry_after = int(retry_after_header) if retry_after_header else None
-    raise RateLimitError(message, retry_after=retry_after, **kwargs)
+    rate_limit = RateLimitInfo.from_response(response)
+    seconds = rate_limit.retry_after if rate_limit is not None else None
+    retry_after = math.ceil(seconds) if seconds is not None else None
+    raise RateLimitError(message, retry_after=retry_after, rate_limit=rate_limit, **kwargs)
 
   if status_code >= 500:
     raise ServerError(message, **kwargs)
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, wait
+from typing import TypeVar
+
+T = TypeVar('T')
+R = TypeVar('R')
+
+# In-flight calls per fan-out unless the caller asks for more; Jira Cloud
+# starts rate limiting well before a 100-connection pool is saturated.
+DEFAULT_CONCURRENCY = 10
+
+
+def resolve_concurrency(concurrency: int | None, max_connections: int | None) -> int:
+  """Return the in-flight bound, never above the connection pool size."""
+  limit = DEFAULT_CONCURRENCY if concurrency is None else concurrency
+  if limit < 1:
+    raise ValueError('concurrency must be at least 1')
+  return min(limit, max_connections) if max_connections else limit
+
+
+def _outcome(task: asyncio.Task[R], return_exceptions: bool) -> R | BaseException:
+  if task.cancelled():
+    exc: BaseException | None = asyncio.CancelledError()
+  else:
+    exc = task.exception()
+  if exc is None:
+    return task.result()
+  if return_exceptions and isinstance(exc, Exception):
+    return exc
+  raise exc
+
+
+def _future_outcome(future: Future[R], return_exceptions: bool) -> R | Exception:
+  exc = future.exception()
+  if exc is None:
+    return future.result()
+  if return_exceptions and isinstance(exc, Exception):
+    return exc
+  raise exc
+
+
+def map_threads(
+  executor: Executor,
+  func: Callable[[T], R],
+  items: Iterable[T],
+  *,
+  concurrency: int = DEFAULT_CONCURRENCY,
+  ordered: bool = True,
+  return_exceptions: bool = False,
+) -> Iterator[R | Exception]:
+  """Thread-pool counterpart of ``amap`` running ``func`` on ``executor``.
+
+  On the first error (or when iteration stops early) calls that have not
+  started are cancelled and running ones are waited for before returning.
+  """
+  if concurrency < 1:
+    raise ValueError('concurrency must be at least 1')
+  source = iter(items)
+  window: deque[Future[R]] = deque()
+  max_window = concurrency * 4
+  exhausted = False
+
+  def in_flight() -> list[Future[R]]:
+    return [future for future in window if not future.done()]
+
+  def fill() -> None:
+    nonlocal exhausted
+    while not exhausted and len(window) < max_window and len(in_flight()) < concurrency:
+      try:
+        item = next(source)
+      except StopIteration:
+        exhausted = True
+        return
+      window.append(executor.submit(func, item))
+
+  try:
+    fill()
+    while window:
+      if ordered:
+        ready = window[0] if window[0].done() else None
+      else:
+        ready = next((future for future in window if future.done()), None)
+      if ready is None:
+        wait(in_flight(), return_when=FIRST_COMPLETED)
+        fill()
+        continue
+      window.remove(ready)
+      fill()
+      yield _future_outcome(ready, return_exceptions)
+  finally:
+    for future in window:
+      future.cancel()
+    wait(window)
+
+
+async def amap(
+  func: Callable[[T], Awaitable[R]],
+  items: Iterable[T],
+  *,
+  concurrency: int = DEFAULT_CONCURRENCY,
+  ordered: bool = True,
+  return_exceptions: bool = False,
+) -> AsyncIterator[R | Exception]:
+  """Yield ``await func(item)`` for every item with at most ``concurrency`` calls in flight.
+
+  Items are pulled lazily, so ``items`` may be a generator. With ``ordered``
+  results come back in input order; otherwise as each call completes. The
+  first exception cancels the remaining calls and propagates, unless
+  ``return_exceptions`` is set, in which case exceptions are yielded in
+  place of results. Outstanding calls are cancelled and awaited whenever
+  iteration stops early; wrap the iterator in ``contextlib.aclosing`` when
+  breaking out of it so that happens immediately.
+  """
+  if concurrency < 1:
+    raise ValueError('concurrency must be at least 1')
+  source = iter(items)
+  # Tasks not yet yielded, in submission order. Finished results waiting
+  # behind a slow call are bounded as well as the calls in flight.
+  window: deque[asyncio.Task[R]] = deque()
+  max_window = concurrency * 4
+  exhausted = False
+
+  def in_flight() -> list[asyncio.Task[R]]:
+    return [task for task in window if not task.done()]
+
+  def fill() -> None:
+    nonlocal exhausted
+    while not exhausted and len(window) < max_window and len(in_flight()) < concurrency:
+      try:
+        item = next(source)
+      except StopIteration:
+        exhausted = True
+        return
+      window.append(asyncio.ensure_future(func(item)))
+
+  try:
+    fill()
+    while window:
+      if ordered:
+        ready = window[0] if window[0].done() else None
+      else:
+        ready = next((task for task in window if task.done()), None)
+      if ready is None:
+        await asyncio.wait(in_flight(), return_when=asyncio.FIRST_COMPLETED)
+        fill()
+        continue
+      window.remove(ready)
+      fill()
+      yield _outcome(ready, return_exceptions)  # type: ignore[misc]
+  finally:
+    for task in window:
+      task.cancel()
+    if window:
+      await asyncio.gather(*window, return_exceptions=True)
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import math
+import threading
+from collections import deque
+
+from pyjira.instrumentation import endpoint_template
+
+HEDGED_METHODS = frozenset({'GET', 'HEAD'})
+
+
+class _Latencies:
+  __slots__ = ('samples', 'deadline', 'stale')
+
+  def __init__(self, window: int) -> None:
+    self.samples: deque[float] = deque(maxlen=window)
+    self.deadline: float | None = None
+    self.stale = 0
+
+
+class HedgePolicy:
+  """When to send a second copy of a slow idempotent request.
+
+  Latencies (time to response headers) are kept per endpoint template over
+  the last ``window`` calls. Once an endpoint has ``min_samples``, a GET
+  that has had no response after its ``percentile`` latency (but at least
+  ``min_delay`` seconds) is sent again and the first response wins. The
+  async client cancels the other request; on the sync client a request
+  cannot be interrupted, so it runs to completion on its worker thread and
+  its response is discarded. Only first attempts are sampled, so hedging
+  does not pull the deadline down. Every GET adds ``budget`` to a token
+  bucket holding at most ``burst`` tokens and a hedge spends one, so
+  hedges add at most ``budget`` extra requests on average.
+
+  Usage:
+    client = JiraClient(..., hedging=HedgePolicy(percentile=0.95, budget=0.05))
+  """
+
+  def __init__(
+    self,
+    percentile: float = 0.95,
+    *,
+    budget: float = 0.05,
+    burst: float = 10.0,
+    min_delay: float = 0.005,
+    min_samples: int = 20,
+    window: int = 1000,
+  ) -> None:
+    if not 0 < percentile < 1:
+      raise ValueError('percentile must be between 0 and 1')
+    if budget < 0 or burst < 1:
+      raise ValueError('budget must not be negative and burst must be at least 1')
+    self.percentile = percentile
+    self.budget = budget
+    self.burst = burst
+    self.min_delay = min_delay
+    self.min_samples = min_samples
+    self.window = window
+    self.requests = 0
+    self.hedged = 0
+    self.hedge_wins = 0
+    self._tokens = burst
+    self._latencies: dict[str, _Latencies] = {}
+    self._lock = threading.Lock()
+
+  def deadline(self, path: str) -> tuple[str, float | None]:
+    """Endpoint template of a GET and how long to wait before hedging it.
+
+    The delay is ``None`` for endpoints with too few samples and while the
+    budget is spent. Counts the request towards the budget.
+    """
+    endpoint = endpoint_template(path)
+    with self._lock:
+      self.requests += 1
+      self._tokens = min(self.burst, self._tokens + self.budget)
+      latencies = self._latencies.get(endpoint)
+      if self._tokens < 1 or latencies is None or len(latencies.samples) < self.min_samples:
+        return endpoint, None
+      if latencies.deadline is None or latencies.stale >= max(1, len(latencies.samples) // 20):
+        ordered = sorted(latencies.samples)
+        latencies.deadline = ordered[min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)]
+        latencies.stale = 0
+      return endpoint, max(self.min_delay, latencies.deadline)
+
+  def observe(self, endpoint: str, latency: float) -> None:
+    with self._lock:
+      latencies = self._latencies.get(endpoint)
+      if latencies is None:
+        latencies = self._latencies[endpoint] = _Latencies(self.window)
+      latencies.samples.append(latency)
+      latencies.stale += 1
+
+  def try_hedge(self) -> bool:
+    """Spend a budget token on a hedge, if one is available."""
+    with self._lock:
+      if self._tokens < 1:
+        return False
+      self._tokens -= 1
+      self.hedged += 1
+      return True
+
+  def won(self) -> None:
+    with self._lock:
+      self.hedge_wins += 1
@@ -0,0 +1,577 @@
+from __future__ import annotations
+
+import bisect
+import contextlib
+import functools
+import inspect
+import re
+import threading
+import time
+from collections.abc import Callable, Iterable, Iterator
+from contextvars import ContextVar
+from dataclasses import dataclass, field, replace
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+  import httpx
+
+T = TypeVar('T')
+
+Sink = Callable[['CallEvent'], None]
+
+
+@dataclass(frozen=True)
+class CallEvent:
+  """One HTTP call made by a client.
+
+  ``duration`` runs from sending the request to the end of the response
+  body and includes retries; ``rate_limit_wait`` is the part of it spent
+  sleeping on ``Retry-After``. ``parse_time`` is the time the resource
+  method spent after the response arrived, or ``None`` when the call was
+  made outside a resource method; ``decode_time`` is the part of it spent
+  in ``response.json()`` and ``validation_time`` the rest, which is model
+  validation. ``status`` is ``None`` and ``error`` names the exception when
+  no response was received.
+  """
+
+  method: str
+  endpoint: str
+  status: int | None
+  duration: float
+  bytes_out: int
+  bytes_in: int
+  parse_time: float | None = None
+  decode_time: float | None = None
+  retries: int = 0
+  rate_limit_wait: float = 0.0
+  error: str | None = None
+
+  @property
+  def network_time(self) -> float:
+    return self.duration - self.rate_limit_wait
+
+  @property
+  def validation_time(self) -> float | None:
+    if self.parse_time is None:
+      return None
+    return max(0.0, self.parse_time - (self.decode_time or 0.0))
+
+
+_SEGMENT_RULES = [
+  (re.compile(r'^[A-Z][A-Z0-9_]*-\d+$'), '{key}'),
+  (re.compile(r'^\d+$'), '{id}'),
+  (re.compile(r'^[A-Z][A-Z0-9_]+$'), '{key}'),
+  (re.compile(r'^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$', re.IGNORECASE), '{id}'),
+  (re.compile(r'^(?=.*\d)[\w:-]{16,}$'), '{id}'),
+]
+
+
+@functools.lru_cache(maxsize=4096)
+def endpoint_template(path: str) -> str:
+  """Collapse the identifiers in an API path into placeholders.
+
+  Issue keys and project keys become ``{key}``; numeric ids, UUIDs and
+  account ids become ``{id}``, so ``/rest/api/3/issue/PROJ-1/comment/10010``
+  maps to ``/rest/api/3/issue/{key}/comment/{id}``.
+  """
+  segments = path.split('/')
+  # Leave the '/rest/<api>/<version>' prefix alone.
+  first = 4 if segments[1:2] == ['rest'] else 1
+  for index, segment in enumerate(segments[first:], first):
+    for pattern, placeholder in _SEGMENT_RULES:
+      if pattern.match(segment):
+        segments[index] = placeholder
+        break
+  return '/'.join(segments)
+
+
+def _exponential_bounds(start: float, factor: float, count: int) -> list[float]:
+  return [start * factor**i for i in range(count)]
+
+
+# 1 ms .. ~65 s and 256 B .. 64 MiB.
+DURATION_BUCKETS = _exponential_bounds(0.001, 2, 17)
+SIZE_BUCKETS = _exponential_bounds(256, 4, 10)
+
+
+class Histogram:
+  """Fixed-bucket histogram; ``bounds`` are the inclusive bucket upper bounds."""
+
+  def __init__(self, bounds: Iterable[float] = DURATION_BUCKETS) -> None:
+    self.bounds = sorted(bounds)
+    self.counts = [0] * (len(self.bounds) + 1)
+    self.count = 0
+    self.sum = 0.0
+    self.min = float('inf')
+    self.max = float('-inf')
+
+  def observe(self, value: float) -> None:
+    self.counts[bisect.bisect_left(self.bounds, value)] += 1
+    self.count += 1
+    self.sum += value
+    self.min = min(self.min, value)
+    self.max = max(self.max, value)
+
+  @property
+  def mean(self) -> float:
+    return self.sum / self.count if self.count else 0.0
+
+  def quantile(self, q: float) -> float:
+    """Estimate the ``q`` quantile by interpolating within its bucket."""
+    if not self.count:
+      return 0.0
+    rank = q * self.count
+    seen = 0
+    for index, count in enumerate(self.counts):
+      if count and seen + count >= rank:
+        lower = self.bounds[index - 1] if index else self.min
+        upper = self.bounds[index] if index < len(self.bounds) else self.max
+        lower, upper = max(lower, self.min), min(upper, self.max)
+        return lower + (upper - lower) * (rank - seen) / count
+      seen += count
+    return self.max
+
+  def summary(self) -> dict[str, float]:
+    return {
+      'count': self.count,
+      'mean': self.mean,
+      'p50': self.quantile(0.5),
+      'p90': self.quantile(0.9),
+      'p99': self.quantile(0.99),
+      'max': self.max if self.count else 0.0,
+    }
+
+
+@dataclass
+class EndpointStats:
+  """Aggregates for one ``(method, endpoint)``."""
+
+  calls: int = 0
+  errors: int = 0
+  retries: int = 0
+  rate_limit_wait: float = 0.0
+  bytes_out: int = 0
+  bytes_in: int = 0
+  statuses: dict[int, int] = field(default_factory=dict)
+  duration: Histogram = field(default_factory=Histogram)
+  parse_time: Histogram = field(default_factory=Histogram)
+  decode_time: Histogram = field(default_factory=Histogram)
+  response_size: Histogram = field(default_factory=lambda: Histogram(SIZE_BUCKETS))
+
+  def add(self, event: CallEvent) -> None:
+    self.calls += 1
+    if event.status is None or event.status >= 400:
+      self.errors += 1
+    if event.status is not None:
+      self.statuses[event.status] = self.statuses.get(event.status, 0) + 1
+    self.retries += event.retries
+    self.rate_limit_wait += event.rate_limit_wait
+    self.bytes_out += event.bytes_out
+    self.bytes_in += event.bytes_in
+    self.duration.observe(event.duration)
+    if event.parse_time is not None:
+      self.parse_time.observe(event.parse_time)
+    if event.decode_time is not None:
+      self.decode_time.observe(event.decode_time)
+    self.response_size.observe(event.bytes_in)
+
+
+class MetricsRecorder:
+  """In-memory sink keeping per-endpoint counters and histograms."""
+
+  def __init__(self) -> None:
+    self._lock = threading.Lock()
+    self._stats: dict[tuple[str, str], EndpointStats] = {}
+
+  def __call__(self, event: CallEvent) -> None:
+    key = (event.method, event.endpoint)
+    with self._lock:
+      stats = self._stats.get(key)
+      if stats is None:
+        stats = self._stats[key] = EndpointStats()
+      stats.add(event)
+
+  def get(self, method: str, endpoint: str) -> EndpointStats | None:
+    return self._stats.get((method, endpoint))
+
+  def endpoints(self) -> dict[tuple[str, str], EndpointStats]:
+    with self._lock:
+      return dict(self._stats)
+
+  def summary(self) -> list[dict[str, Any]]:
+    """One row per endpoint, most total time first."""
+    rows = []
+    for (method, endpoint), stats in self.endpoints().items():
+      rows.append({
+        'method': method,
+        'endpoint': endpoint,
+        'calls': stats.calls,
+        'errors': stats.errors,
+        'retries': stats.retries,
+        'rate_limit_wait': stats.rate_limit_wait,
+        'total_time': stats.duration.sum,
+        'duration': stats.duration.summary(),
+        'parse_time': stats.parse_time.summary(),
+        'decode_time': stats.decode_time.summary(),
+        'bytes_out': stats.bytes_out,
+        'bytes_in': stats.bytes_in,
+      })
+    return sorted(rows, key=lambda row: row['total_time'], reverse=True)
+
+  def reset(self) -> None:
+    with self._lock:
+      self._stats.clear()
+
+
+class Instrumentation:
+  """Per-call events from a client's request path.
+
+  Every event is recorded in ``metrics`` (unless ``metrics=False``) and
+  passed to each sink, a callable taking a ``CallEvent``. Sinks run on the
+  calling thread or event loop and should hand off anything slow. Calls are
+  only timed while the instrumentation is ``active``: it has metrics, a
+  sink or an open ``profile()``.
+
+  Usage:
+    instrumentation = Instrumentation()
+    client = JiraClient(..., instrumentation=instrumentation)
+    client.issues.get('PROJ-1')
+    for row in instrumentation.metrics.summary():
+      print(row['method'], row['endpoint'], row['duration']['p90'])
+  """
+
+  def __init__(self, *sinks: Sink, metrics: bool = True) -> None:
+    self.metrics = MetricsRecorder() if metrics else None
+    # Replaced, never mutated, so emit() can iterate it without a lock.
+    self._sinks: tuple[Sink, ...] = sinks
+    self._sinks_lock = threading.Lock()
+
+  @property
+  def active(self) -> bool:
+    return self.metrics is not None or bool(self._sinks)
+
+  @contextlib.contextmanager
+  def profile(self) -> Iterator[Profile]:
+    """Collect every call made while the block runs into a ``Profile``."""
+    profile = Profile()
+    self.add_sink(profile)
+    try:
+      yield profile
+    finally:
+      profile.close()
+      self.remove_sink(profile)
+
+  def add_sink(self, sink: Sink) -> None:
+    with self._sinks_lock:
+      self._sinks = (*self._sinks, sink)
+
+  def remove_sink(self, sink: Sink) -> None:
+    with self._sinks_lock:
+      sinks = list(self._sinks)
+      sinks.remove(sink)
+      self._sinks = tuple(sinks)
+
+  def emit(self, event: CallEvent) -> None:
+    if self.metrics is not None:
+      self.metrics(event)
+    for sink in self._sinks:
+      sink(event)
+
+  def start(self, request: httpx.Request) -> CallTimer:
+    scope = _current_scope()
+    if scope is not None:
+      scope.flush()
+    return CallTimer(self, request, scope)
+
+
+class _CallScope:
+  """Open while a resource method runs; holds its calls until parsing is done."""
+
+  __slots__ = ('closed', '_pending')
+
+  def __init__(self) -> None:
+    self.closed = False
+    self._pending: list[tuple[CallTimer, CallEvent, float]] = []
+
+  def hold(self, timer: CallTimer, event: CallEvent, received: float) -> None:
+    self._pending.append((timer, event, received))
+
+  def flush(self) -> None:
+    pending, self._pending = self._pending, []
+    now = time.perf_counter()
+    for timer, event, received in pending:
+      timer.instrumentation.emit(replace(event, parse_time=now - received, decode_time=timer.decode_time))
+
+  def close(self) -> None:
+    self.closed = True
+    self.flush()
+
+
+_scope: ContextVar[_CallScope | None] = ContextVar('pyjira_call_scope', default=None)
+
+
+def _current_scope() -> _CallScope | None:
+  scope = _scope.get()
+  return None if scope is None or scope.closed else scope
+
+
+class CallTimer:
+  """Measures one call from request to end of response body."""
+
+  def __init__(self, instrumentation: Instrumentation, request: httpx.Request, scope: _CallScope | None) -> None:
+    self.instrumentation = instrumentation
+    self.decode_time: float | None = None
+    self._scope = scope
+    self._method = request.method
+    self._endpoint = endpoint_template(request.url.path)
+    self._bytes_out = int(request.headers.get('Content-Length') or 0)
+    self._started = time.perf_counter()
+
+  def finish(
+    self,
+    *,
+    status: int | None,
+    bytes_in: int = 0,
+    retries: int = 0,
+    rate_limit_wait: float = 0.0,
+    error: BaseException | None = None,
+  ) -> None:
+    received = time.perf_counter()
+    event = CallEvent(
+      method=self._method,
+      endpoint=self._endpoint,
+      status=status,
+      duration=received - self._started,
+      bytes_out=self._bytes_out,
+      bytes_in=bytes_in,
+      retries=retries,
+      rate_limit_wait=rate_limit_wait,
+      error=type(error).__name__ if error is not None else None,
+    )
+    if self._scope is not None and not self._scope.closed and error is None:
+      self._scope.hold(self, event, received)
+    else:
+      self.instrumentation.emit(event)
+
+  def add_decode_time(self, seconds: float) -> None:
+    self.decode_time = (self.decode_time or 0.0) + seconds
+
+
+def _scoped(func: Callable[..., Any]) -> Callable[..., Any]:
+  if inspect.iscoroutinefunction(func):
+
+    @functools.wraps(func)
+    async def acall(self: Any, *args: Any, **kwargs: Any) -> Any:
+      if not self._instrumentation.active or _current_scope() is not None:
+        return await func(self, *args, **kwargs)
+      scope = _CallScope()
+      token = _scope.set(scope)
+      try:
+        return await func(self, *args, **kwargs)
+      finally:
+        _scope.reset(token)
+        scope.close()
+
+    return acall
+
+  @functools.wraps(func)
+  def call(self: Any, *args: Any, **kwargs: Any) -> Any:
+    if not self._instrumentation.active or _current_scope() is not None:
+      return func(self, *args, **kwargs)
+    scope = _CallScope()
+    token = _scope.set(scope)
+    try:
+      return func(self, *args, **kwargs)
+    finally:
+      _scope.reset(token)
+      scope.close()
+
+  return call
+
+
+@functools.cache
+def instrumented_resource(cls: type[T]) -> type[T]:
+  """Subclass of a resource class whose public methods open a call scope.
+
+  Instances take an extra ``instrumentation`` keyword. While it is active,
+  calls made inside the scope are emitted when the method returns (or the
+  next call starts), so their events include ``parse_time``.
+  """
+
+  def __init__(self: Any, *args: Any, instrumentation: Instrumentation, **kwargs: Any) -> None:
+    cls.__init__(self, *args, **kwargs)  # type: ignore[misc]
+    self._instrumentation = instrumentation
+
+  namespace: dict[str, Any] = {
+    '__module__': cls.__module__,
+    '__qualname__': cls.__qualname__,
+    '__init__': __init__,
+  }
+  for name in dir(cls):
+    attr = getattr(cls, name)
+    if name.startswith('_') or not inspect.isfunction(attr):
+      continue
+    if inspect.isgeneratorfunction(attr) or inspect.isasyncgenfunction(attr):
+      continue
+    namespace[name] = _scoped(attr)
+  return type(cls.__name__, (cls,), namespace)
+
+
+class Profile:
+  """Network, JSON decode and validation time of the calls made during a profile.
+
+  Sums are over calls. Concurrent calls overlap on the network while
+  decoding and validation share one interpreter, so judge the sums against
+  ``wall``, the duration of the profiled block: ``cpu_share`` near 1 means
+  parsing is the bottleneck and more concurrency will not help.
+
+  Usage:
+    with client.profile() as profile:
+      client.search.jql('project = PROJ', max_results=100)
+    print(profile.report())
+  """
+
+  def __init__(self) -> None:
+    self.calls: list[CallEvent] = []
+    self._lock = threading.Lock()
+    self._started = time.perf_counter()
+    self._ended: float | None = None
+
+  def __call__(self, event: CallEvent) -> None:
+    with self._lock:
+      self.calls.append(event)
+
+  def close(self) -> None:
+    self._ended = time.perf_counter()
+
+  @property
+  def wall(self) -> float:
+    return (self._ended or time.perf_counter()) - self._started
+
+  @property
+  def network(self) -> float:
+    return sum(event.network_time for event in self.calls)
+
+  @property
+  def rate_limit_wait(self) -> float:
+    return sum(event.rate_limit_wait for event in self.calls)
+
+  @property
+  def decode(self) -> float:
+    return sum(event.decode_time or 0.0 for event in self.calls)
+
+  @property
+  def validation(self) -> float:
+    return sum(event.validation_time or 0.0 for event in self.calls)
+
+  @property
+  def cpu_share(self) -> float:
+    """Fraction of the wall time spent decoding and validating."""
+    wall = self.wall
+    return min(1.0, (self.decode + self.validation) / wall) if wall else 0.0
+
+  @property
+  def bound(self) -> str:
+    """``'cpu'`` when parsing took at least half the wall time, else ``'io'``."""
+    return 'cpu' if self.cpu_share >= 0.5 else 'io'
+
+  def by_endpoint(self) -> list[dict[str, Any]]:
+    """Per ``(method, endpoint)`` totals, most network time first."""
+    rows: dict[tuple[str, str], dict[str, Any]] = {}
+    for event in self.calls:
+      row = rows.setdefault((event.method, event.endpoint), {
+        'method': event.method,
+        'endpoint': event.endpoint,
+        'calls': 0,
+        'network': 0.0,
+        'decode': 0.0,
+        'validation': 0.0,
+        'bytes_in': 0,
+      })
+      row['calls'] += 1
+      row['network'] += event.network_time
+      row['decode'] += event.decode_time or 0.0
+      row['validation'] += event.validation_time or 0.0
+      row['bytes_in'] += event.bytes_in
+    return sorted(rows.values(), key=lambda row: row['network'], reverse=True)
+
+  def report(self) -> str:
+    lines = [
+      f'{len(self.calls)} calls in {self.wall * 1000:.1f} ms wall: '
+      f'network {self.network * 1000:.1f} ms, decode {self.decode * 1000:.1f} ms, '
+      f'validation {self.validation * 1000:.1f} ms ({self.bound}-bound, {self.cpu_share:.0%} parsing)',
+    ]
+    for row in self.by_endpoint():
+      lines.append(
+        f'  {row["method"]:<6} {row["endpoint"]:<50} {row["calls"]:>5}  '
+        f'net {row["network"] * 1000:>9.1f} ms  json {row["decode"] * 1000:>8.1f} ms  '
+        f'validate {row["validation"] * 1000:>8.1f} ms'
+      )
+    return '\n'.join(lines)
+
+
+class PrometheusSink:
+  """Sink exporting call events to ``prometheus_client`` metrics.
+
+  Records ``<prefix>_request_duration_seconds`` and
+  ``<prefix>_parse_duration_seconds`` histograms, ``<prefix>_response_bytes``
+  and ``<prefix>_retries`` counters, labelled by method, endpoint and
+  status.
+  """
+
+  def __init__(self, *, prefix: str = 'pyjira', registry: Any = None) -> None:
+    try:
+      import prometheus_client
+    except ImportError:
+      raise ImportError('PrometheusSink needs prometheus_client (pip install prometheus-client)') from None
+    labels = ['method', 'endpoint', 'status']
+    options: dict[str, Any] = {} if registry is None else {'registry': registry}
+    self._duration = prometheus_client.Histogram(
+      f'{prefix}_request_duration_seconds', 'Jira API call duration', labels, **options,
+    )
+    self._parse = prometheus_client.Histogram(
+      f'{prefix}_parse_duration_seconds', 'Time spent parsing Jira API responses', labels, **options,
+    )
+    self._bytes = prometheus_client.Counter(
+      f'{prefix}_response_bytes', 'Jira API response body bytes', labels, **options,
+    )
+    self._retries = prometheus_client.Counter(
+      f'{prefix}_retries', 'Jira API call retries', labels, **options,
+    )
+
+  def __call__(self, event: CallEvent) -> None:
+    labels = (event.method, event.endpoint, str(event.status or event.error))
+    self._duration.labels(*labels).observe(event.duration)
+    if event.parse_time is not None:
+      self._parse.labels(*labels).observe(event.parse_time)
+    self._bytes.labels(*labels).inc(event.bytes_in)
+    if event.retries:
+      self._retries.labels(*labels).inc(event.retries)
+
+
+class OpenTelemetrySink:
+  """Sink recording call events on an OpenTelemetry ``Meter``.
+
+  Usage:
+    from opentelemetry import metrics
+    instrumentation.add_sink(OpenTelemetrySink(metrics.get_meter('pyjira')))
+  """
+
+  def __init__(self, meter: Any, *, prefix: str = 'jira.client') -> None:
+    self._duration = meter.create_histogram(f'{prefix}.duration', unit='s', description='Jira API call duration')
+    self._parse = meter.create_histogram(f'{prefix}.parse_duration', unit='s', description='Response parse time')
+    self._bytes = meter.create_counter(f'{prefix}.response.size', unit='By', description='Response body bytes')
+    self._retries = meter.create_counter(f'{prefix}.retries', description='Jira API call retries')
+
+  def __call__(self, event: CallEvent) -> None:
+    attributes: dict[str, Any] = {'http.request.method': event.method, 'url.template': event.endpoint}
+    if event.status is not None:
+      attributes['http.response.status_code'] = event.status
+    if event.error is not None:
+      attributes['error.type'] = event.error
+    self._duration.record(event.duration, attributes)
+    if event.parse_time is not None:
+      self._parse.record(event.parse_time, attributes)
+    self._bytes.add(event.bytes_in, attributes)
+    if event.retries:
+      self._retries.add(event.retries, attributes)
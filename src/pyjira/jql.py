@@ -0,0 +1,534 @@
+from __future__ import annotations
+
+import re
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime, timedelta, tzinfo
+from typing import TYPE_CHECKING, Any
+
+from pyjira.models.issue import Issue
+
+if TYPE_CHECKING:
+  from pyjira.resources.search import AsyncSearchResource, SearchResource
+
+
+class UnsupportedJQLError(ValueError):
+  """Raised when a query uses JQL the local evaluator cannot run."""
+
+
+# ── Tokenizer ──────────────────────────────────────────────────────────
+
+_TOKEN = re.compile(
+  r'''\s*(?:
+    (?P<string>"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*')
+    | (?P<op>!=|!~|>=|<=|=|~|>|<)
+    | (?P<punct>[(),])
+    | (?P<word>[^\s=!~<>(),"']+)
+  )''',
+  re.VERBOSE,
+)
+
+
+@dataclass(frozen=True)
+class _Token:
+  kind: str
+  text: str
+  quoted: bool = False
+
+
+def _tokenize(jql: str) -> list[_Token]:
+  tokens: list[_Token] = []
+  pos = 0
+  jql = jql.strip()
+  while pos < len(jql):
+    match = _TOKEN.match(jql, pos)
+    if not match or match.end() == pos:
+      raise UnsupportedJQLError(f'Cannot tokenize JQL at: {jql[pos:pos + 20]!r}')
+    pos = match.end()
+    kind = match.lastgroup or ''
+    text = match.group(kind)
+    if kind == 'string':
+      tokens.append(_Token('word', re.sub(r'\\(.)', r'\1', text[1:-1]), quoted=True))
+    else:
+      tokens.append(_Token(kind, text))
+  return tokens
+
+
+_ORDER_BY = re.compile(r'(?:^|\s)order\s+by\b', re.IGNORECASE)
+
+
+def strip_order_by(jql: str) -> str:
+  """Return ``jql`` without its ORDER BY clause, ignoring quoted text."""
+  for match in _ORDER_BY.finditer(jql):
+    prefix = jql[:match.start()]
+    if prefix.count('"') % 2 == 0 and prefix.count("'") % 2 == 0:
+      return prefix.strip()
+  return jql.strip()
+
+
+# ── Field access ───────────────────────────────────────────────────────
+
+def _attrs(obj: Any, *names: str) -> list[Any]:
+  if obj is None:
+    return []
+  if isinstance(obj, dict):
+    return [obj[n] for n in names if obj.get(n) is not None]
+  return [getattr(obj, n) for n in names if getattr(obj, n, None) is not None]
+
+
+def _named(items: list[Any] | None) -> list[Any]:
+  values: list[Any] = []
+  for item in items or []:
+    values.extend(_attrs(item, 'name', 'id') if not isinstance(item, str) else [item])
+  return values
+
+
+def _adf_text(node: Any) -> str:
+  if isinstance(node, str):
+    return node
+  if isinstance(node, dict):
+    return ' '.join(filter(None, [node.get('text', ''), _adf_text(node.get('content', []))]))
+  if isinstance(node, list):
+    return ' '.join(_adf_text(n) for n in node)
+  return ''
+
+
+def _flatten(value: Any) -> list[Any]:
+  if value is None:
+    return []
+  if isinstance(value, list):
+    return [v for item in value for v in _flatten(item)]
+  if isinstance(value, dict):
+    return _attrs(value, 'value', 'name', 'key', 'id', 'accountId', 'displayName')
+  return [value]
+
+
+def _user(name: str) -> Callable[[Issue], list[Any]]:
+  return lambda i: _attrs(getattr(i.fields, name, None), 'account_id', 'display_name', 'email_address')
+
+
+def _named_field(name: str) -> Callable[[Issue], list[Any]]:
+  return lambda i: _attrs(getattr(i.fields, name, None), 'name', 'id')
+
+
+def _scalar(name: str) -> Callable[[Issue], list[Any]]:
+  return lambda i: _attrs(i.fields, name)
+
+
+# Field name -> (kind, extractor). The first extracted value is the sort key.
+_FIELDS: dict[str, tuple[str, Callable[[Issue], list[Any]]]] = {
+  'key': ('key', lambda i: [i.key] if i.key else []),
+  'id': ('number', lambda i: [int(i.id)] if i.id else []),
+  'project': ('name', lambda i: _attrs(i.fields and i.fields.project, 'key', 'name', 'id')),
+  'status': ('name', _named_field('status')),
+  'statuscategory': ('name', lambda i: _attrs(
+    i.fields and i.fields.status and i.fields.status.status_category, 'name', 'key', 'id',
+  )),
+  'priority': ('name', _named_field('priority')),
+  'issuetype': ('name', _named_field('issuetype')),
+  'resolution': ('name', _named_field('resolution')),
+  'assignee': ('name', _user('assignee')),
+  'reporter': ('name', _user('reporter')),
+  'creator': ('name', _user('creator')),
+  'labels': ('name', lambda i: list(i.fields.labels or []) if i.fields else []),
+  'component': ('name', lambda i: _named(i.fields.components) if i.fields else []),
+  'fixversion': ('name', lambda i: _named(i.fields.fix_versions) if i.fields else []),
+  'affectedversion': ('name', lambda i: _named(i.fields.versions) if i.fields else []),
+  'parent': ('key', lambda i: _attrs(i.fields and i.fields.parent, 'key', 'id')),
+  'summary': ('text', _scalar('summary')),
+  'description': ('text', lambda i: [t] if i.fields and (t := _adf_text(i.fields.description)) else []),
+  'text': ('text', lambda i: [
+    ' '.join(filter(None, [i.fields.summary, _adf_text(i.fields.description)]))
+  ] if i.fields else []),
+  'created': ('date', _scalar('created')),
+  'updated': ('date', _scalar('updated')),
+  'resolved': ('date', _scalar('resolution_date')),
+  'duedate': ('date', _scalar('due_date')),
+}
+
+_ALIASES = {
+  'issuekey': 'key',
+  'issue': 'key',
+  'type': 'issuetype',
+  'resolutiondate': 'resolved',
+  'due': 'duedate',
+  'fixversions': 'fixversion',
+  'affectedversions': 'affectedversion',
+  'components': 'component',
+  'label': 'labels',
+}
+
+_CUSTOM_FIELD = re.compile(r'^(?:cf\[(\d+)\]|customfield_(\d+))$', re.IGNORECASE)
+
+_OPERATORS: dict[str, set[str]] = {
+  'key': {'=', '!=', 'in', 'not in', '>', '>=', '<', '<=', 'is', 'is not'},
+  'number': {'=', '!=', 'in', 'not in', '>', '>=', '<', '<=', 'is', 'is not'},
+  'name': {'=', '!=', 'in', 'not in', 'is', 'is not'},
+  'text': {'~', '!~', 'is', 'is not'},
+  'date': {'=', '!=', '>', '>=', '<', '<=', 'is', 'is not', 'in', 'not in'},
+  'custom': {'=', '!=', 'in', 'not in', '>', '>=', '<', '<=', '~', '!~', 'is', 'is not'},
+}
+
+
+def _resolve_field(name: str) -> tuple[str, str, Callable[[Issue], list[Any]]]:
+  lowered = name.lower().replace(' ', '')
+  lowered = _ALIASES.get(lowered, lowered)
+  if lowered in _FIELDS:
+    kind, extract = _FIELDS[lowered]
+    return lowered, kind, extract
+  match = _CUSTOM_FIELD.match(name)
+  if match:
+    field_id = f'customfield_{match.group(1) or match.group(2)}'
+    return field_id, 'custom', lambda i: _flatten((i.fields.model_extra or {}).get(field_id) if i.fields else None)
+  raise UnsupportedJQLError(f'Field {name!r} is not supported locally')
+
+
+# ── Value coercion ─────────────────────────────────────────────────────
+
+_RELATIVE = re.compile(r'^([+-]?)(\d+)([wdhm])$', re.IGNORECASE)
+_UNITS = {'w': 'weeks', 'd': 'days', 'h': 'hours', 'm': 'minutes'}
+_DATE_FORMATS = ('%Y-%m-%d %H:%M', '%Y/%m/%d %H:%M', '%Y-%m-%d', '%Y/%m/%d')
+
+
+def _to_datetime(value: Any, tz: tzinfo) -> datetime | None:
+  if isinstance(value, datetime):
+    return value if value.tzinfo else value.replace(tzinfo=tz)
+  if isinstance(value, date):
+    return datetime(value.year, value.month, value.day, tzinfo=tz)
+  text = str(value).strip()
+  relative = _RELATIVE.match(text)
+  if relative:
+    sign, amount, unit = relative.groups()
+    delta = timedelta(**{_UNITS[unit.lower()]: int(amount)})
+    return datetime.now(tz) - delta if sign == '-' else datetime.now(tz) + delta
+  for fmt in _DATE_FORMATS:
+    try:
+      return datetime.strptime(text, fmt).replace(tzinfo=tz)
+    except ValueError:
+      continue
+  try:
+    parsed = datetime.fromisoformat(text)
+  except ValueError:
+    return None
+  return parsed if parsed.tzinfo else parsed.replace(tzinfo=tz)
+
+
+def _key_order(value: Any) -> tuple[str, int] | None:
+  project, _, number = str(value).upper().rpartition('-')
+  return (project, int(number)) if project and number.isdigit() else None
+
+
+def _to_number(value: Any) -> float | None:
+  try:
+    return float(value)
+  except (TypeError, ValueError):
+    return None
+
+
+def _comparable(kind: str, value: Any, tz: tzinfo) -> Any:
+  if kind == 'date':
+    return _to_datetime(value, tz)
+  if kind == 'key':
+    return _key_order(value)
+  if kind == 'number':
+    return _to_number(value)
+  if kind == 'custom':
+    number = _to_number(value)
+    return (0, number) if number is not None else (1, str(value).casefold())
+  return str(value).casefold()
+
+
+# ── AST ────────────────────────────────────────────────────────────────
+
+_EMPTY = object()
+
+
+@dataclass(frozen=True)
+class Clause:
+  field: str
+  operator: str
+  values: tuple[Any, ...]
+  kind: str
+  extract: Callable[[Issue], list[Any]] = field(compare=False, repr=False)
+
+  def matches(self, issue: Issue, tz: tzinfo) -> bool:
+    found = self.extract(issue)
+    op = self.operator
+    if op == 'is':
+      return not found
+    if op == 'is not':
+      return bool(found)
+    wants_empty = any(v is _EMPTY for v in self.values)
+    targets = [v for v in self.values if v is not _EMPTY]
+    if op in ('=', 'in'):
+      return (wants_empty and not found) or any(self._equal(f, t, tz) for f in found for t in targets)
+    if op in ('!=', 'not in'):
+      if wants_empty and not found:
+        return False
+      return bool(found) and not any(self._equal(f, t, tz) for f in found for t in targets)
+    if op in ('~', '!~'):
+      contains = any(self._contains(f, t) for f in found for t in targets)
+      return contains if op == '~' else bool(found) and not contains
+    return any(self._compare(f, t, tz) for f in found for t in targets)
+
+  def _equal(self, found: Any, target: Any, tz: tzinfo) -> bool:
+    if self.kind == 'custom' and not isinstance(found, str):
+      return _to_number(found) == _to_number(target)
+    if self.kind in ('date', 'key', 'number'):
+      a, b = _comparable(self.kind, found, tz), _comparable(self.kind, target, tz)
+      if self.kind == 'key' and (a is None or b is None):
+        return str(found).casefold() == str(target).casefold()
+      return a is not None and a == b
+    return str(found).casefold() == str(target).casefold()
+
+  @staticmethod
+  def _contains(found: Any, target: Any) -> bool:
+    haystack = str(found).casefold()
+    terms = str(target).replace('*', '').casefold().split()
+    return bool(terms) and all(term in haystack for term in terms)
+
+  def _compare(self, found: Any, target: Any, tz: tzinfo) -> bool:
+    a, b = _comparable(self.kind, found, tz), _comparable(self.kind, target, tz)
+    if a is None or b is None:
+      return False
+    if self.kind == 'key' and a[0] != b[0]:
+      return False
+    op = self.operator
+    return (
+      (op == '>' and a > b) or (op == '>=' and a >= b)
+      or (op == '<' and a < b) or (op == '<=' and a <= b)
+    )
+
+
+@dataclass(frozen=True)
+class BoolOp:
+  operator: str  # 'and' | 'or'
+  operands: tuple[Node, ...]
+
+  def matches(self, issue: Issue, tz: tzinfo) -> bool:
+    if self.operator == 'and':
+      return all(o.matches(issue, tz) for o in self.operands)
+    return any(o.matches(issue, tz) for o in self.operands)
+
+
+@dataclass(frozen=True)
+class Not:
+  operand: Node
+
+  def matches(self, issue: Issue, tz: tzinfo) -> bool:
+    return not self.operand.matches(issue, tz)
+
+
+Node = Clause | BoolOp | Not
+
+
+@dataclass(frozen=True)
+class SortKey:
+  field: str
+  descending: bool
+  kind: str
+  extract: Callable[[Issue], list[Any]] = field(compare=False, repr=False)
+
+
+@dataclass(frozen=True)
+class Query:
+  """A parsed JQL query that can be evaluated against local issues."""
+
+  where: Node | None
+  order_by: tuple[SortKey, ...] = ()
+  time_zone: tzinfo = UTC
+
+  def matches(self, issue: Issue) -> bool:
+    return self.where is None or self.where.matches(issue, self.time_zone)
+
+  def filter(self, issues: Iterable[Issue]) -> list[Issue]:
+    """Return matching issues, ordered by ORDER BY (nulls last) or input order."""
+    results = [i for i in issues if self.matches(i)]
+    for sort in reversed(self.order_by):
+      keyed = [(self._sort_value(sort, i), i) for i in results]
+      present = [pair for pair in keyed if pair[0] is not None]
+      present.sort(key=lambda pair: pair[0], reverse=sort.descending)
+      results = [i for _, i in present] + [i for v, i in keyed if v is None]
+    return results
+
+  def _sort_value(self, sort: SortKey, issue: Issue) -> Any:
+    values = sort.extract(issue)
+    return _comparable(sort.kind, values[0], self.time_zone) if values else None
+
+
+# ── Parser ─────────────────────────────────────────────────────────────
+
+class _Parser:
+  def __init__(self, tokens: list[_Token]) -> None:
+    self._tokens = tokens
+    self._pos = 0
+
+  def _peek(self, offset: int = 0) -> _Token | None:
+    index = self._pos + offset
+    return self._tokens[index] if index < len(self._tokens) else None
+
+  def _keyword(self, *words: str, offset: int = 0) -> bool:
+    token = self._peek(offset)
+    return token is not None and token.kind == 'word' and not token.quoted and token.text.lower() in words
+
+  def _take(self) -> _Token:
+    token = self._peek()
+    if token is None:
+      raise UnsupportedJQLError('Unexpected end of JQL')
+    self._pos += 1
+    return token
+
+  def _expect_punct(self, text: str) -> None:
+    token = self._take()
+    if token.kind != 'punct' or token.text != text:
+      raise UnsupportedJQLError(f'Expected {text!r}, got {token.text!r}')
+
+  def parse(self) -> tuple[Node | None, tuple[SortKey, ...]]:
+    where = None
+    if self._peek() is not None and not (self._keyword('order') and self._keyword('by', offset=1)):
+      where = self._or()
+    order_by: list[SortKey] = []
+    if self._keyword('order'):
+      self._take()
+      if not self._keyword('by'):
+        raise UnsupportedJQLError('Expected BY after ORDER')
+      self._take()
+      while True:
+        name, kind, extract = _resolve_field(self._take().text)
+        if kind == 'text':
+          raise UnsupportedJQLError(f'Cannot order by {name!r} locally')
+        descending = False
+        if self._keyword('asc', 'desc'):
+          descending = self._take().text.lower() == 'desc'
+        order_by.append(SortKey(name, descending, kind, extract))
+        if self._peek() is None or self._peek().text != ',':
+          break
+        self._take()
+    if self._peek() is not None:
+      raise UnsupportedJQLError(f'Unexpected token {self._peek().text!r}')
+    return where, tuple(order_by)
+
+  def _or(self) -> Node:
+    operands = [self._and()]
+    while self._keyword('or'):
+      self._take()
+      operands.append(self._and())
+    return operands[0] if len(operands) == 1 else BoolOp('or', tuple(operands))
+
+  def _and(self) -> Node:
+    operands = [self._not()]
+    while self._keyword('and'):
+      self._take()
+      operands.append(self._not())
+    return operands[0] if len(operands) == 1 else BoolOp('and', tuple(operands))
+
+  def _not(self) -> Node:
+    token = self._peek()
+    if self._keyword('not'):
+      self._take()
+      return Not(self._not())
+    if token is not None and token.kind == 'punct' and token.text == '(':
+      self._take()
+      node = self._or()
+      self._expect_punct(')')
+      return node
+    return self._clause()
+
+  def _clause(self) -> Clause:
+    name, kind, extract = _resolve_field(self._take().text)
+    operator = self._operator()
+    if operator not in _OPERATORS[kind]:
+      raise UnsupportedJQLError(f'Operator {operator!r} is not supported locally for {name!r}')
+    if operator in ('in', 'not in'):
+      self._expect_punct('(')
+      values = [self._value()]
+      while self._peek() is not None and self._peek().text == ',':
+        self._take()
+        values.append(self._value())
+      self._expect_punct(')')
+    else:
+      values = [self._value()]
+    if operator in ('is', 'is not') and values != [_EMPTY]:
+      raise UnsupportedJQLError('IS / IS NOT only support EMPTY or NULL')
+    return Clause(name, operator, tuple(values), kind, extract)
+
+  def _operator(self) -> str:
+    token = self._take()
+    if token.kind == 'op':
+      return token.text
+    word = token.text.lower() if not token.quoted else ''
+    if word == 'in':
+      return 'in'
+    if word == 'not' and self._keyword('in'):
+      self._take()
+      return 'not in'
+    if word == 'is':
+      if self._keyword('not'):
+        self._take()
+        return 'is not'
+      return 'is'
+    raise UnsupportedJQLError(f'Operator {token.text!r} is not supported locally')
+
+  def _value(self) -> Any:
+    token = self._take()
+    if token.kind != 'word':
+      raise UnsupportedJQLError(f'Unexpected {token.text!r} in value position')
+    next_token = self._peek()
+    if not token.quoted and next_token is not None and next_token.text == '(':
+      raise UnsupportedJQLError(f'Function {token.text}() is not supported locally')
+    if not token.quoted and token.text.lower() in ('empty', 'null'):
+      return _EMPTY
+    return token.text
+
+
+def parse(jql: str, *, time_zone: tzinfo = UTC) -> Query:
+  """Parse JQL for local evaluation.
+
+  Supports field clauses with ``= != ~ !~ > >= < <= IN NOT IN IS IS NOT``,
+  ``AND``/``OR``/``NOT``, parentheses and ``ORDER BY``. Dates without an
+  offset are read in ``time_zone``. Functions, history operators (``WAS``,
+  ``CHANGED``) and unknown fields raise ``UnsupportedJQLError``.
+  """
+  where, order_by = _Parser(_tokenize(jql)).parse()
+  return Query(where, order_by, time_zone)
+
+
+def evaluate(jql: str, issues: Iterable[Issue], *, time_zone: tzinfo = UTC) -> list[Issue]:
+  """Filter and order a local issue collection with JQL."""
+  return parse(jql, time_zone=time_zone).filter(issues)
+
+
+def search_with_fallback(
+  search: SearchResource,
+  jql: str,
+  issues: Iterable[Issue],
+  *,
+  time_zone: tzinfo = UTC,
+  **kwargs: Any,
+) -> list[Issue]:
+  """Evaluate JQL over ``issues`` locally, or run it on the server if unsupported.
+
+  ``issues`` must already hold every issue the query could match. Extra
+  keyword arguments are passed to ``search.jql_paginated`` on fallback.
+  """
+  try:
+    query = parse(jql, time_zone=time_zone)
+  except UnsupportedJQLError:
+    return list(search.jql_paginated(jql, **kwargs))
+  return query.filter(issues)
+
+
+async def asearch_with_fallback(
+  search: AsyncSearchResource,
+  jql: str,
+  issues: Iterable[Issue],
+  *,
+  time_zone: tzinfo = UTC,
+  **kwargs: Any,
+) -> list[Issue]:
+  """Async counterpart of ``search_with_fallback``."""
+  try:
+    query = parse(jql, time_zone=time_zone)
+  except UnsupportedJQLError:
+    return [issue async for issue in search.jql_paginated(jql, **kwargs)]
+  return query.filter(issues)
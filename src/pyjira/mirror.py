@@ -0,0 +1,385 @@
+from __future__ import annotations
+
+import sqlite3
+import threading
+import time
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+from pyjira.jql import strip_order_by
+from pyjira.models.issue import Issue
+
+if TYPE_CHECKING:
+  from pyjira.client import AsyncJiraClient, JiraClient
+
+_SCHEMA = '''
+CREATE TABLE IF NOT EXISTS issues (
+  key TEXT PRIMARY KEY,
+  id TEXT,
+  project TEXT,
+  status TEXT,
+  updated TEXT,
+  data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS issues_project ON issues (project);
+CREATE INDEX IF NOT EXISTS issues_status ON issues (status);
+CREATE INDEX IF NOT EXISTS issues_updated ON issues (updated);
+CREATE TABLE IF NOT EXISTS scope_keys (
+  scope TEXT NOT NULL,
+  key TEXT NOT NULL,
+  PRIMARY KEY (scope, key)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+  scope TEXT PRIMARY KEY,
+  cursor TEXT,
+  last_reconciled REAL
+);
+'''
+
+_ORDER_COLUMNS = {'key', 'project', 'status', 'updated'}
+# Fields the mirror's indexed columns and cursor are read from.
+_STORED_FIELDS = ('project', 'status', 'updated')
+
+
+@dataclass
+class SyncStats:
+  """Summary of one mirror sync run."""
+
+  upserted: int = 0
+  deleted: int = 0
+  cursor: datetime | None = None
+  reconciled: bool = False
+
+
+def _updated(issue: Issue) -> datetime | None:
+  updated = issue.fields.updated if issue.fields else None
+  if updated is not None and updated.tzinfo is None:
+    updated = updated.replace(tzinfo=UTC)
+  return updated
+
+
+def _check_fields(fields: list[str] | None) -> None:
+  if not fields:
+    return
+  wildcard = '*all' in fields or '*navigable' in fields
+  missing = [name for name in _STORED_FIELDS if f'-{name}' in fields or not (wildcard or name in fields)]
+  if missing:
+    raise ValueError(f'fields must include {", ".join(missing)}: the mirror stores them')
+
+
+class _DeltaScan:
+  """Keyset walk over ``updated >=`` windows of a delta query.
+
+  Each page moves the window up to the minute of the newest issue on it
+  and starts again at offset 0, so an issue updated mid-scan (and so moved
+  to the end of the ordering) cannot shift an unseen issue past the page
+  boundary. Issues already seen at the same ``updated`` are dropped. Only
+  when a whole page falls within one minute does the scan page by offset
+  inside that minute.
+  """
+
+  def __init__(self, mirror: IssueMirror, scope: str, cursor: datetime | None) -> None:
+    self._mirror = mirror
+    self._scope = scope
+    self._seen: dict[str, datetime | None] = {}
+    self.jql = mirror._delta_jql(scope, cursor)
+    self.offset = 0
+    self.done = False
+
+  def advance(self, issues: list[Issue], total: int) -> list[Issue]:
+    """Record a fetched page; return the issues on it not stored yet."""
+    fresh = []
+    for issue in issues:
+      if issue.key and (issue.key not in self._seen or self._seen[issue.key] != _updated(issue)):
+        self._seen[issue.key] = _updated(issue)
+        fresh.append(issue)
+    latest = max((u for u in map(_updated, issues) if u is not None), default=None)
+    if not issues or self.offset + len(issues) >= total:
+      self.done = True
+    elif latest is not None and (jql := self._mirror._delta_jql(self._scope, latest, overlap=False)) != self.jql:
+      self.jql, self.offset = jql, 0
+    else:
+      self.offset += len(issues)
+    return fresh
+
+
+def _utc_text(value: datetime) -> str:
+  if value.tzinfo is None:
+    value = value.replace(tzinfo=UTC)
+  return value.astimezone(UTC).strftime('%Y-%m-%dT%H:%M:%S.%f')
+
+
+class IssueMirror:
+  """Local SQLite mirror of issues kept current with incremental JQL syncs.
+
+  Each JQL passed to ``sync`` is a scope with its own ``updated`` cursor.
+  Subsequent syncs only fetch issues updated since the cursor, and deleted
+  or moved issues are dropped by periodic key reconciliation. Reads through
+  ``get``/``query`` never touch the network.
+
+  Usage:
+    mirror = IssueMirror('issues.db')
+    mirror.sync(client, 'project = PROJ')
+    open_bugs = mirror.query(project='PROJ', status=['Open', 'Reopened'])
+  """
+
+  def __init__(
+    self,
+    path: str | Path = ':memory:',
+    *,
+    reconcile_every: timedelta | None = timedelta(hours=24),
+    overlap: timedelta = timedelta(minutes=1),
+  ) -> None:
+    self.reconcile_every = reconcile_every
+    self.overlap = overlap
+    self._time_zone: ZoneInfo | None = None
+    self._lock = threading.Lock()
+    self._db = sqlite3.connect(str(path), check_same_thread=False)
+    self._db.executescript(_SCHEMA)
+
+  # ── Sync ───────────────────────────────────────────────────────────
+
+  def sync(
+    self,
+    client: JiraClient,
+    jql: str,
+    *,
+    page_size: int = 100,
+    fields: list[str] | None = None,
+    reconcile: bool | None = None,
+  ) -> SyncStats:
+    """Pull issues matching ``jql`` updated since the last sync of this scope.
+
+    ``fields`` narrows what is fetched but must keep ``project``,
+    ``status`` and ``updated``.
+    """
+    _check_fields(fields)
+    scope = self._scope(jql)
+    if self._time_zone is None:
+      self._time_zone = self._resolve_zone(client.users.myself().time_zone)
+    stats = SyncStats(cursor=self.cursor(scope))
+    scan = _DeltaScan(self, scope, stats.cursor)
+    while not scan.done:
+      results = client.search.jql(scan.jql, start_at=scan.offset, max_results=page_size, fields=fields)
+      self._store(scope, scan.advance(results.issues, results.total), stats)
+    self._save_cursor(scope, stats.cursor)
+
+    if self._reconcile_due(scope, reconcile):
+      keys = [i.key for i in client.search.jql_paginated(scope, page_size=page_size, fields=['updated']) if i.key]
+      stats.deleted = self._reconcile(scope, keys)
+      stats.reconciled = True
+    return stats
+
+  async def sync_async(
+    self,
+    client: AsyncJiraClient,
+    jql: str,
+    *,
+    page_size: int = 100,
+    fields: list[str] | None = None,
+    reconcile: bool | None = None,
+  ) -> SyncStats:
+    """Async counterpart of ``sync``; database writes stay on the calling thread."""
+    _check_fields(fields)
+    scope = self._scope(jql)
+    if self._time_zone is None:
+      self._time_zone = self._resolve_zone((await client.users.myself()).time_zone)
+    stats = SyncStats(cursor=self.cursor(scope))
+    scan = _DeltaScan(self, scope, stats.cursor)
+    while not scan.done:
+      results = await client.search.jql(scan.jql, start_at=scan.offset, max_results=page_size, fields=fields)
+      self._store(scope, scan.advance(results.issues, results.total), stats)
+    self._save_cursor(scope, stats.cursor)
+
+    if self._reconcile_due(scope, reconcile):
+      keys = [i.key async for i in client.search.jql_paginated(scope, page_size=page_size, fields=['updated']) if i.key]
+      stats.deleted = self._reconcile(scope, keys)
+      stats.reconciled = True
+    return stats
+
+  def cursor(self, jql: str) -> datetime | None:
+    """Return the highest ``updated`` timestamp synced for a scope."""
+    with self._lock:
+      row = self._db.execute(
+        'SELECT cursor FROM sync_state WHERE scope = ?', (self._scope(jql),),
+      ).fetchone()
+    if not row or not row[0]:
+      return None
+    return datetime.fromisoformat(row[0]).replace(tzinfo=UTC)
+
+  # ── Local reads ────────────────────────────────────────────────────
+
+  def get(self, key: str) -> Issue | None:
+    with self._lock:
+      row = self._db.execute('SELECT data FROM issues WHERE key = ?', (key,)).fetchone()
+    return Issue.model_validate_json(row[0]) if row else None
+
+  def query(
+    self,
+    *,
+    project: str | None = None,
+    status: str | Sequence[str] | None = None,
+    updated_since: datetime | None = None,
+    scope: str | None = None,
+    order_by: str = 'updated',
+    descending: bool = True,
+    limit: int | None = None,
+  ) -> list[Issue]:
+    """Answer simple project/status/updated queries from the local store."""
+    if order_by not in _ORDER_COLUMNS:
+      raise ValueError(f'order_by must be one of {sorted(_ORDER_COLUMNS)}')
+    clauses: list[str] = []
+    args: list[object] = []
+    if project is not None:
+      clauses.append('project = ?')
+      args.append(project)
+    if status is not None:
+      statuses = [status] if isinstance(status, str) else list(status)
+      clauses.append(f'status IN ({", ".join("?" * len(statuses))})')
+      args.extend(statuses)
+    if updated_since is not None:
+      clauses.append('updated >= ?')
+      args.append(_utc_text(updated_since))
+    if scope is not None:
+      clauses.append('key IN (SELECT key FROM scope_keys WHERE scope = ?)')
+      args.append(self._scope(scope))
+    sql = 'SELECT data FROM issues'
+    if clauses:
+      sql += ' WHERE ' + ' AND '.join(clauses)
+    sql += f' ORDER BY {order_by} {"DESC" if descending else "ASC"}'
+    if limit is not None:
+      sql += ' LIMIT ?'
+      args.append(limit)
+    with self._lock:
+      rows = self._db.execute(sql, args).fetchall()
+    return [Issue.model_validate_json(row[0]) for row in rows]
+
+  def keys(self, scope: str | None = None) -> list[str]:
+    with self._lock:
+      if scope is None:
+        rows = self._db.execute('SELECT key FROM issues ORDER BY key').fetchall()
+      else:
+        rows = self._db.execute(
+          'SELECT key FROM scope_keys WHERE scope = ? ORDER BY key', (self._scope(scope),),
+        ).fetchall()
+    return [row[0] for row in rows]
+
+  def __len__(self) -> int:
+    with self._lock:
+      return self._db.execute('SELECT COUNT(*) FROM issues').fetchone()[0]
+
+  # ── Local writes ───────────────────────────────────────────────────
+
+  def upsert(self, issues: Iterable[Issue], *, scope: str | None = None) -> int:
+    rows = []
+    for issue in issues:
+      if not issue.key:
+        continue
+      fields = issue.fields
+      rows.append((
+        issue.key,
+        issue.id,
+        fields.project.key if fields and fields.project else None,
+        fields.status.name if fields and fields.status else None,
+        _utc_text(fields.updated) if fields and fields.updated else None,
+        issue.model_dump_json(by_alias=True, exclude_none=True),
+      ))
+    with self._lock, self._db:
+      self._db.executemany('INSERT OR REPLACE INTO issues VALUES (?, ?, ?, ?, ?, ?)', rows)
+      if scope is not None:
+        self._db.executemany(
+          'INSERT OR IGNORE INTO scope_keys VALUES (?, ?)',
+          [(self._scope(scope), row[0]) for row in rows],
+        )
+    return len(rows)
+
+  def delete(self, keys: Iterable[str]) -> int:
+    rows = [(k,) for k in keys]
+    with self._lock, self._db:
+      self._db.executemany('DELETE FROM scope_keys WHERE key = ?', rows)
+      return self._db.executemany('DELETE FROM issues WHERE key = ?', rows).rowcount
+
+  def close(self) -> None:
+    self._db.close()
+
+  def __enter__(self) -> IssueMirror:
+    return self
+
+  def __exit__(self, *args: object) -> None:
+    self.close()
+
+  # ── Internals ──────────────────────────────────────────────────────
+
+  @staticmethod
+  def _scope(jql: str) -> str:
+    return ' '.join(strip_order_by(jql).split())
+
+  @staticmethod
+  def _resolve_zone(name: str | None) -> ZoneInfo:
+    try:
+      return ZoneInfo(name or 'UTC')
+    except (ZoneInfoNotFoundError, ValueError):
+      return ZoneInfo('UTC')
+
+  def _delta_jql(self, scope: str, cursor: datetime | None, *, overlap: bool = True) -> str:
+    if cursor is None:
+      return f'({scope}) ORDER BY updated ASC, key ASC'
+    if overlap:
+      cursor -= self.overlap
+    # JQL dates are minute precision in the Jira user's time zone.
+    local = cursor.astimezone(self._time_zone or UTC)
+    return f'({scope}) AND updated >= "{local:%Y-%m-%d %H:%M}" ORDER BY updated ASC, key ASC'
+
+  def _store(self, scope: str, batch: list[Issue], stats: SyncStats) -> None:
+    if not batch:
+      return
+    stats.upserted += self.upsert(batch, scope=scope)
+    for issue in batch:
+      updated = _updated(issue)
+      if updated is not None and (stats.cursor is None or updated > stats.cursor):
+        stats.cursor = updated
+
+  def _save_cursor(self, scope: str, cursor: datetime | None) -> None:
+    with self._lock, self._db:
+      self._db.execute(
+        'INSERT INTO sync_state (scope, cursor) VALUES (?, ?) '
+        'ON CONFLICT (scope) DO UPDATE SET cursor = excluded.cursor',
+        (scope, _utc_text(cursor) if cursor else None),
+      )
+
+  def _reconcile_due(self, scope: str, reconcile: bool | None) -> bool:
+    if reconcile is not None:
+      return reconcile
+    if self.reconcile_every is None:
+      return False
+    with self._lock:
+      row = self._db.execute(
+        'SELECT last_reconciled FROM sync_state WHERE scope = ?', (scope,),
+      ).fetchone()
+    last = row[0] if row else None
+    return last is None or time.time() - last >= self.reconcile_every.total_seconds()
+
+  def _reconcile(self, scope: str, server_keys: Iterable[str]) -> int:
+    """Drop scope members missing on the server and any issue left without a scope."""
+    with self._lock, self._db:
+      self._db.execute('CREATE TEMP TABLE IF NOT EXISTS live_keys (key TEXT PRIMARY KEY)')
+      self._db.execute('DELETE FROM live_keys')
+      self._db.executemany('INSERT OR IGNORE INTO live_keys VALUES (?)', [(k,) for k in server_keys])
+      removed = [
+        row[0] for row in self._db.execute(
+          'SELECT key FROM scope_keys WHERE scope = ? AND key NOT IN (SELECT key FROM live_keys)',
+          (scope,),
+        )
+      ]
+      self._db.executemany('DELETE FROM scope_keys WHERE scope = ? AND key = ?', [(scope, k) for k in removed])
+      deleted = self._db.executemany(
+        'DELETE FROM issues WHERE key = ? AND key NOT IN (SELECT key FROM scope_keys)',
+        [(k,) for k in removed],
+      ).rowcount
+      self._db.execute('DELETE FROM live_keys')
+      self._db.execute('UPDATE sync_state SET last_reconciled = ? WHERE scope = ?', (time.time(), scope))
+    return deleted
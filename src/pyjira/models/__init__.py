@@ -1,86 +1,211 @@
-from pyjira.models.comment import Comment, Visibility
-from pyjira.models.common import (
-    AvatarUrls,
-    EntityProperty,
-    JiraModel,
-    PaginatedResponse,
-)
-from pyjira.models.component import Component, ComponentIssueCount
-from pyjira.models.dashboard import Dashboard, DashboardGadget, DashboardPage
-from pyjira.models.errors import ErrorResponse
-from pyjira.models.field import FieldDetail, FieldPage
-from pyjira.models.filter import Filter, FilterPage, SharePermission
-from pyjira.models.group import Group, GroupMembers
-from pyjira.models.issue import (
-    Attachment,
-    ChangeHistory,
-    ChangeItem,
-    Changelog,
-    ChangelogPage,
-    Issue,
-    IssueFields,
-    IssueType,
-    Priority,
-    PropertyKey,
-    RemoteIssueLink,
-    RemoteIssueLinkApplication,
-    RemoteIssueLinkIcon,
-    RemoteIssueLinkObject,
-    Resolution,
-    Status,
-    StatusCategory,
-    Transition,
-    Votes,
-    Watchers,
-    Worklog,
-    WorklogPage,
-)
-from pyjira.models.issue_link import IssueLink, IssueLinkType, LinkedIssue
-from pyjira.models.issuetype_full import IssueTypeDetail
-from pyjira.models.notification_scheme import (
-    NotificationScheme,
-    NotificationSchemePage,
-)
-from pyjira.models.permission import PermissionGrant, PermissionScheme
-from pyjira.models.priority_full import PriorityDetail, PriorityPage
-from pyjira.models.project import Project, ProjectCategory
-from pyjira.models.resolution_full import ResolutionDetail, ResolutionPage
-from pyjira.models.role import ProjectRole, RoleActor
-from pyjira.models.screen import (
-    Screen,
-    ScreenField,
-    ScreenPage,
-    ScreenScheme,
-    ScreenSchemePage,
-    ScreenTab,
-)
-from pyjira.models.search import SearchResults
-from pyjira.models.status_full import StatusDetail, StatusPage
-from pyjira.models.user import User
-from pyjira.models.version import Version
-from pyjira.models.workflow import (
-    Workflow,
-    WorkflowPage,
-    WorkflowScheme,
-    WorkflowStatus,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pyjira._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pyjira.models.bulk import BulkOperationProgress, BulkOperationSubmission
+    from pyjira.models.comment import Comment, Visibility
+    from pyjira.models.common import (
+        AvatarUrls,
+        EntityProperty,
+        JiraModel,
+        PaginatedResponse,
+    )
+    from pyjira.models.compact import (
+        CompactIssue,
+        CompactIssueFields,
+        CompactIssueType,
+        CompactModel,
+        CompactPriority,
+        CompactSearchResults,
+        CompactStatus,
+        CompactUser,
+    )
+    from pyjira.models.component import Component, ComponentIssueCount
+    from pyjira.models.dashboard import Dashboard, DashboardGadget, DashboardPage
+    from pyjira.models.errors import ErrorResponse
+    from pyjira.models.field import FieldDetail, FieldPage
+    from pyjira.models.filter import Filter, FilterPage, SharePermission
+    from pyjira.models.group import Group, GroupMembers
+    from pyjira.models.issue import (
+        Attachment,
+        ChangeHistory,
+        ChangeItem,
+        Changelog,
+        ChangelogPage,
+        Issue,
+        IssueFields,
+        IssueType,
+        Priority,
+        PropertyKey,
+        RemoteIssueLink,
+        RemoteIssueLinkApplication,
+        RemoteIssueLinkIcon,
+        RemoteIssueLinkObject,
+        Resolution,
+        Status,
+        StatusCategory,
+        Transition,
+        Votes,
+        Watchers,
+        Worklog,
+        WorklogPage,
+    )
+    from pyjira.models.issue_metadata import (
+        CreateMetaFieldPage,
+        CreateMetaIssueTypePage,
+        FieldMetadata,
+    )
+    from pyjira.models.issue_link import IssueLink, IssueLinkType, LinkedIssue
+    from pyjira.models.issuetype_full import IssueTypeDetail
+    from pyjira.models.notification_scheme import (
+        NotificationScheme,
+        NotificationSchemePage,
+    )
+    from pyjira.models.permission import PermissionGrant, PermissionScheme
+    from pyjira.models.priority_full import PriorityDetail, PriorityPage
+    from pyjira.models.project import Project, ProjectCategory
+    from pyjira.models.resolution_full import ResolutionDetail, ResolutionPage
+    from pyjira.models.role import ProjectRole, RoleActor
+    from pyjira.models.screen import (
+        Screen,
+        ScreenField,
+        ScreenPage,
+        ScreenScheme,
+        ScreenSchemePage,
+        ScreenTab,
+    )
+    from pyjira.models.search import SearchResults
+    from pyjira.models.status_full import StatusDetail, StatusPage
+    from pyjira.models.user import User
+    from pyjira.models.version import Version
+    from pyjira.models.workflow import (
+        Workflow,
+        WorkflowPage,
+        WorkflowScheme,
+        WorkflowStatus,
+    )
+
+# Public name -> defining module, imported on first attribute access.
+_EXPORTS: dict[str, str] = {
+    "Attachment": "pyjira.models.issue",
+    "AvatarUrls": "pyjira.models.common",
+    "BulkOperationProgress": "pyjira.models.bulk",
+    "BulkOperationSubmission": "pyjira.models.bulk",
+    "ChangeHistory": "pyjira.models.issue",
+    "ChangeItem": "pyjira.models.issue",
+    "Changelog": "pyjira.models.issue",
+    "ChangelogPage": "pyjira.models.issue",
+    "Comment": "pyjira.models.comment",
+    "CompactIssue": "pyjira.models.compact",
+    "CompactIssueFields": "pyjira.models.compact",
+    "CompactIssueType": "pyjira.models.compact",
+    "CompactModel": "pyjira.models.compact",
+    "CompactPriority": "pyjira.models.compact",
+    "CompactSearchResults": "pyjira.models.compact",
+    "CompactStatus": "pyjira.models.compact",
+    "CompactUser": "pyjira.models.compact",
+    "Component": "pyjira.models.component",
+    "ComponentIssueCount": "pyjira.models.component",
+    "CreateMetaFieldPage": "pyjira.models.issue_metadata",
+    "CreateMetaIssueTypePage": "pyjira.models.issue_metadata",
+    "Dashboard": "pyjira.models.dashboard",
+    "DashboardGadget": "pyjira.models.dashboard",
+    "DashboardPage": "pyjira.models.dashboard",
+    "EntityProperty": "pyjira.models.common",
+    "ErrorResponse": "pyjira.models.errors",
+    "FieldDetail": "pyjira.models.field",
+    "FieldMetadata": "pyjira.models.issue_metadata",
+    "FieldPage": "pyjira.models.field",
+    "Filter": "pyjira.models.filter",
+    "FilterPage": "pyjira.models.filter",
+    "Group": "pyjira.models.group",
+    "GroupMembers": "pyjira.models.group",
+    "Issue": "pyjira.models.issue",
+    "IssueFields": "pyjira.models.issue",
+    "IssueLink": "pyjira.models.issue_link",
+    "IssueLinkType": "pyjira.models.issue_link",
+    "IssueType": "pyjira.models.issue",
+    "IssueTypeDetail": "pyjira.models.issuetype_full",
+    "JiraModel": "pyjira.models.common",
+    "LinkedIssue": "pyjira.models.issue_link",
+    "NotificationScheme": "pyjira.models.notification_scheme",
+    "NotificationSchemePage": "pyjira.models.notification_scheme",
+    "PaginatedResponse": "pyjira.models.common",
+    "PermissionGrant": "pyjira.models.permission",
+    "PermissionScheme": "pyjira.models.permission",
+    "Priority": "pyjira.models.issue",
+    "PriorityDetail": "pyjira.models.priority_full",
+    "PriorityPage": "pyjira.models.priority_full",
+    "Project": "pyjira.models.project",
+    "ProjectCategory": "pyjira.models.project",
+    "ProjectRole": "pyjira.models.role",
+    "PropertyKey": "pyjira.models.issue",
+    "RemoteIssueLink": "pyjira.models.issue",
+    "RemoteIssueLinkApplication": "pyjira.models.issue",
+    "RemoteIssueLinkIcon": "pyjira.models.issue",
+    "RemoteIssueLinkObject": "pyjira.models.issue",
+    "Resolution": "pyjira.models.issue",
+    "ResolutionDetail": "pyjira.models.resolution_full",
+    "ResolutionPage": "pyjira.models.resolution_full",
+    "RoleActor": "pyjira.models.role",
+    "Screen": "pyjira.models.screen",
+    "ScreenField": "pyjira.models.screen",
+    "ScreenPage": "pyjira.models.screen",
+    "ScreenScheme": "pyjira.models.screen",
+    "ScreenSchemePage": "pyjira.models.screen",
+    "ScreenTab": "pyjira.models.screen",
+    "SearchResults": "pyjira.models.search",
+    "SharePermission": "pyjira.models.filter",
+    "Status": "pyjira.models.issue",
+    "StatusCategory": "pyjira.models.issue",
+    "StatusDetail": "pyjira.models.status_full",
+    "StatusPage": "pyjira.models.status_full",
+    "Transition": "pyjira.models.issue",
+    "User": "pyjira.models.user",
+    "Version": "pyjira.models.version",
+    "Visibility": "pyjira.models.comment",
+    "Votes": "pyjira.models.issue",
+    "Watchers": "pyjira.models.issue",
+    "Workflow": "pyjira.models.workflow",
+    "WorkflowPage": "pyjira.models.workflow",
+    "WorkflowScheme": "pyjira.models.workflow",
+    "WorkflowStatus": "pyjira.models.workflow",
+    "Worklog": "pyjira.models.issue",
+    "WorklogPage": "pyjira.models.issue",
+}
 
 __all__ = [
     "Attachment",
     "AvatarUrls",
+    "BulkOperationProgress",
+    "BulkOperationSubmission",
     "ChangeHistory",
     "ChangeItem",
     "Changelog",
     "ChangelogPage",
     "Comment",
+    "CompactIssue",
+    "CompactIssueFields",
+    "CompactIssueType",
+    "CompactModel",
+    "CompactPriority",
+    "CompactSearchResults",
+    "CompactStatus",
+    "CompactUser",
     "Component",
     "ComponentIssueCount",
+    "CreateMetaFieldPage",
+    "CreateMetaIssueTypePage",
     "Dashboard",
     "DashboardGadget",
     "DashboardPage",
     "EntityProperty",
     "ErrorResponse",
     "FieldDetail",
+    "FieldMetadata",
     "FieldPage",
     "Filter",
     "FilterPage",
@@ -139,3 +264,5 @@ __all__ = [
     "Worklog",
     "WorklogPage",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from pydantic import Field
+
+from pyjira.models.common import JiraModel
+
+
+class BulkOperationSubmission(JiraModel):
+  task_id: str | None = Field(None, alias='taskId')
+
+
+class BulkOperationProgress(JiraModel):
+  task_id: str | None = Field(None, alias='taskId')
+  status: str | None = None
+  progress_percent: int | None = Field(None, alias='progressPercent')
+  submitted_by: dict[str, str] | None = Field(None, alias='submittedBy')
+  created: datetime | None = None
+  started: datetime | None = None
+  updated: datetime | None = None
+  total_issue_count: int | None = Field(None, alias='totalIssueCount')
+  processed_accessible_issues: list[int] | None = Field(None, alias='processedAccessibleIssues')
+  failed_accessible_issues: dict[str, list[str]] | None = Field(None, alias='failedAccessibleIssues')
+  invalid_or_inaccessible_issue_count: int | None = Field(None, alias='invalidOrInaccessibleIssueCount')
+
+  @property
+  def is_finished(self) -> bool:
+    return self.status in {'COMPLETE', 'FAILED', 'CANCELLED', 'DEAD'}
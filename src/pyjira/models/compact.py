@@ -0,0 +1,93 @@
+"""Compact variants of the models repeated across many issues.
+
+Every issue carries its own ``User``, ``Status``, ``Priority`` and
+``IssueType`` objects even though a site only has a handful of distinct
+values. The ``Compact*`` subclasses here drop unknown keys instead of
+keeping them in ``__pydantic_extra__``, are frozen, and are interned:
+validating an equal value again returns the instance already in memory.
+``CompactIssue`` and ``CompactSearchResults`` use them for the issue's
+status, priority, issue type and people; custom fields are still kept as
+extras on ``CompactIssueFields``.
+
+Usage:
+  results = CompactSearchResults.model_validate(client.search.jql_raw('project = PROJ'))
+  index = {issue.key: issue for issue in results.issues}
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+from pydantic import ConfigDict, Field, ModelWrapValidatorHandler, model_validator
+
+from pyjira.models.common import AvatarUrls, JiraModel
+from pyjira.models.issue import Issue, IssueFields, IssueType, Priority, Status, StatusCategory
+from pyjira.models.search import SearchResults
+from pyjira.models.user import User
+
+# Interned instances live as long as something else refers to them.
+_interned: weakref.WeakValueDictionary[tuple[Any, ...], CompactModel] = weakref.WeakValueDictionary()
+
+
+class CompactModel(JiraModel):
+  """Frozen, interned model that ignores unknown keys."""
+
+  model_config = ConfigDict(extra='ignore', frozen=True)
+
+  @model_validator(mode='wrap')
+  @classmethod
+  def _intern(cls, data: Any, handler: ModelWrapValidatorHandler[Any]) -> Any:
+    instance = handler(data)
+    try:
+      key = (type(instance), frozenset(instance.__pydantic_fields_set__), *instance.__dict__.values())
+      return _interned.setdefault(key, instance)
+    except TypeError:
+      # A field holds an unhashable value; keep the instance as it is.
+      return instance
+
+
+class CompactAvatarUrls(AvatarUrls, CompactModel):
+  pass
+
+
+class CompactUser(User, CompactModel):
+  avatar_urls: CompactAvatarUrls | None = Field(None, alias='avatarUrls')
+
+
+class CompactStatusCategory(StatusCategory, CompactModel):
+  pass
+
+
+class CompactStatus(Status, CompactModel):
+  status_category: CompactStatusCategory | None = Field(None, alias='statusCategory')
+
+
+class CompactPriority(Priority, CompactModel):
+  pass
+
+
+class CompactIssueType(IssueType, CompactModel):
+  pass
+
+
+class CompactIssueFields(IssueFields):
+  status: CompactStatus | None = None
+  priority: CompactPriority | None = None
+  issuetype: CompactIssueType | None = None
+  assignee: CompactUser | None = None
+  reporter: CompactUser | None = None
+  creator: CompactUser | None = None
+  parent: CompactIssue | None = None
+  subtasks: list[CompactIssue] | None = None
+
+
+class CompactIssue(Issue):
+  fields: CompactIssueFields | None = None
+
+
+class CompactSearchResults(SearchResults):
+  issues: list[CompactIssue] = Field(default_factory=list)
+
+
+CompactIssueFields.model_rebuild()
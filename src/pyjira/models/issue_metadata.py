@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import Field
+
+from pyjira.models.common import JiraModel, PaginatedResponse
+from pyjira.models.issuetype_full import IssueTypeDetail
+
+
+class FieldMetadata(JiraModel):
+  field_id: str | None = Field(None, alias='fieldId')
+  key: str | None = None
+  name: str | None = None
+  required: bool | None = None
+  schema_info: Any | None = Field(None, alias='schema')
+  operations: list[str] | None = None
+  allowed_values: list[Any] | None = Field(None, alias='allowedValues')
+  has_default_value: bool | None = Field(None, alias='hasDefaultValue')
+  default_value: Any | None = Field(None, alias='defaultValue')
+  auto_complete_url: str | None = Field(None, alias='autoCompleteUrl')
+
+
+class CreateMetaIssueTypePage(PaginatedResponse):
+  issue_types: list[IssueTypeDetail] = Field(default_factory=list, alias='issueTypes')
+
+
+class CreateMetaFieldPage(PaginatedResponse):
+  fields: list[FieldMetadata] = Field(default_factory=list)
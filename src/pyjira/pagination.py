@@ -1,17 +1,333 @@
 from __future__ import annotations
 
-from collections.abc import AsyncIterator, Iterator
-from typing import Any, Callable, TypeVar
+import asyncio
+import json
+import threading
+import time
+from collections.abc import AsyncIterator, Awaitable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Generic, TypeVar
 
+import httpx
 from pydantic import BaseModel
 
+from pyjira.exceptions import CircuitOpenError, ServerError
+
 T = TypeVar('T', bound=BaseModel)
 
+# Failures that a smaller page may avoid (server-side time limits). An open
+# circuit is a ServerError too, but is re-raised before these are checked.
+_SHRINK_ON = (httpx.TimeoutException, ServerError)
+
+
+@dataclass(frozen=True)
+class PaginatorCheckpoint:
+  """Serializable paginator position.
+
+  ``start_at`` is the offset of the next item to yield; ``params`` records
+  the query the paginator was built for so a checkpoint is never resumed
+  against a different query. ``limit`` and ``yielded`` carry an item
+  limit across a resume: the resumed paginator yields only what is left
+  of it.
+  """
+
+  start_at: int
+  page_size: int
+  params: dict[str, Any] = field(default_factory=dict)
+  limit: int | None = None
+  yielded: int = 0
+
+  def to_dict(self) -> dict[str, Any]:
+    return asdict(self)
+
+  @classmethod
+  def from_dict(cls, data: dict[str, Any]) -> PaginatorCheckpoint:
+    return cls(
+      start_at=int(data['start_at']),
+      page_size=int(data['page_size']),
+      params=dict(data.get('params') or {}),
+      limit=None if data.get('limit') is None else int(data['limit']),
+      yielded=int(data.get('yielded') or 0),
+    )
+
+  def save(self, path: str | Path) -> None:
+    """Atomically write the checkpoint as JSON."""
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + '.tmp')
+    tmp.write_text(json.dumps(self.to_dict()))
+    tmp.replace(path)
+
+  @classmethod
+  def load(cls, path: str | Path) -> PaginatorCheckpoint | None:
+    """Read a checkpoint written by ``save``, or ``None`` if there is none."""
+    path = Path(path)
+    if not path.exists():
+      return None
+    return cls.from_dict(json.loads(path.read_text()))
+
+
+@dataclass
+class Page(Generic[T]):
+  """One page of results with its position in the full result set."""
+
+  items: list[T]
+  start_at: int
+  total: int
+
+  @property
+  def next_start(self) -> int:
+    return self.start_at + len(self.items)
+
+  def __len__(self) -> int:
+    return len(self.items)
+
+  def __iter__(self) -> Iterator[T]:
+    return iter(self.items)
+
+
+def _resume(checkpoint: PaginatorCheckpoint | None, params: dict[str, Any], limit: int | None) -> tuple[int, int]:
+  """Offset to resume at and items already yielded."""
+  if checkpoint is None:
+    return 0, 0
+  if checkpoint.params != params:
+    raise ValueError('Checkpoint was taken for a different query')
+  if checkpoint.limit != limit:
+    raise ValueError(f'Checkpoint was taken with limit={checkpoint.limit}, not limit={limit}')
+  return checkpoint.start_at, checkpoint.yielded
+
+
+class PageSizeTuner:
+  """Adapts ``maxResults`` between requests.
+
+  Full pages are scaled towards ``target_seconds`` of latency and
+  ``max_bytes`` of response body (when the fetcher reports sizes through
+  ``record_bytes``), by at most a factor of two per page. A full page that
+  comes back shorter than requested reveals the server's own cap, which
+  then bounds every later request. ``shrink`` halves the size after a
+  timeout or 5xx so the request can be retried with a smaller page.
+  """
+
+  def __init__(
+    self,
+    initial: int = 50,
+    *,
+    min_size: int = 10,
+    max_size: int = 1000,
+    target_seconds: float = 1.0,
+    max_bytes: int = 4_000_000,
+  ) -> None:
+    self.min_size = min_size
+    self.max_size = max_size
+    self.target_seconds = target_seconds
+    self.max_bytes = max_bytes
+    self.server_cap: int | None = None
+    self._size = self._clamp(initial)
+    self._bytes: int | None = None
+    self._lock = threading.Lock()
+
+  @property
+  def size(self) -> int:
+    return self._size
+
+  def _clamp(self, size: int) -> int:
+    upper = self.max_size if self.server_cap is None else min(self.max_size, self.server_cap)
+    return max(min(self.min_size, upper), min(size, upper))
+
+  def record_bytes(self, nbytes: int) -> None:
+    """Report the body size of the response being observed next."""
+    with self._lock:
+      self._bytes = nbytes
+
+  def observe(self, requested: int, returned: int, elapsed: float, *, final: bool) -> None:
+    with self._lock:
+      nbytes, self._bytes = self._bytes, None
+      if final or returned == 0:
+        return
+      if returned < requested:
+        self.server_cap = returned
+        self._size = self._clamp(self._size)
+        return
+      scale = self.target_seconds / max(elapsed, 1e-3)
+      if nbytes:
+        scale = min(scale, self.max_bytes / nbytes)
+      self._size = self._clamp(int(requested * min(2.0, max(0.5, scale))))
+
+  def shrink(self) -> bool:
+    """Halve the page size; ``False`` once already at ``min_size``."""
+    with self._lock:
+      smaller = self._clamp(self._size // 2)
+      if smaller >= self._size:
+        return False
+      self._size = smaller
+      return True
+
+
+def _tuner_for(adaptive: bool | PageSizeTuner, page_size: int, prefetch: int) -> PageSizeTuner | None:
+  if adaptive is False:
+    return None
+  if prefetch:
+    raise ValueError('Adaptive page sizes cannot be combined with prefetch')
+  return adaptive if isinstance(adaptive, PageSizeTuner) else PageSizeTuner(page_size)
+
+
+def _lookahead(
+  next_start: int,
+  stride: int,
+  page_size: int,
+  total: int,
+  stop: int | None,
+  count: int,
+) -> Iterator[tuple[int, int]]:
+  """Yield ``(offset, max_results)`` for up to ``count`` pages after ``next_start``."""
+  end = total if stop is None else min(total, stop)
+  for n in range(count):
+    offset = next_start + n * stride
+    if offset >= end:
+      return
+    yield offset, page_size if stop is None else min(page_size, stop - offset)
+
+
+class PrefetchingFetcher(Generic[T]):
+  """``Paginator`` fetch callable that requests the next pages in the background.
+
+  After each page, up to ``prefetch`` following pages are fetched on a
+  small thread pool, using the size of the page just returned (or the
+  requested size, with ``fixed_stride``) as the stride. With ``limit``
+  items still needed, only the pages that can still contribute to it are
+  prefetched (assuming full pages), and the last of them asks for only
+  the items left. A request that was not prefetched discards the
+  speculative pages, so results are always correct.
+  """
+
+  def __init__(
+    self,
+    fetch_page: Callable[[int, int], tuple[list[T], int]],
+    *,
+    prefetch: int = 1,
+    limit: int | None = None,
+    fixed_stride: bool = False,
+  ) -> None:
+    self._fetch_page = fetch_page
+    self._prefetch = max(1, prefetch)
+    self._left = limit
+    self._fixed_stride = fixed_stride
+    self._bound = 0
+    self._executor: ThreadPoolExecutor | None = None
+    self._pending: dict[tuple[int, int], Future[tuple[list[T], int]]] = {}
+
+  def __call__(self, start_at: int, max_results: int) -> tuple[list[T], int]:
+    future = self._pending.pop((start_at, max_results), None)
+    if future is None:
+      self._cancel_pending()
+      items, total = self._fetch_page(start_at, max_results)
+    else:
+      items, total = future.result()
+
+    if self._left is not None:
+      self._left -= len(items)
+    if self._fixed_stride:
+      total = self._bound = max(total, self._bound)
+    stride = max_results if self._fixed_stride else len(items)
+    next_start = start_at + stride
+    if (not items and not self._fixed_stride) or next_start >= total or (self._left is not None and self._left <= 0):
+      self.close()
+      return items, total
+    # Offsets and items advance together one page at a time, so the items
+    # still needed bound the pages ahead with either stride.
+    stop = None if self._left is None else next_start + self._left
+
+    if self._executor is None:
+      self._executor = ThreadPoolExecutor(max_workers=self._prefetch, thread_name_prefix='pyjira-prefetch')
+    for offset, size in _lookahead(next_start, stride, max_results, total, stop, self._prefetch):
+      if (offset, size) not in self._pending:
+        self._pending[offset, size] = self._executor.submit(self._fetch_page, offset, size)
+    return items, total
+
+  def _cancel_pending(self) -> None:
+    for future in self._pending.values():
+      future.cancel()
+    self._pending.clear()
+
+  def close(self) -> None:
+    """Drop outstanding prefetches and release the worker threads."""
+    self._cancel_pending()
+    if self._executor is not None:
+      self._executor.shutdown(wait=False, cancel_futures=True)
+      self._executor = None
+
+
+class AsyncPrefetchingFetcher(Generic[T]):
+  """Async counterpart of ``PrefetchingFetcher`` using event-loop tasks."""
+
+  def __init__(
+    self,
+    fetch_page: Callable[[int, int], Awaitable[tuple[list[T], int]]],
+    *,
+    prefetch: int = 1,
+    limit: int | None = None,
+    fixed_stride: bool = False,
+  ) -> None:
+    self._fetch_page = fetch_page
+    self._prefetch = max(1, prefetch)
+    self._left = limit
+    self._fixed_stride = fixed_stride
+    self._bound = 0
+    self._pending: dict[tuple[int, int], asyncio.Task[tuple[list[T], int]]] = {}
+
+  async def __call__(self, start_at: int, max_results: int) -> tuple[list[T], int]:
+    task = self._pending.pop((start_at, max_results), None)
+    if task is None:
+      self.close()
+      items, total = await self._fetch_page(start_at, max_results)
+    else:
+      items, total = await task
+
+    if self._left is not None:
+      self._left -= len(items)
+    if self._fixed_stride:
+      total = self._bound = max(total, self._bound)
+    stride = max_results if self._fixed_stride else len(items)
+    next_start = start_at + stride
+    if (not items and not self._fixed_stride) or next_start >= total or (self._left is not None and self._left <= 0):
+      self.close()
+      return items, total
+    # Offsets and items advance together one page at a time, so the items
+    # still needed bound the pages ahead with either stride.
+    stop = None if self._left is None else next_start + self._left
+
+    for offset, size in _lookahead(next_start, stride, max_results, total, stop, self._prefetch):
+      if (offset, size) not in self._pending:
+        self._pending[offset, size] = asyncio.ensure_future(self._fetch_page(offset, size))
+    return items, total
+
+  def close(self) -> None:
+    """Cancel outstanding prefetches."""
+    for task in self._pending.values():
+      task.cancel()
+    self._pending.clear()
+
 
 class Paginator(Iterator[T]):
   """Sync iterator that auto-paginates through Jira API results.
 
-  Yields individual items from paginated responses.
+  Yields individual items from paginated responses. ``limit`` caps the
+  number of items yielded; the last request asks for exactly the items
+  still needed and nothing is fetched past it. ``prefetch=N`` fetches up
+  to N pages ahead on background threads. ``adaptive=True`` (or a
+  ``PageSizeTuner``) lets ``page_size`` float with observed latency,
+  payload size and the server's page cap. Pass ``checkpoint`` to
+  resume from a saved position, and ``on_checkpoint`` with
+  ``checkpoint_every=N`` to be handed a new checkpoint after every N
+  fully consumed pages.
+
+  Offsets normally advance by the number of items returned. Endpoints that
+  filter a page after applying ``maxResults`` (so a short page does not
+  mean fewer items were skipped) need ``fixed_stride=True``, which
+  advances by the requested page size instead. With a fixed stride the
+  total is the furthest offset any page so far says may hold items, and
+  empty pages before it are stepped over.
   """
 
   def __init__(
@@ -19,47 +335,142 @@ class Paginator(Iterator[T]):
     fetch_page: Callable[[int, int], tuple[list[T], int]],
     *,
     page_size: int = 50,
+    limit: int | None = None,
+    prefetch: int = 0,
+    adaptive: bool | PageSizeTuner = False,
+    params: dict[str, Any] | None = None,
+    checkpoint: PaginatorCheckpoint | None = None,
+    checkpoint_every: int | None = None,
+    on_checkpoint: Callable[[PaginatorCheckpoint], None] | None = None,
+    fixed_stride: bool = False,
   ) -> None:
-    self._fetch_page = fetch_page
+    if fixed_stride and adaptive is not False:
+      raise ValueError('Adaptive page sizes cannot be combined with fixed_stride')
     self._page_size = page_size
-    self._start_at = 0
+    self._fixed_stride = fixed_stride
+    self._tuner = _tuner_for(adaptive, page_size, prefetch)
+    self._params = params or {}
+    self._limit = limit
+    self._start_at, self._yielded = _resume(checkpoint, self._params, limit)
+    self._remaining = None if limit is None else max(0, limit - self._yielded)
+    if prefetch > 0:
+      fetch_page = PrefetchingFetcher(fetch_page, prefetch=prefetch, limit=self._remaining, fixed_stride=fixed_stride)
+    self._fetch_page = fetch_page
+    self._buffer_start = self._start_at
     self._total: int | None = None
     self._buffer: list[T] = []
     self._buffer_index = 0
     self._exhausted = False
+    self._pages_consumed = 0
+    self._checkpoint_every = checkpoint_every
+    self._on_checkpoint = on_checkpoint
 
   def __iter__(self) -> Paginator[T]:
     return self
 
-  def __next__(self) -> T:
-    if self._buffer_index < len(self._buffer):
-      item = self._buffer[self._buffer_index]
-      self._buffer_index += 1
-      return item
-
-    if self._exhausted:
-      raise StopIteration
+  def checkpoint(self) -> PaginatorCheckpoint:
+    """Return the position after the last item yielded."""
+    return PaginatorCheckpoint(
+      start_at=self._buffer_start + self._buffer_index,
+      page_size=self._tuner.size if self._tuner else self._page_size,
+      params=dict(self._params),
+      limit=self._limit,
+      yielded=self._yielded,
+    )
 
-    self._buffer, total = self._fetch_page(self._start_at, self._page_size)
-    self._total = total
+  def _page_consumed(self) -> None:
+    if not self._buffer:
+      return
+    self._buffer_start += len(self._buffer)
+    self._buffer = []
     self._buffer_index = 0
-    self._start_at += len(self._buffer)
+    self._pages_consumed += 1
+    if (
+      self._on_checkpoint is not None
+      and self._checkpoint_every
+      and self._pages_consumed % self._checkpoint_every == 0
+    ):
+      self._on_checkpoint(self.checkpoint())
 
-    if not self._buffer or self._start_at >= total:
-      self._exhausted = True
+  def _take_page(self) -> Page[T]:
+    start = self._buffer_start + self._buffer_index
+    items = self._buffer if self._buffer_index == 0 else self._buffer[self._buffer_index:]
+    self._buffer_index = len(self._buffer)
+    self._yielded += len(items)
+    return Page(items, start, self._total or 0)
 
-    if not self._buffer:
-      raise StopIteration
+  def _fetch_sized(self) -> tuple[list[T], int, int]:
+    while True:
+      size = self._tuner.size if self._tuner else self._page_size
+      if self._remaining is not None:
+        size = min(size, self._remaining)
+      if self._tuner is None:
+        return (*self._fetch_page(self._start_at, size), size)
+      started = time.perf_counter()
+      try:
+        items, total = self._fetch_page(self._start_at, size)
+      except CircuitOpenError:
+        # Nothing was sent: a smaller page would fail the same way.
+        raise
+      except _SHRINK_ON:
+        if not self._tuner.shrink():
+          raise
+        continue
+      final = self._start_at + len(items) >= total
+      self._tuner.observe(size, len(items), time.perf_counter() - started, final=final)
+      return items, total, size
 
+  def _fetch(self) -> bool:
+    self._page_consumed()
+    if self._exhausted or self._remaining == 0:
+      return False
+
+    while not self._buffer and not self._exhausted:
+      self._buffer, total, size = self._fetch_sized()
+      if self._remaining is not None:
+        if len(self._buffer) > self._remaining:
+          self._buffer = self._buffer[:self._remaining]
+        self._remaining -= len(self._buffer)
+      if self._fixed_stride:
+        # A filtered page can come back empty mid-listing: keep the
+        # furthest offset any page has vouched for.
+        total = max(total, self._total or 0)
+      self._total = total
+      self._buffer_index = 0
+      self._buffer_start = self._start_at
+      self._start_at += size if self._fixed_stride else len(self._buffer)
+
+      if (not self._buffer and not self._fixed_stride) or self._start_at >= total or self._remaining == 0:
+        self._exhausted = True
+    return bool(self._buffer)
+
+  def iter_pages(self) -> Iterator[Page[T]]:
+    """Yield the remaining results a page at a time.
+
+    Shares position with item iteration: a partly consumed page is yielded
+    with its remaining items first. The paginator drops its reference to
+    each page when the next one is requested.
+    """
+    if self._buffer_index < len(self._buffer):
+      yield self._take_page()
+    while self._fetch():
+      yield self._take_page()
+
+  def __next__(self) -> T:
+    if self._buffer_index >= len(self._buffer) and not self._fetch():
+      raise StopIteration
     item = self._buffer[self._buffer_index]
     self._buffer_index += 1
+    self._yielded += 1
     return item
 
 
 class AsyncPaginator(AsyncIterator[T]):
   """Async iterator that auto-paginates through Jira API results.
 
-  Yields individual items from paginated responses.
+  Yields individual items from paginated responses. Supports the same
+  limit, prefetch, adaptive, checkpoint and fixed-stride options as
+  ``Paginator``; prefetches run as tasks on the current event loop.
   """
 
   def __init__(
@@ -67,38 +478,126 @@ class AsyncPaginator(AsyncIterator[T]):
     fetch_page: Callable[[int, int], Any],  # async callable
     *,
     page_size: int = 50,
+    limit: int | None = None,
+    prefetch: int = 0,
+    adaptive: bool | PageSizeTuner = False,
+    params: dict[str, Any] | None = None,
+    checkpoint: PaginatorCheckpoint | None = None,
+    checkpoint_every: int | None = None,
+    on_checkpoint: Callable[[PaginatorCheckpoint], None] | None = None,
+    fixed_stride: bool = False,
   ) -> None:
-    self._fetch_page = fetch_page
+    if fixed_stride and adaptive is not False:
+      raise ValueError('Adaptive page sizes cannot be combined with fixed_stride')
     self._page_size = page_size
-    self._start_at = 0
+    self._fixed_stride = fixed_stride
+    self._tuner = _tuner_for(adaptive, page_size, prefetch)
+    self._params = params or {}
+    self._limit = limit
+    self._start_at, self._yielded = _resume(checkpoint, self._params, limit)
+    self._remaining = None if limit is None else max(0, limit - self._yielded)
+    if prefetch > 0:
+      fetch_page = AsyncPrefetchingFetcher(fetch_page, prefetch=prefetch, limit=self._remaining, fixed_stride=fixed_stride)
+    self._fetch_page = fetch_page
+    self._buffer_start = self._start_at
     self._total: int | None = None
     self._buffer: list[T] = []
     self._buffer_index = 0
     self._exhausted = False
+    self._pages_consumed = 0
+    self._checkpoint_every = checkpoint_every
+    self._on_checkpoint = on_checkpoint
 
   def __aiter__(self) -> AsyncPaginator[T]:
     return self
 
-  async def __anext__(self) -> T:
-    if self._buffer_index < len(self._buffer):
-      item = self._buffer[self._buffer_index]
-      self._buffer_index += 1
-      return item
-
-    if self._exhausted:
-      raise StopAsyncIteration
+  def checkpoint(self) -> PaginatorCheckpoint:
+    """Return the position after the last item yielded."""
+    return PaginatorCheckpoint(
+      start_at=self._buffer_start + self._buffer_index,
+      page_size=self._tuner.size if self._tuner else self._page_size,
+      params=dict(self._params),
+      limit=self._limit,
+      yielded=self._yielded,
+    )
 
-    self._buffer, total = await self._fetch_page(self._start_at, self._page_size)
-    self._total = total
+  def _page_consumed(self) -> None:
+    if not self._buffer:
+      return
+    self._buffer_start += len(self._buffer)
+    self._buffer = []
     self._buffer_index = 0
-    self._start_at += len(self._buffer)
+    self._pages_consumed += 1
+    if (
+      self._on_checkpoint is not None
+      and self._checkpoint_every
+      and self._pages_consumed % self._checkpoint_every == 0
+    ):
+      self._on_checkpoint(self.checkpoint())
 
-    if not self._buffer or self._start_at >= total:
-      self._exhausted = True
+  def _take_page(self) -> Page[T]:
+    start = self._buffer_start + self._buffer_index
+    items = self._buffer if self._buffer_index == 0 else self._buffer[self._buffer_index:]
+    self._buffer_index = len(self._buffer)
+    self._yielded += len(items)
+    return Page(items, start, self._total or 0)
 
-    if not self._buffer:
-      raise StopAsyncIteration
+  async def _fetch_sized(self) -> tuple[list[T], int, int]:
+    while True:
+      size = self._tuner.size if self._tuner else self._page_size
+      if self._remaining is not None:
+        size = min(size, self._remaining)
+      if self._tuner is None:
+        return (*await self._fetch_page(self._start_at, size), size)
+      started = time.perf_counter()
+      try:
+        items, total = await self._fetch_page(self._start_at, size)
+      except CircuitOpenError:
+        # Nothing was sent: a smaller page would fail the same way.
+        raise
+      except _SHRINK_ON:
+        if not self._tuner.shrink():
+          raise
+        continue
+      final = self._start_at + len(items) >= total
+      self._tuner.observe(size, len(items), time.perf_counter() - started, final=final)
+      return items, total, size
+
+  async def _fetch(self) -> bool:
+    self._page_consumed()
+    if self._exhausted or self._remaining == 0:
+      return False
 
+    while not self._buffer and not self._exhausted:
+      self._buffer, total, size = await self._fetch_sized()
+      if self._remaining is not None:
+        if len(self._buffer) > self._remaining:
+          self._buffer = self._buffer[:self._remaining]
+        self._remaining -= len(self._buffer)
+      if self._fixed_stride:
+        # A filtered page can come back empty mid-listing: keep the
+        # furthest offset any page has vouched for.
+        total = max(total, self._total or 0)
+      self._total = total
+      self._buffer_index = 0
+      self._buffer_start = self._start_at
+      self._start_at += size if self._fixed_stride else len(self._buffer)
+
+      if (not self._buffer and not self._fixed_stride) or self._start_at >= total or self._remaining == 0:
+        self._exhausted = True
+    return bool(self._buffer)
+
+  async def aiter_pages(self) -> AsyncIterator[Page[T]]:
+    """Async counterpart of ``Paginator.iter_pages``."""
+    if self._buffer_index < len(self._buffer):
+      yield self._take_page()
+    while await self._fetch():
+      yield self._take_page()
+
+  async def __anext__(self) -> T:
+    if self._buffer_index >= len(self._buffer) and not await self._fetch():
+      raise StopAsyncIteration
     item = self._buffer[self._buffer_index]
     self._buffer_index += 1
+    self._yielded += 1
     return item
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import re
+from collections.abc import Awaitable, Callable
+from concurrent.futures import Executor, Future
+from typing import Generic, TypeVar
+
+from pyjira.models.issue import Issue
+from pyjira.models.search import SearchResults
+
+T = TypeVar('T')
+
+# Jira emits the paging fields before the (large) issues array, so they can
+# be read from the head of the body without decoding the whole page.
+_HEAD_BYTES = 1024
+_TOTAL = re.compile(rb'"total"\s*:\s*(\d+)')
+_MAX_RESULTS = re.compile(rb'"maxResults"\s*:\s*(\d+)')
+
+
+def parse_search_results(raw: bytes) -> tuple[list[Issue], int]:
+  """Decode and validate a raw ``/search`` response body.
+
+  Module-level so it can be pickled to a ``ProcessPoolExecutor``.
+  """
+  results = SearchResults.model_validate_json(raw)
+  return results.issues, results.total
+
+
+def sniff_page_header(raw: bytes) -> tuple[int | None, int | None]:
+  """Return ``(total, maxResults)`` from the head of a page body, if present."""
+  head = raw[:_HEAD_BYTES]
+  issues_at = head.find(b'"issues"')
+  if issues_at != -1:
+    head = head[:issues_at]
+  total = _TOTAL.search(head)
+  max_results = _MAX_RESULTS.search(head)
+  return (
+    int(total.group(1)) if total else None,
+    int(max_results.group(1)) if max_results else None,
+  )
+
+
+class PipelinedFetcher(Generic[T]):
+  """``Paginator`` fetch callable that overlaps fetching with off-thread parsing.
+
+  Raw page bodies are fetched on the calling thread and handed to
+  ``executor`` for decoding. While the executor parses page N, up to
+  ``prefetch`` following pages are fetched, so network wait and CPU-bound
+  validation run on different cores. Pages are returned in order, and
+  nothing is requested at or past ``stop``.
+  """
+
+  def __init__(
+    self,
+    fetch_raw: Callable[[int, int], bytes],
+    parse: Callable[[bytes], tuple[list[T], int]],
+    executor: Executor,
+    *,
+    prefetch: int = 2,
+    stop: int | None = None,
+  ) -> None:
+    self._fetch_raw = fetch_raw
+    self._parse = parse
+    self._executor = executor
+    self._prefetch = max(0, prefetch)
+    self._stop = stop
+    self._pending: dict[tuple[int, int], Future[tuple[list[T], int]]] = {}
+    self._next_start: int | None = None
+    self._total: int | None = None
+
+  def __call__(self, start_at: int, max_results: int) -> tuple[list[T], int]:
+    if (start_at, max_results) not in self._pending:
+      self._cancel_pending()
+      self._submit(start_at, max_results)
+    while (
+      len(self._pending) <= self._prefetch
+      and self._next_start is not None
+      and self._total is not None
+      and self._next_start < self._total
+      and (self._stop is None or self._next_start < self._stop)
+    ):
+      size = max_results if self._stop is None else min(max_results, self._stop - self._next_start)
+      self._submit(self._next_start, size)
+    return self._pending.pop((start_at, max_results)).result()
+
+  def _submit(self, start_at: int, max_results: int) -> None:
+    raw = self._fetch_raw(start_at, max_results)
+    total, echoed = sniff_page_header(raw)
+    self._total = total
+    self._next_start = start_at + min(max_results, echoed or max_results) if total is not None else None
+    self._pending[start_at, max_results] = self._executor.submit(self._parse, raw)
+
+  def _cancel_pending(self) -> None:
+    for future in self._pending.values():
+      future.cancel()
+    self._pending.clear()
+
+
+class AsyncPipelinedFetcher(Generic[T]):
+  """Async counterpart of ``PipelinedFetcher`` for ``AsyncPaginator``."""
+
+  def __init__(
+    self,
+    fetch_raw: Callable[[int, int], Awaitable[bytes]],
+    parse: Callable[[bytes], tuple[list[T], int]],
+    executor: Executor,
+    *,
+    prefetch: int = 2,
+    stop: int | None = None,
+  ) -> None:
+    self._fetch_raw = fetch_raw
+    self._parse = parse
+    self._executor = executor
+    self._prefetch = max(0, prefetch)
+    self._stop = stop
+    self._pending: dict[tuple[int, int], asyncio.Future[tuple[list[T], int]]] = {}
+    self._next_start: int | None = None
+    self._total: int | None = None
+
+  async def __call__(self, start_at: int, max_results: int) -> tuple[list[T], int]:
+    if (start_at, max_results) not in self._pending:
+      self._cancel_pending()
+      await self._submit(start_at, max_results)
+    while (
+      len(self._pending) <= self._prefetch
+      and self._next_start is not None
+      and self._total is not None
+      and self._next_start < self._total
+      and (self._stop is None or self._next_start < self._stop)
+    ):
+      size = max_results if self._stop is None else min(max_results, self._stop - self._next_start)
+      await self._submit(self._next_start, size)
+    return await self._pending.pop((start_at, max_results))
+
+  async def _submit(self, start_at: int, max_results: int) -> None:
+    raw = await self._fetch_raw(start_at, max_results)
+    total, echoed = sniff_page_header(raw)
+    self._total = total
+    self._next_start = start_at + min(max_results, echoed or max_results) if total is not None else None
+    loop = asyncio.get_running_loop()
+    self._pending[start_at, max_results] = loop.run_in_executor(self._executor, self._parse, raw)
+
+  def _cancel_pending(self) -> None:
+    for future in self._pending.values():
+      future.cancel()
+    self._pending.clear()
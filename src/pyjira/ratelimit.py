@@ -0,0 +1,238 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  import httpx
+
+# Jira Cloud marks responses with X-RateLimit-NearLimit once less than 20%
+# of the budget is left; back off at the same point when only the counts
+# are sent.
+_NEAR_LIMIT_FRACTION = 0.2
+
+
+def parse_retry_after(value: str | None) -> float | None:
+  """Seconds from a ``Retry-After`` value (delta-seconds or an HTTP date)."""
+  if not value:
+    return None
+  try:
+    return max(0.0, float(value))
+  except ValueError:
+    pass
+  try:
+    when = parsedate_to_datetime(value)
+  except (TypeError, ValueError):
+    return None
+  if when.tzinfo is None:
+    when = when.replace(tzinfo=UTC)
+  return max(0.0, (when - datetime.now(UTC)).total_seconds())
+
+
+def _int(value: str | None) -> int | None:
+  try:
+    return int(value) if value is not None else None
+  except ValueError:
+    return None
+
+
+def _timestamp(value: str | None) -> datetime | None:
+  if not value:
+    return None
+  try:
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+  except ValueError:
+    return None
+
+
+@dataclass(frozen=True)
+class RateLimitInfo:
+  """Rate-limit headers of one Jira response.
+
+  ``limit``/``remaining`` come from ``X-RateLimit-Limit`` and
+  ``X-RateLimit-Remaining``, ``reset`` from ``X-RateLimit-Reset``,
+  ``near_limit`` from ``X-RateLimit-NearLimit``, ``reason`` from
+  ``RateLimit-Reason`` (which limit was hit) and ``retry_after`` (seconds)
+  from ``Retry-After``.
+  """
+
+  status_code: int
+  limit: int | None = None
+  remaining: int | None = None
+  reset: datetime | None = None
+  near_limit: bool = False
+  reason: str | None = None
+  retry_after: float | None = None
+
+  @classmethod
+  def from_response(cls, response: httpx.Response) -> RateLimitInfo | None:
+    """Parse ``response``'s headers, or return ``None`` if it has none of them."""
+    headers = response.headers
+    limit = headers.get('X-RateLimit-Limit')
+    remaining = headers.get('X-RateLimit-Remaining')
+    near_limit = headers.get('X-RateLimit-NearLimit')
+    reason = headers.get('RateLimit-Reason')
+    retry_after = headers.get('Retry-After')
+    if limit is None and remaining is None and near_limit is None and reason is None and retry_after is None:
+      return None
+    return cls(
+      status_code=response.status_code,
+      limit=_int(limit),
+      remaining=_int(remaining),
+      reset=_timestamp(headers.get('X-RateLimit-Reset')),
+      near_limit=(near_limit or '').lower() == 'true',
+      reason=reason,
+      retry_after=parse_retry_after(retry_after),
+    )
+
+  @property
+  def throttled(self) -> bool:
+    return self.status_code == 429
+
+  @property
+  def remaining_fraction(self) -> float | None:
+    if self.limit is None or self.remaining is None or self.limit <= 0:
+      return None
+    return self.remaining / self.limit
+
+  @property
+  def nearly_exhausted(self) -> bool:
+    """``near_limit`` was set, or less than 20% of the budget is left."""
+    fraction = self.remaining_fraction
+    return self.near_limit or (fraction is not None and fraction < _NEAR_LIMIT_FRACTION)
+
+
+class RateLimitTracker:
+  """Rate-limit state seen across a client's responses.
+
+  ``latest`` holds the most recent headers; ``throttled`` and
+  ``near_limit`` count 429 responses and responses flagged as close to the
+  limit.
+  """
+
+  def __init__(self) -> None:
+    self.latest: RateLimitInfo | None = None
+    self.throttled = 0
+    self.near_limit = 0
+    self._lock = threading.Lock()
+
+  def observe(self, response: httpx.Response) -> RateLimitInfo | None:
+    info = RateLimitInfo.from_response(response)
+    if info is None and response.status_code != 429:
+      return None
+    with self._lock:
+      if response.status_code == 429:
+        self.throttled += 1
+      if info is not None:
+        self.latest = info
+        if info.nearly_exhausted:
+          self.near_limit += 1
+    return info
+
+
+class AdaptiveConcurrency:
+  """AIMD limit on the requests an ``AsyncJiraClient`` has in flight.
+
+  While responses stay healthy and the limit is in use, it grows by
+  ``increase`` per window of ``limit`` responses. It is multiplied by
+  ``backoff`` on 429 or 503, and by ``near_limit_backoff`` when Jira says
+  the budget is nearly spent (see ``RateLimitInfo.nearly_exhausted``), so
+  it starts backing off before throttling does. Only one decrease is
+  applied per round trip. After a 429 no request starts until its
+  ``Retry-After`` has passed.
+
+  Usage:
+    client = AsyncJiraClient(..., adaptive_concurrency=AdaptiveConcurrency(8, max_limit=64))
+    async for issue in client.map(client.issues.get, keys):
+      ...
+  """
+
+  def __init__(
+    self,
+    initial: int = 4,
+    *,
+    min_limit: int = 1,
+    max_limit: int = 50,
+    increase: float = 1.0,
+    backoff: float = 0.5,
+    near_limit_backoff: float = 0.9,
+  ) -> None:
+    if not 1 <= min_limit <= initial <= max_limit:
+      raise ValueError('Expected 1 <= min_limit <= initial <= max_limit')
+    if not (0 < backoff < 1 and 0 < near_limit_backoff <= 1):
+      raise ValueError('backoff factors must be between 0 and 1')
+    self.min_limit = min_limit
+    self.max_limit = max_limit
+    self._increase = increase
+    self._backoff = backoff
+    self._near_limit_backoff = near_limit_backoff
+    self._limit = float(initial)
+    self._in_flight = 0
+    self._generation = 0
+    self._paused_until = 0.0
+    self._waiters: deque[asyncio.Future[None]] = deque()
+
+  @property
+  def limit(self) -> int:
+    return int(self._limit)
+
+  @property
+  def in_flight(self) -> int:
+    return self._in_flight
+
+  async def acquire(self) -> int:
+    """Wait for a free slot; return the token to pass to ``release``."""
+    while True:
+      delay = self._paused_until - time.monotonic()
+      if delay > 0:
+        await asyncio.sleep(delay)
+        continue
+      if self._in_flight < self.limit:
+        self._in_flight += 1
+        return self._generation
+      waiter = asyncio.get_running_loop().create_future()
+      self._waiters.append(waiter)
+      try:
+        await waiter
+      except asyncio.CancelledError:
+        if waiter in self._waiters:
+          self._waiters.remove(waiter)
+        elif waiter.done() and not waiter.cancelled():
+          self._wake()
+        raise
+
+  def release(self, token: int, status_code: int | None = None, info: RateLimitInfo | None = None) -> None:
+    """Free a slot and adjust the limit from the response, if there was one."""
+    busy = self._in_flight
+    self._in_flight -= 1
+    if status_code in (429, 503):
+      self._decrease(token, self._backoff)
+      retry_after = info.retry_after if info is not None and info.retry_after is not None else 1.0
+      self._paused_until = max(self._paused_until, time.monotonic() + retry_after)
+    elif info is not None and info.nearly_exhausted:
+      self._decrease(token, self._near_limit_backoff)
+    elif status_code is not None and status_code < 500 and busy * 2 >= self._limit:
+      self._limit = min(self.max_limit, self._limit + self._increase / self._limit)
+    self._wake()
+
+  def _decrease(self, token: int, factor: float) -> None:
+    # Responses to requests sent before the last decrease say nothing
+    # about the new limit.
+    if token < self._generation:
+      return
+    self._generation += 1
+    self._limit = max(self.min_limit, self._limit * factor)
+
+  def _wake(self) -> None:
+    free = self.limit - self._in_flight
+    while free > 0 and self._waiters:
+      waiter = self._waiters.popleft()
+      if not waiter.done():
+        waiter.set_result(None)
+        free -= 1
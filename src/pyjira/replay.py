@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import json
+import os
+import struct
+import threading
+from collections.abc import Iterator
+from typing import Literal
+
+import httpx
+
+Mode = Literal['record', 'replay', 'auto']
+
+_MAGIC = b'pyjira-cassette 1\n'
+_LENGTH = struct.Struct('>I')
+# The stored body is already decoded, and its length is implied by it.
+_DROPPED_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection', 'keep-alive'})
+
+
+class ReplayMissError(LookupError):
+  """Raised in replay mode for a request the cassette has no response to."""
+
+
+class _Recorded:
+  __slots__ = ('status_code', 'headers', 'content')
+
+  def __init__(self, status_code: int, headers: list[tuple[str, str]], content: bytes) -> None:
+    self.status_code = status_code
+    self.headers = headers
+    self.content = content
+
+  def response(self) -> httpx.Response:
+    return httpx.Response(self.status_code, headers=self.headers, content=self.content)
+
+
+def _key(request: httpx.Request) -> tuple[str, bytes, str]:
+  body = request.content
+  return request.method, request.url.raw_path, hashlib.sha1(body).hexdigest() if body else ''
+
+
+class Cassette:
+  """Request/response pairs stored in one compact file.
+
+  Requests are matched on method, path with query string and a digest of
+  the body, so the same cassette replays against any base URL. Request
+  headers (and so credentials) are never stored. A request recorded more
+  than once is replayed in the recorded order, repeating the last
+  response.
+
+  ``mode`` is ``'record'`` (always send and store every response,
+  replacing the file), ``'replay'`` (never send; unknown requests raise
+  ``ReplayMissError``) or ``'auto'`` (replay what is stored, send and
+  record the rest). The
+  file is a gzip stream of length-prefixed JSON metadata and raw bodies;
+  it is read when the cassette is created and written by ``save()``, which
+  the client calls on close when anything was recorded.
+
+  Usage:
+    client = JiraClient(..., cassette=Cassette('jira.cassette', mode='auto'))
+  """
+
+  def __init__(self, path: str | os.PathLike[str], *, mode: Mode = 'replay') -> None:
+    if mode not in ('record', 'replay', 'auto'):
+      raise ValueError(f'Unknown cassette mode: {mode!r}')
+    self.path = os.fspath(path)
+    self.mode = mode
+    self.replayed = 0
+    self.recorded = 0
+    self._entries: dict[tuple[str, bytes, str], list[_Recorded]] = {}
+    self._positions: dict[tuple[str, bytes, str], int] = {}
+    self._dirty = False
+    self._lock = threading.Lock()
+    if mode != 'record' and os.path.exists(self.path):
+      self._load()
+    elif mode == 'replay':
+      raise FileNotFoundError(self.path)
+
+  def __len__(self) -> int:
+    return sum(len(entries) for entries in self._entries.values())
+
+  def _load(self) -> None:
+    with gzip.open(self.path, 'rb') as file:
+      data = file.read()
+    if not data.startswith(_MAGIC):
+      raise ValueError(f'{self.path} is not a pyjira cassette')
+    view = memoryview(data)
+    offset = len(_MAGIC)
+    while offset < len(data):
+      (size,) = _LENGTH.unpack_from(view, offset)
+      meta = json.loads(view[offset + 4 : offset + 4 + size].tobytes())
+      offset += 4 + size
+      (size,) = _LENGTH.unpack_from(view, offset)
+      content = view[offset + 4 : offset + 4 + size].tobytes()
+      offset += 4 + size
+      key = (meta['method'], meta['path'].encode(), meta['body'])
+      recorded = _Recorded(meta['status'], [tuple(item) for item in meta['headers']], content)
+      self._entries.setdefault(key, []).append(recorded)
+
+  def _records(self) -> Iterator[bytes]:
+    yield _MAGIC
+    for (method, path, body), entries in self._entries.items():
+      for entry in entries:
+        meta = json.dumps(
+          {'method': method, 'path': path.decode(), 'body': body, 'status': entry.status_code, 'headers': entry.headers},
+          separators=(',', ':'),
+        ).encode()
+        yield _LENGTH.pack(len(meta))
+        yield meta
+        yield _LENGTH.pack(len(entry.content))
+        yield entry.content
+
+  def save(self) -> None:
+    """Write the cassette to ``path``."""
+    with self._lock:
+      chunks = list(self._records())
+      self._dirty = False
+    with gzip.open(self.path, 'wb', compresslevel=6) as file:
+      file.writelines(chunks)
+
+  def close(self) -> None:
+    if self._dirty:
+      self.save()
+
+  def lookup(self, request: httpx.Request) -> httpx.Response | None:
+    """The next recorded response to ``request``, if there is one."""
+    if self.mode == 'record':
+      return None
+    key = _key(request)
+    with self._lock:
+      entries = self._entries.get(key)
+      if not entries:
+        if self.mode == 'replay':
+          raise ReplayMissError(f'No recorded response for {request.method} {request.url.raw_path.decode()}')
+        return None
+      position = self._positions.get(key, 0)
+      self._positions[key] = position + 1
+      self.replayed += 1
+    return entries[min(position, len(entries) - 1)].response()
+
+  def record(self, request: httpx.Request, response: httpx.Response) -> httpx.Response:
+    """Store ``response`` (already read) and return a fresh copy of it."""
+    headers = [(name, value) for name, value in response.headers.multi_items() if name.lower() not in _DROPPED_HEADERS]
+    recorded = _Recorded(response.status_code, headers, response.content)
+    with self._lock:
+      key = _key(request)
+      self._entries.setdefault(key, []).append(recorded)
+      self._positions[key] = len(self._entries[key])
+      self.recorded += 1
+      self._dirty = True
+    return recorded.response()
+
+  def transport(self, transport: httpx.BaseTransport) -> CassetteTransport:
+    return CassetteTransport(self, transport)
+
+  def async_transport(self, transport: httpx.AsyncBaseTransport) -> AsyncCassetteTransport:
+    return AsyncCassetteTransport(self, transport)
+
+
+class CassetteTransport(httpx.BaseTransport):
+  """Serves requests from a ``Cassette`` and records what it has to send."""
+
+  def __init__(self, cassette: Cassette, transport: httpx.BaseTransport) -> None:
+    self._cassette = cassette
+    self._transport = transport
+
+  def handle_request(self, request: httpx.Request) -> httpx.Response:
+    request.read()
+    response = self._cassette.lookup(request)
+    if response is not None:
+      return response
+    response = self._transport.handle_request(request)
+    try:
+      response.read()
+    finally:
+      response.close()
+    return self._cassette.record(request, response)
+
+  def close(self) -> None:
+    self._cassette.close()
+    self._transport.close()
+
+
+class AsyncCassetteTransport(httpx.AsyncBaseTransport):
+  def __init__(self, cassette: Cassette, transport: httpx.AsyncBaseTransport) -> None:
+    self._cassette = cassette
+    self._transport = transport
+
+  async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+    await request.aread()
+    response = self._cassette.lookup(request)
+    if response is not None:
+      return response
+    response = await self._transport.handle_async_request(request)
+    try:
+      await response.aread()
+    finally:
+      await response.aclose()
+    return self._cassette.record(request, response)
+
+  async def aclose(self) -> None:
+    self._cassette.close()
+    await self._transport.aclose()
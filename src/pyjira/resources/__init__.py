@@ -1,59 +1,122 @@
-from pyjira.resources.attachments import (
-    AsyncAttachmentResource,
-    AttachmentResource,
-)
-from pyjira.resources.comments import AsyncCommentResource, CommentResource
-from pyjira.resources.components import (
-    AsyncComponentResource,
-    ComponentResource,
-)
-from pyjira.resources.dashboards import (
-    AsyncDashboardResource,
-    DashboardResource,
-)
-from pyjira.resources.fields import AsyncFieldResource, FieldResource
-from pyjira.resources.filters import AsyncFilterResource, FilterResource
-from pyjira.resources.groups import AsyncGroupResource, GroupResource
-from pyjira.resources.issue_links import (
-    AsyncIssueLinkResource,
-    IssueLinkResource,
-)
-from pyjira.resources.issue_types import (
-    AsyncIssueTypeResource,
-    IssueTypeResource,
-)
-from pyjira.resources.issues import AsyncIssueResource, IssueResource
-from pyjira.resources.notification_schemes import (
-    AsyncNotificationSchemeResource,
-    NotificationSchemeResource,
-)
-from pyjira.resources.permissions import (
-    AsyncPermissionResource,
-    PermissionResource,
-)
-from pyjira.resources.priorities import (
-    AsyncPriorityResource,
-    PriorityResource,
-)
-from pyjira.resources.projects import AsyncProjectResource, ProjectResource
-from pyjira.resources.resolutions import (
-    AsyncResolutionResource,
-    ResolutionResource,
-)
-from pyjira.resources.roles import AsyncRoleResource, RoleResource
-from pyjira.resources.screens import AsyncScreenResource, ScreenResource
-from pyjira.resources.search import AsyncSearchResource, SearchResource
-from pyjira.resources.server_info import (
-    AsyncServerInfoResource,
-    ServerInfoResource,
-)
-from pyjira.resources.statuses import AsyncStatusResource, StatusResource
-from pyjira.resources.users import AsyncUserResource, UserResource
-from pyjira.resources.versions import AsyncVersionResource, VersionResource
-from pyjira.resources.workflows import (
-    AsyncWorkflowResource,
-    WorkflowResource,
-)
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pyjira._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from pyjira.resources.attachments import (
+        AsyncAttachmentResource,
+        AttachmentResource,
+    )
+    from pyjira.resources.comments import AsyncCommentResource, CommentResource
+    from pyjira.resources.components import (
+        AsyncComponentResource,
+        ComponentResource,
+    )
+    from pyjira.resources.dashboards import (
+        AsyncDashboardResource,
+        DashboardResource,
+    )
+    from pyjira.resources.fields import AsyncFieldResource, FieldResource
+    from pyjira.resources.filters import AsyncFilterResource, FilterResource
+    from pyjira.resources.groups import AsyncGroupResource, GroupResource
+    from pyjira.resources.issue_links import (
+        AsyncIssueLinkResource,
+        IssueLinkResource,
+    )
+    from pyjira.resources.issue_metadata import (
+        AsyncIssueMetadataResource,
+        IssueMetadataResource,
+    )
+    from pyjira.resources.issue_types import (
+        AsyncIssueTypeResource,
+        IssueTypeResource,
+    )
+    from pyjira.resources.issues import AsyncIssueResource, IssueResource
+    from pyjira.resources.notification_schemes import (
+        AsyncNotificationSchemeResource,
+        NotificationSchemeResource,
+    )
+    from pyjira.resources.permissions import (
+        AsyncPermissionResource,
+        PermissionResource,
+    )
+    from pyjira.resources.priorities import (
+        AsyncPriorityResource,
+        PriorityResource,
+    )
+    from pyjira.resources.projects import AsyncProjectResource, ProjectResource
+    from pyjira.resources.resolutions import (
+        AsyncResolutionResource,
+        ResolutionResource,
+    )
+    from pyjira.resources.roles import AsyncRoleResource, RoleResource
+    from pyjira.resources.screens import AsyncScreenResource, ScreenResource
+    from pyjira.resources.search import AsyncSearchResource, SearchResource
+    from pyjira.resources.server_info import (
+        AsyncServerInfoResource,
+        ServerInfoResource,
+    )
+    from pyjira.resources.statuses import AsyncStatusResource, StatusResource
+    from pyjira.resources.users import AsyncUserResource, UserResource
+    from pyjira.resources.versions import AsyncVersionResource, VersionResource
+    from pyjira.resources.workflows import (
+        AsyncWorkflowResource,
+        WorkflowResource,
+    )
+
+# Public name -> defining module, imported on first attribute access.
+_EXPORTS: dict[str, str] = {
+    "AsyncAttachmentResource": "pyjira.resources.attachments",
+    "AsyncCommentResource": "pyjira.resources.comments",
+    "AsyncComponentResource": "pyjira.resources.components",
+    "AsyncDashboardResource": "pyjira.resources.dashboards",
+    "AsyncFieldResource": "pyjira.resources.fields",
+    "AsyncFilterResource": "pyjira.resources.filters",
+    "AsyncGroupResource": "pyjira.resources.groups",
+    "AsyncIssueLinkResource": "pyjira.resources.issue_links",
+    "AsyncIssueMetadataResource": "pyjira.resources.issue_metadata",
+    "AsyncIssueResource": "pyjira.resources.issues",
+    "AsyncIssueTypeResource": "pyjira.resources.issue_types",
+    "AsyncNotificationSchemeResource": "pyjira.resources.notification_schemes",
+    "AsyncPermissionResource": "pyjira.resources.permissions",
+    "AsyncPriorityResource": "pyjira.resources.priorities",
+    "AsyncProjectResource": "pyjira.resources.projects",
+    "AsyncResolutionResource": "pyjira.resources.resolutions",
+    "AsyncRoleResource": "pyjira.resources.roles",
+    "AsyncScreenResource": "pyjira.resources.screens",
+    "AsyncSearchResource": "pyjira.resources.search",
+    "AsyncServerInfoResource": "pyjira.resources.server_info",
+    "AsyncStatusResource": "pyjira.resources.statuses",
+    "AsyncUserResource": "pyjira.resources.users",
+    "AsyncVersionResource": "pyjira.resources.versions",
+    "AsyncWorkflowResource": "pyjira.resources.workflows",
+    "AttachmentResource": "pyjira.resources.attachments",
+    "CommentResource": "pyjira.resources.comments",
+    "ComponentResource": "pyjira.resources.components",
+    "DashboardResource": "pyjira.resources.dashboards",
+    "FieldResource": "pyjira.resources.fields",
+    "FilterResource": "pyjira.resources.filters",
+    "GroupResource": "pyjira.resources.groups",
+    "IssueLinkResource": "pyjira.resources.issue_links",
+    "IssueMetadataResource": "pyjira.resources.issue_metadata",
+    "IssueResource": "pyjira.resources.issues",
+    "IssueTypeResource": "pyjira.resources.issue_types",
+    "NotificationSchemeResource": "pyjira.resources.notification_schemes",
+    "PermissionResource": "pyjira.resources.permissions",
+    "PriorityResource": "pyjira.resources.priorities",
+    "ProjectResource": "pyjira.resources.projects",
+    "ResolutionResource": "pyjira.resources.resolutions",
+    "RoleResource": "pyjira.resources.roles",
+    "ScreenResource": "pyjira.resources.screens",
+    "SearchResource": "pyjira.resources.search",
+    "ServerInfoResource": "pyjira.resources.server_info",
+    "StatusResource": "pyjira.resources.statuses",
+    "UserResource": "pyjira.resources.users",
+    "VersionResource": "pyjira.resources.versions",
+    "WorkflowResource": "pyjira.resources.workflows",
+}
 
 __all__ = [
     "AsyncAttachmentResource",
@@ -64,6 +127,7 @@ __all__ = [
     "AsyncFilterResource",
     "AsyncGroupResource",
     "AsyncIssueLinkResource",
+    "AsyncIssueMetadataResource",
     "AsyncIssueResource",
     "AsyncIssueTypeResource",
     "AsyncNotificationSchemeResource",
@@ -87,6 +151,7 @@ __all__ = [
     "FilterResource",
     "GroupResource",
     "IssueLinkResource",
+    "IssueMetadataResource",
     "IssueResource",
     "IssueTypeResource",
     "NotificationSchemeResource",
@@ -103,3 +168,5 @@ __all__ = [
     "VersionResource",
     "WorkflowResource",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
@@ -7,6 +7,7 @@ from pydantic import Field
 from pyjira.exceptions import raise_for_response
 from pyjira.models.comment import Comment
 from pyjira.models.common import PaginatedResponse
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
   import httpx
@@ -46,6 +47,29 @@ class CommentResource:
     raise_for_response(response)
     return CommentPage.model_validate(response.json())
 
+  def list_paginated(
+    self,
+    issue_id_or_key: str,
+    *,
+    page_size: int = 50,
+    limit: int | None = None,
+    order_by: str | None = None,
+    expand: list[str] | None = None,
+    prefetch: int = 0,
+  ) -> Paginator[Comment]:
+    """Iterate over every comment on an issue."""
+    def fetch_page(start_at: int, max_results: int) -> tuple[list[Comment], int]:
+      page = self.list(
+        issue_id_or_key,
+        start_at=start_at,
+        max_results=max_results,
+        order_by=order_by,
+        expand=expand,
+      )
+      return page.comments, page.total
+
+    return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
   def get(self, issue_id_or_key: str, comment_id: str) -> Comment:
     response = self._client.get(
       f'/rest/api/3/issue/{issue_id_or_key}/comment/{comment_id}',
@@ -125,6 +149,29 @@ class AsyncCommentResource:
     raise_for_response(response)
     return CommentPage.model_validate(response.json())
 
+  def list_paginated(
+    self,
+    issue_id_or_key: str,
+    *,
+    page_size: int = 50,
+    limit: int | None = None,
+    order_by: str | None = None,
+    expand: list[str] | None = None,
+    prefetch: int = 0,
+  ) -> AsyncPaginator[Comment]:
+    """Iterate over every comment on an issue."""
+    async def fetch_page(start_at: int, max_results: int) -> tuple[list[Comment], int]:
+      page = await self.list(
+        issue_id_or_key,
+        start_at=start_at,
+        max_results=max_results,
+        order_by=order_by,
+        expand=expand,
+      )
+      return page.comments, page.total
+
+    return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
   async def get(self, issue_id_or_key: str, comment_id: str) -> Comment:
     response = await self._client.get(
       f'/rest/api/3/issue/{issue_id_or_key}/comment/{comment_id}',
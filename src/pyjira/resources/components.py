@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 from pyjira.exceptions import raise_for_response
 from pyjira.models.component import Component, ComponentIssueCount
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -74,6 +75,28 @@ class ComponentResource:
         raise_for_response(response)
         return response.json()
 
+    def find_for_projects_paginated(
+        self,
+        *,
+        project_ids: list[str],
+        page_size: int = 50,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[Component]:
+        """Iterate over every component of the given projects."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[Component], int]:
+            page = self.find_for_projects(
+                project_ids=project_ids,
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return (
+                [Component.model_validate(c) for c in page.get("values", [])],
+                page.get("total", 0),
+            )
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
 
 class AsyncComponentResource:
     """Async operations for project components."""
@@ -145,3 +168,25 @@ class AsyncComponentResource:
         response = await self._client.get("/rest/api/3/component", params=params)
         raise_for_response(response)
         return response.json()
+
+    def find_for_projects_paginated(
+        self,
+        *,
+        project_ids: list[str],
+        page_size: int = 50,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[Component]:
+        """Iterate over every component of the given projects."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[Component], int]:
+            page = await self.find_for_projects(
+                project_ids=project_ids,
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return (
+                [Component.model_validate(c) for c in page.get("values", [])],
+                page.get("total", 0),
+            )
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
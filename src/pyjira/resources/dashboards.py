@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 from pyjira.exceptions import raise_for_response
 from pyjira.models.dashboard import Dashboard, DashboardGadget, DashboardPage
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -29,6 +30,20 @@ class DashboardResource:
         raise_for_response(response)
         return DashboardPage.model_validate(response.json())
 
+    def list_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[Dashboard]:
+        """Iterate over every dashboard visible to the caller."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[Dashboard], int]:
+            page = self.list(start_at=start_at, max_results=max_results)
+            return page.dashboards, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def search(
         self,
         *,
@@ -49,6 +64,28 @@ class DashboardResource:
         raise_for_response(response)
         return response.json()
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        filter_str: str | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[Dashboard]:
+        """Iterate over every dashboard matching the search."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[Dashboard], int]:
+            page = self.search(
+                start_at=start_at,
+                max_results=max_results,
+                filter_str=filter_str,
+            )
+            return (
+                [Dashboard.model_validate(d) for d in page.get("values", [])],
+                page.get("total", 0),
+            )
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def create(self, body: dict[str, Any]) -> Dashboard:
         response = self._client.post("/rest/api/3/dashboard", json=body)
         raise_for_response(response)
@@ -161,6 +198,20 @@ class AsyncDashboardResource:
         raise_for_response(response)
         return DashboardPage.model_validate(response.json())
 
+    def list_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[Dashboard]:
+        """Iterate over every dashboard visible to the caller."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[Dashboard], int]:
+            page = await self.list(start_at=start_at, max_results=max_results)
+            return page.dashboards, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def search(
         self,
         *,
@@ -181,6 +232,28 @@ class AsyncDashboardResource:
         raise_for_response(response)
         return response.json()
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        filter_str: str | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[Dashboard]:
+        """Iterate over every dashboard matching the search."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[Dashboard], int]:
+            page = await self.search(
+                start_at=start_at,
+                max_results=max_results,
+                filter_str=filter_str,
+            )
+            return (
+                [Dashboard.model_validate(d) for d in page.get("values", [])],
+                page.get("total", 0),
+            )
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def create(self, body: dict[str, Any]) -> Dashboard:
         response = await self._client.post(
             "/rest/api/3/dashboard",
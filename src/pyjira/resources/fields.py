@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 from pyjira.exceptions import raise_for_response
 from pyjira.models.field import FieldDetail, FieldPage
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -49,6 +50,33 @@ class FieldResource:
         raise_for_response(response)
         return FieldPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        type: list[str] | None = None,
+        id: list[str] | None = None,
+        query: str | None = None,
+        order_by: str | None = None,
+        expand: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[FieldDetail]:
+        """Iterate over every field matching the search."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[FieldDetail], int]:
+            page = self.search(
+                start_at=start_at,
+                max_results=max_results,
+                type=type,
+                id=id,
+                query=query,
+                order_by=order_by,
+                expand=expand,
+            )
+            return page.values, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def search_trashed(
         self,
         *,
@@ -78,6 +106,31 @@ class FieldResource:
         raise_for_response(response)
         return FieldPage.model_validate(response.json())
 
+    def search_trashed_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        id: list[str] | None = None,
+        query: str | None = None,
+        expand: list[str] | None = None,
+        order_by: str | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[FieldDetail]:
+        """Iterate over every trashed field matching the search."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[FieldDetail], int]:
+            page = self.search_trashed(
+                start_at=start_at,
+                max_results=max_results,
+                id=id,
+                query=query,
+                expand=expand,
+                order_by=order_by,
+            )
+            return page.values, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def create(self, body: dict[str, Any]) -> FieldDetail:
         response = self._client.post("/rest/api/3/field", json=body)
         raise_for_response(response)
@@ -147,6 +200,33 @@ class AsyncFieldResource:
         raise_for_response(response)
         return FieldPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        type: list[str] | None = None,
+        id: list[str] | None = None,
+        query: str | None = None,
+        order_by: str | None = None,
+        expand: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[FieldDetail]:
+        """Iterate over every field matching the search."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[FieldDetail], int]:
+            page = await self.search(
+                start_at=start_at,
+                max_results=max_results,
+                type=type,
+                id=id,
+                query=query,
+                order_by=order_by,
+                expand=expand,
+            )
+            return page.values, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def search_trashed(
         self,
         *,
@@ -176,6 +256,31 @@ class AsyncFieldResource:
         raise_for_response(response)
         return FieldPage.model_validate(response.json())
 
+    def search_trashed_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        id: list[str] | None = None,
+        query: str | None = None,
+        expand: list[str] | None = None,
+        order_by: str | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[FieldDetail]:
+        """Iterate over every trashed field matching the search."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[FieldDetail], int]:
+            page = await self.search_trashed(
+                start_at=start_at,
+                max_results=max_results,
+                id=id,
+                query=query,
+                expand=expand,
+                order_by=order_by,
+            )
+            return page.values, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def create(self, body: dict[str, Any]) -> FieldDetail:
         response = await self._client.post("/rest/api/3/field", json=body)
         raise_for_response(response)
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 from pyjira.exceptions import raise_for_response
 from pyjira.models.filter import Filter, FilterPage, SharePermission
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -60,6 +61,27 @@ class FilterResource:
         raise_for_response(response)
         return FilterPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        filter_name: str | None = None,
+        expand: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[Filter]:
+        """Iterate over every filter matching the search."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[Filter], int]:
+            page = self.search(
+                start_at=start_at,
+                max_results=max_results,
+                filter_name=filter_name,
+                expand=expand,
+            )
+            return page.values, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def get_favourites(
         self,
         *,
@@ -202,6 +224,27 @@ class AsyncFilterResource:
         raise_for_response(response)
         return FilterPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        filter_name: str | None = None,
+        expand: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[Filter]:
+        """Iterate over every filter matching the search."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[Filter], int]:
+            page = await self.search(
+                start_at=start_at,
+                max_results=max_results,
+                filter_name=filter_name,
+                expand=expand,
+            )
+            return page.values, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def get_favourites(
         self,
         *,
@@ -4,6 +4,8 @@ from typing import TYPE_CHECKING, Any
 
 from pyjira.exceptions import raise_for_response
 from pyjira.models.group import Group, GroupMembers
+from pyjira.models.user import User
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -81,6 +83,30 @@ class GroupResource:
         raise_for_response(response)
         return response.json()
 
+    def bulk_get_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        group_ids: list[str] | None = None,
+        group_names: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[Group]:
+        """Iterate over every group matching the IDs or names."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[Group], int]:
+            page = self.bulk_get(
+                group_ids=group_ids,
+                group_names=group_names,
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return (
+                [Group.model_validate(g) for g in page.get("values", [])],
+                page.get("total", 0),
+            )
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def get_members(
         self,
         *,
@@ -104,6 +130,27 @@ class GroupResource:
         raise_for_response(response)
         return GroupMembers.model_validate(response.json())
 
+    def get_members_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        group_name: str | None = None,
+        group_id: str | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[User]:
+        """Iterate over every member of a group."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[User], int]:
+            page = self.get_members(
+                start_at=start_at,
+                max_results=max_results,
+                group_name=group_name,
+                group_id=group_id,
+            )
+            return page.values, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def add_user(
         self,
         *,
@@ -229,6 +276,30 @@ class AsyncGroupResource:
         raise_for_response(response)
         return response.json()
 
+    def bulk_get_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        group_ids: list[str] | None = None,
+        group_names: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[Group]:
+        """Iterate over every group matching the IDs or names."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[Group], int]:
+            page = await self.bulk_get(
+                group_ids=group_ids,
+                group_names=group_names,
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return (
+                [Group.model_validate(g) for g in page.get("values", [])],
+                page.get("total", 0),
+            )
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def get_members(
         self,
         *,
@@ -252,6 +323,27 @@ class AsyncGroupResource:
         raise_for_response(response)
         return GroupMembers.model_validate(response.json())
 
+    def get_members_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        group_name: str | None = None,
+        group_id: str | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[User]:
+        """Iterate over every member of a group."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[User], int]:
+            page = await self.get_members(
+                start_at=start_at,
+                max_results=max_results,
+                group_name=group_name,
+                group_id=group_id,
+            )
+            return page.values, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def add_user(
         self,
         *,
@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Any
+
+from pyjira.cache import MetadataCache
+from pyjira.exceptions import raise_for_response
+from pyjira.models.issue_metadata import (
+  CreateMetaFieldPage,
+  CreateMetaIssueTypePage,
+  FieldMetadata,
+)
+from pyjira.models.issuetype_full import IssueTypeDetail
+from pyjira.pagination import AsyncPaginator, Paginator
+
+if TYPE_CHECKING:
+  import httpx
+
+
+class IssueMetadataResource:
+  """Sync create/edit metadata with a per (project, issue type) cache."""
+
+  def __init__(
+    self,
+    client: httpx.Client,
+    *,
+    cache: MetadataCache | None = None,
+  ) -> None:
+    self._client = client
+    self.cache = cache if cache is not None else MetadataCache()
+
+  def get_create_issue_types(
+    self,
+    project_id_or_key: str,
+    *,
+    start_at: int = 0,
+    max_results: int = 50,
+  ) -> CreateMetaIssueTypePage:
+    response = self._client.get(
+      f'/rest/api/3/issue/createmeta/{project_id_or_key}/issuetypes',
+      params={'startAt': str(start_at), 'maxResults': str(max_results)},
+    )
+    raise_for_response(response)
+    return CreateMetaIssueTypePage.model_validate(response.json())
+
+  def get_create_issue_types_paginated(
+    self,
+    project_id_or_key: str,
+    *,
+    page_size: int = 50,
+    limit: int | None = None,
+    prefetch: int = 0,
+  ) -> Paginator[IssueTypeDetail]:
+    """Iterate over every issue type the caller can create in a project."""
+    def fetch_page(start_at: int, max_results: int) -> tuple[list[IssueTypeDetail], int]:
+      page = self.get_create_issue_types(
+        project_id_or_key,
+        start_at=start_at,
+        max_results=max_results,
+      )
+      return page.issue_types, page.total
+
+    return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
+  def get_create_fields(
+    self,
+    project_id_or_key: str,
+    issue_type_id: str,
+    *,
+    start_at: int = 0,
+    max_results: int = 50,
+  ) -> CreateMetaFieldPage:
+    response = self._client.get(
+      f'/rest/api/3/issue/createmeta/{project_id_or_key}/issuetypes/{issue_type_id}',
+      params={'startAt': str(start_at), 'maxResults': str(max_results)},
+    )
+    raise_for_response(response)
+    return CreateMetaFieldPage.model_validate(response.json())
+
+  def get_all_create_fields(
+    self,
+    project_id_or_key: str,
+    issue_type_id: str,
+    *,
+    use_cache: bool = True,
+    page_size: int = 50,
+  ) -> list[FieldMetadata]:
+    """Return every create field, reusing any entry cached for the project and type.
+
+    Every call returns fresh models; changing them does not touch the cache.
+    """
+    if use_cache:
+      cached = self.cache.get('create', project_id_or_key, issue_type_id)
+      if cached is not None:
+        return [f.model_copy(deep=True) for f in cached]
+
+    def fetch_page(start_at: int, max_results: int) -> tuple[list[FieldMetadata], int]:
+      page = self.get_create_fields(
+        project_id_or_key,
+        issue_type_id,
+        start_at=start_at,
+        max_results=max_results,
+      )
+      return page.fields, page.total
+
+    fields = list(Paginator(fetch_page, page_size=page_size))
+    self.cache.set('create', project_id_or_key, issue_type_id, fields)
+    return [f.model_copy(deep=True) for f in fields]
+
+  def get_edit_meta(
+    self,
+    issue_id_or_key: str,
+    *,
+    project: str,
+    issue_type: str,
+    use_cache: bool = True,
+  ) -> dict[str, Any]:
+    """Return edit metadata, reusing any entry cached for the issue's project and type.
+
+    Every call returns a fresh dict; changing it does not touch the cache.
+    """
+    if use_cache:
+      cached = self.cache.get('edit', project, issue_type)
+      if cached is not None:
+        return json.loads(cached)
+    response = self._client.get(f'/rest/api/3/issue/{issue_id_or_key}/editmeta')
+    raise_for_response(response)
+    # Cached as the response body, which nothing can mutate.
+    self.cache.set('edit', project, issue_type, response.content)
+    return response.json()
+
+  def invalidate(
+    self,
+    *,
+    project: str | None = None,
+    issue_type: str | None = None,
+  ) -> int:
+    return self.cache.invalidate(project=project, issue_type=issue_type)
+
+
+class AsyncIssueMetadataResource:
+  """Async create/edit metadata with a per (project, issue type) cache."""
+
+  def __init__(
+    self,
+    client: httpx.AsyncClient,
+    *,
+    cache: MetadataCache | None = None,
+  ) -> None:
+    self._client = client
+    self.cache = cache if cache is not None else MetadataCache()
+
+  async def get_create_issue_types(
+    self,
+    project_id_or_key: str,
+    *,
+    start_at: int = 0,
+    max_results: int = 50,
+  ) -> CreateMetaIssueTypePage:
+    response = await self._client.get(
+      f'/rest/api/3/issue/createmeta/{project_id_or_key}/issuetypes',
+      params={'startAt': str(start_at), 'maxResults': str(max_results)},
+    )
+    raise_for_response(response)
+    return CreateMetaIssueTypePage.model_validate(response.json())
+
+  def get_create_issue_types_paginated(
+    self,
+    project_id_or_key: str,
+    *,
+    page_size: int = 50,
+    limit: int | None = None,
+    prefetch: int = 0,
+  ) -> AsyncPaginator[IssueTypeDetail]:
+    """Iterate over every issue type the caller can create in a project."""
+    async def fetch_page(start_at: int, max_results: int) -> tuple[list[IssueTypeDetail], int]:
+      page = await self.get_create_issue_types(
+        project_id_or_key,
+        start_at=start_at,
+        max_results=max_results,
+      )
+      return page.issue_types, page.total
+
+    return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
+  async def get_create_fields(
+    self,
+    project_id_or_key: str,
+    issue_type_id: str,
+    *,
+    start_at: int = 0,
+    max_results: int = 50,
+  ) -> CreateMetaFieldPage:
+    response = await self._client.get(
+      f'/rest/api/3/issue/createmeta/{project_id_or_key}/issuetypes/{issue_type_id}',
+      params={'startAt': str(start_at), 'maxResults': str(max_results)},
+    )
+    raise_for_response(response)
+    return CreateMetaFieldPage.model_validate(response.json())
+
+  async def get_all_create_fields(
+    self,
+    project_id_or_key: str,
+    issue_type_id: str,
+    *,
+    use_cache: bool = True,
+    page_size: int = 50,
+  ) -> list[FieldMetadata]:
+    """Return every create field, reusing any entry cached for the project and type.
+
+    Every call returns fresh models; changing them does not touch the cache.
+    """
+    if use_cache:
+      cached = self.cache.get('create', project_id_or_key, issue_type_id)
+      if cached is not None:
+        return [f.model_copy(deep=True) for f in cached]
+
+    async def fetch_page(start_at: int, max_results: int) -> tuple[list[FieldMetadata], int]:
+      page = await self.get_create_fields(
+        project_id_or_key,
+        issue_type_id,
+        start_at=start_at,
+        max_results=max_results,
+      )
+      return page.fields, page.total
+
+    fields = [f async for f in AsyncPaginator(fetch_page, page_size=page_size)]
+    self.cache.set('create', project_id_or_key, issue_type_id, fields)
+    return [f.model_copy(deep=True) for f in fields]
+
+  async def get_edit_meta(
+    self,
+    issue_id_or_key: str,
+    *,
+    project: str,
+    issue_type: str,
+    use_cache: bool = True,
+  ) -> dict[str, Any]:
+    """Return edit metadata, reusing any entry cached for the issue's project and type.
+
+    Every call returns a fresh dict; changing it does not touch the cache.
+    """
+    if use_cache:
+      cached = self.cache.get('edit', project, issue_type)
+      if cached is not None:
+        return json.loads(cached)
+    response = await self._client.get(f'/rest/api/3/issue/{issue_id_or_key}/editmeta')
+    raise_for_response(response)
+    # Cached as the response body, which nothing can mutate.
+    self.cache.set('edit', project, issue_type, response.content)
+    return response.json()
+
+  def invalidate(
+    self,
+    *,
+    project: str | None = None,
+    issue_type: str | None = None,
+  ) -> int:
+    return self.cache.invalidate(project=project, issue_type=issue_type)
@@ -1,9 +1,26 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import time
+from collections.abc import Callable
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from pyjira.exceptions import raise_for_response
+from pyjira.bulk import (
+    BulkResult,
+    ProgressCallback,
+    arun_per_issue,
+    chunked,
+    key_lookup_jql,
+    match_issue_ids,
+    merge_task_results,
+    run_per_issue,
+    unresolved_keys,
+)
+from pyjira.cache import MetadataCache
+from pyjira.exceptions import JiraError, NotFoundError, raise_for_response
+from pyjira.models.bulk import BulkOperationProgress, BulkOperationSubmission
 from pyjira.models.issue import (
     Attachment,
     ChangeHistory,
@@ -17,6 +34,7 @@ from pyjira.models.issue import (
     Worklog,
     WorklogPage,
 )
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -38,11 +56,79 @@ def _build_params(
     return params
 
 
+def _transition_body(
+    transition_id: str,
+    send_notification: bool,
+) -> Callable[[list[str]], dict[str, Any]]:
+    def build(chunk: list[str]) -> dict[str, Any]:
+        return {
+            "bulkTransitionInputs": [
+                {"selectedIssueIdsOrKeys": chunk, "transitionId": transition_id},
+            ],
+            "sendBulkNotification": send_notification,
+        }
+
+    return build
+
+
+def _edit_body(
+    edited_fields_input: dict[str, Any],
+    selected_actions: list[str],
+    send_notification: bool,
+) -> Callable[[list[str]], dict[str, Any]]:
+    def build(chunk: list[str]) -> dict[str, Any]:
+        return {
+            "selectedIssueIdsOrKeys": chunk,
+            "selectedActions": selected_actions,
+            "editedFieldsInput": edited_fields_input,
+            "sendBulkNotification": send_notification,
+        }
+
+    return build
+
+
+# Search page size used to resolve keys to IDs before a bulk submission.
+_KEY_LOOKUP_PAGE = 100
+
+
+def _key_lookup_body(keys: list[str], start_at: int) -> dict[str, Any]:
+    return {
+        "jql": key_lookup_jql(keys),
+        "fields": ["key"],
+        "startAt": start_at,
+        "maxResults": _KEY_LOOKUP_PAGE,
+        # Unknown keys are reported per issue by the bulk task, not here.
+        "validateQuery": "warn",
+    }
+
+
+def _submitted(chunk: list[str], ids: dict[str, str]) -> list[str]:
+    by_key = {key: issue_id for issue_id, key in ids.items()}
+    return [by_key.get(key, key) for key in chunk]
+
+
+def _task_id(response: httpx.Response) -> str:
+    task_id = BulkOperationSubmission.model_validate(response.json()).task_id
+    if task_id is None:
+        raise JiraError(
+            "Bulk operation was accepted without a taskId",
+            status_code=response.status_code,
+            response=response,
+        )
+    return task_id
+
+
 class IssueResource:
     """Sync operations for Jira issues."""
 
-    def __init__(self, client: httpx.Client) -> None:
+    def __init__(
+        self,
+        client: httpx.Client,
+        *,
+        cache: MetadataCache | None = None,
+    ) -> None:
         self._client = client
+        self._metadata_cache = cache if cache is not None else MetadataCache()
 
     # ── Core CRUD ──────────────────────────────────────────────────────
 
@@ -166,6 +252,25 @@ class IssueResource:
         raise_for_response(response)
         return ChangelogPage.model_validate(response.json())
 
+    def get_changelogs_paginated(
+        self,
+        issue_id_or_key: str,
+        *,
+        page_size: int = 100,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[ChangeHistory]:
+        """Iterate over an issue's full changelog."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[ChangeHistory], int]:
+            page = self.get_changelogs(
+                issue_id_or_key,
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return page.histories, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def get_changelogs_by_ids(
         self,
         issue_id_or_key: str,
@@ -187,17 +292,32 @@ class IssueResource:
         *,
         override_screen_security: bool = False,
         override_editable_flag: bool = False,
+        project: str | None = None,
+        issue_type: str | None = None,
     ) -> dict[str, Any]:
+        """Return the fields that can be edited on an issue.
+
+        With ``project`` and ``issue_type`` the result is shared through the
+        client's metadata cache with every issue of that pair (see
+        ``issue_metadata.get_edit_meta``). Overrides always fetch.
+        """
         params: dict[str, str] = {}
         if override_screen_security:
             params["overrideScreenSecurity"] = "true"
         if override_editable_flag:
             params["overrideEditableFlag"] = "true"
+        cacheable = project is not None and issue_type is not None and not params
+        if cacheable:
+            cached = self._metadata_cache.get("edit", project, issue_type)
+            if cached is not None:
+                return json.loads(cached)
         response = self._client.get(
             f"/rest/api/3/issue/{issue_id_or_key}/editmeta",
             params=params,
         )
         raise_for_response(response)
+        if cacheable:
+            self._metadata_cache.set("edit", project, issue_type, response.content)
         return response.json()
 
     # ── Notify ─────────────────────────────────────────────────────────
@@ -460,6 +580,31 @@ class IssueResource:
         raise_for_response(response)
         return WorklogPage.model_validate(response.json())
 
+    def get_worklogs_paginated(
+        self,
+        issue_id_or_key: str,
+        *,
+        page_size: int = 5000,
+        limit: int | None = None,
+        started_after: int | None = None,
+        started_before: int | None = None,
+        expand: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[Worklog]:
+        """Iterate over every worklog on an issue."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[Worklog], int]:
+            page = self.get_worklogs(
+                issue_id_or_key,
+                start_at=start_at,
+                max_results=max_results,
+                started_after=started_after,
+                started_before=started_before,
+                expand=expand,
+            )
+            return page.worklogs, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def add_worklog(
         self,
         issue_id_or_key: str,
@@ -569,12 +714,183 @@ class IssueResource:
         )
         raise_for_response(response)
 
+    # ── Bulk operations ────────────────────────────────────────────────
+
+    def get_bulk_operation_progress(self, task_id: str) -> BulkOperationProgress:
+        response = self._client.get(f"/rest/api/3/bulk/queue/{task_id}")
+        raise_for_response(response)
+        return BulkOperationProgress.model_validate(response.json())
+
+    def bulk_transition(
+        self,
+        issue_ids_or_keys: list[str],
+        transition_id: str,
+        *,
+        use_bulk_api: bool = True,
+        send_notification: bool = True,
+        max_workers: int = 8,
+        poll_interval: float = 1.0,
+        poll_timeout: float = 600.0,
+        on_progress: ProgressCallback | None = None,
+    ) -> dict[str, BulkResult]:
+        """Transition many issues, returning a result per issue.
+
+        Uses the bulk transition endpoint in chunks of 1000 issues and falls
+        back to concurrent per-issue transitions when it is unavailable. A
+        chunk whose task cannot be polled, or does not finish within
+        ``poll_timeout`` seconds, is reported as failed.
+        """
+        if use_bulk_api:
+            try:
+                return self._run_bulk_task(
+                    "/rest/api/3/bulk/issues/transition",
+                    issue_ids_or_keys,
+                    _transition_body(transition_id, send_notification),
+                    poll_interval=poll_interval,
+                    poll_timeout=poll_timeout,
+                    on_progress=on_progress,
+                )
+            except NotFoundError:
+                pass
+        return run_per_issue(
+            lambda key: self.transition(key, transition_id),
+            issue_ids_or_keys,
+            max_workers=max_workers,
+            on_progress=on_progress,
+        )
+
+    def bulk_edit(
+        self,
+        issue_ids_or_keys: list[str],
+        *,
+        fields: dict[str, Any] | None = None,
+        update: dict[str, Any] | None = None,
+        notify_users: bool = True,
+        edited_fields_input: dict[str, Any] | None = None,
+        selected_actions: list[str] | None = None,
+        max_workers: int = 8,
+        poll_interval: float = 1.0,
+        poll_timeout: float = 600.0,
+        on_progress: ProgressCallback | None = None,
+    ) -> dict[str, BulkResult]:
+        """Edit many issues, returning a result per issue.
+
+        ``edited_fields_input`` and ``selected_actions`` select the bulk edit
+        endpoint. ``fields``/``update`` are applied with concurrent per-issue
+        updates, either directly or as the fallback when the endpoint is missing.
+        """
+        if edited_fields_input is None and not (fields or update):
+            raise ValueError("Provide fields, update or edited_fields_input")
+        if edited_fields_input is not None:
+            try:
+                return self._run_bulk_task(
+                    "/rest/api/3/bulk/issues/fields",
+                    issue_ids_or_keys,
+                    _edit_body(
+                        edited_fields_input,
+                        selected_actions or list(edited_fields_input),
+                        notify_users,
+                    ),
+                    poll_interval=poll_interval,
+                    poll_timeout=poll_timeout,
+                    on_progress=on_progress,
+                )
+            except NotFoundError:
+                if not (fields or update):
+                    raise
+        return run_per_issue(
+            lambda key: self.update(
+                key, fields=fields, update=update, notify_users=notify_users
+            ),
+            issue_ids_or_keys,
+            max_workers=max_workers,
+            on_progress=on_progress,
+        )
+
+    def _run_bulk_task(
+        self,
+        path: str,
+        issue_ids_or_keys: list[str],
+        build_body: Callable[[list[str]], dict[str, Any]],
+        *,
+        poll_interval: float,
+        poll_timeout: float,
+        on_progress: ProgressCallback | None,
+    ) -> dict[str, BulkResult]:
+        keys = list(dict.fromkeys(issue_ids_or_keys))
+        results: dict[str, BulkResult] = {}
+        for index, chunk in enumerate(chunked(keys)):
+            try:
+                ids = self._resolve_issue_ids(chunk)
+            except JiraError as exc:
+                results.update({k: BulkResult.from_exception(k, exc) for k in chunk})
+                continue
+            try:
+                response = self._client.post(path, json=build_body(_submitted(chunk, ids)))
+                raise_for_response(response)
+                task_id = _task_id(response)
+            except JiraError as exc:
+                # Only a missing endpoint on the first submission means the
+                # caller should fall back to per-issue calls.
+                if index == 0 and isinstance(exc, NotFoundError):
+                    raise
+                results.update({k: BulkResult.from_exception(k, exc) for k in chunk})
+                continue
+            deadline = time.monotonic() + poll_timeout
+            try:
+                while True:
+                    progress = self.get_bulk_operation_progress(task_id)
+                    if on_progress:
+                        percent = progress.progress_percent or 0
+                        on_progress(len(results) + len(chunk) * percent // 100, len(keys))
+                    if progress.is_finished:
+                        break
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(
+                            f"Bulk task {task_id} did not finish within {poll_timeout}s"
+                        )
+                    time.sleep(poll_interval)
+            except Exception as exc:
+                results.update({k: BulkResult.from_exception(k, exc) for k in chunk})
+                continue
+            results.update(
+                merge_task_results(
+                    chunk,
+                    progress.status,
+                    progress.processed_accessible_issues,
+                    progress.failed_accessible_issues,
+                    ids,
+                )
+            )
+        return results
+
+    def _resolve_issue_ids(self, chunk: list[str]) -> dict[str, str]:
+        """Map issue IDs to the identifiers in ``chunk``, looking keys up by JQL."""
+        keys = unresolved_keys(chunk)
+        issues: list[dict[str, Any]] = []
+        while len(issues) < len(keys):
+            response = self._client.post(
+                "/rest/api/3/search", json=_key_lookup_body(keys, len(issues))
+            )
+            raise_for_response(response)
+            page = response.json().get("issues") or []
+            if not page:
+                break
+            issues.extend(page)
+        return match_issue_ids(chunk, issues)
+
 
 class AsyncIssueResource:
     """Async operations for Jira issues."""
 
-    def __init__(self, client: httpx.AsyncClient) -> None:
+    def __init__(
+        self,
+        client: httpx.AsyncClient,
+        *,
+        cache: MetadataCache | None = None,
+    ) -> None:
         self._client = client
+        self._metadata_cache = cache if cache is not None else MetadataCache()
 
     # ── Core CRUD ──────────────────────────────────────────────────────
 
@@ -698,6 +1014,25 @@ class AsyncIssueResource:
         raise_for_response(response)
         return ChangelogPage.model_validate(response.json())
 
+    def get_changelogs_paginated(
+        self,
+        issue_id_or_key: str,
+        *,
+        page_size: int = 100,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[ChangeHistory]:
+        """Iterate over an issue's full changelog."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[ChangeHistory], int]:
+            page = await self.get_changelogs(
+                issue_id_or_key,
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return page.histories, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def get_changelogs_by_ids(
         self,
         issue_id_or_key: str,
@@ -719,17 +1054,32 @@ class AsyncIssueResource:
         *,
         override_screen_security: bool = False,
         override_editable_flag: bool = False,
+        project: str | None = None,
+        issue_type: str | None = None,
     ) -> dict[str, Any]:
+        """Return the fields that can be edited on an issue.
+
+        With ``project`` and ``issue_type`` the result is shared through the
+        client's metadata cache with every issue of that pair (see
+        ``issue_metadata.get_edit_meta``). Overrides always fetch.
+        """
         params: dict[str, str] = {}
         if override_screen_security:
             params["overrideScreenSecurity"] = "true"
         if override_editable_flag:
             params["overrideEditableFlag"] = "true"
+        cacheable = project is not None and issue_type is not None and not params
+        if cacheable:
+            cached = self._metadata_cache.get("edit", project, issue_type)
+            if cached is not None:
+                return json.loads(cached)
         response = await self._client.get(
             f"/rest/api/3/issue/{issue_id_or_key}/editmeta",
             params=params,
         )
         raise_for_response(response)
+        if cacheable:
+            self._metadata_cache.set("edit", project, issue_type, response.content)
         return response.json()
 
     # ── Notify ─────────────────────────────────────────────────────────
@@ -992,6 +1342,31 @@ class AsyncIssueResource:
         raise_for_response(response)
         return WorklogPage.model_validate(response.json())
 
+    def get_worklogs_paginated(
+        self,
+        issue_id_or_key: str,
+        *,
+        page_size: int = 5000,
+        limit: int | None = None,
+        started_after: int | None = None,
+        started_before: int | None = None,
+        expand: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[Worklog]:
+        """Iterate over every worklog on an issue."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[Worklog], int]:
+            page = await self.get_worklogs(
+                issue_id_or_key,
+                start_at=start_at,
+                max_results=max_results,
+                started_after=started_after,
+                started_before=started_before,
+                expand=expand,
+            )
+            return page.worklogs, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def add_worklog(
         self,
         issue_id_or_key: str,
@@ -1100,3 +1475,168 @@ class AsyncIssueResource:
             params=params,
         )
         raise_for_response(response)
+
+    # ── Bulk operations ────────────────────────────────────────────────
+
+    async def get_bulk_operation_progress(self, task_id: str) -> BulkOperationProgress:
+        response = await self._client.get(f"/rest/api/3/bulk/queue/{task_id}")
+        raise_for_response(response)
+        return BulkOperationProgress.model_validate(response.json())
+
+    async def bulk_transition(
+        self,
+        issue_ids_or_keys: list[str],
+        transition_id: str,
+        *,
+        use_bulk_api: bool = True,
+        send_notification: bool = True,
+        max_workers: int = 8,
+        poll_interval: float = 1.0,
+        poll_timeout: float = 600.0,
+        on_progress: ProgressCallback | None = None,
+    ) -> dict[str, BulkResult]:
+        """Transition many issues, returning a result per issue.
+
+        Uses the bulk transition endpoint in chunks of 1000 issues and falls
+        back to concurrent per-issue transitions when it is unavailable. A
+        chunk whose task cannot be polled, or does not finish within
+        ``poll_timeout`` seconds, is reported as failed.
+        """
+        if use_bulk_api:
+            try:
+                return await self._run_bulk_task(
+                    "/rest/api/3/bulk/issues/transition",
+                    issue_ids_or_keys,
+                    _transition_body(transition_id, send_notification),
+                    poll_interval=poll_interval,
+                    poll_timeout=poll_timeout,
+                    on_progress=on_progress,
+                )
+            except NotFoundError:
+                pass
+        return await arun_per_issue(
+            lambda key: self.transition(key, transition_id),
+            issue_ids_or_keys,
+            max_workers=max_workers,
+            on_progress=on_progress,
+        )
+
+    async def bulk_edit(
+        self,
+        issue_ids_or_keys: list[str],
+        *,
+        fields: dict[str, Any] | None = None,
+        update: dict[str, Any] | None = None,
+        notify_users: bool = True,
+        edited_fields_input: dict[str, Any] | None = None,
+        selected_actions: list[str] | None = None,
+        max_workers: int = 8,
+        poll_interval: float = 1.0,
+        poll_timeout: float = 600.0,
+        on_progress: ProgressCallback | None = None,
+    ) -> dict[str, BulkResult]:
+        """Edit many issues, returning a result per issue.
+
+        ``edited_fields_input`` and ``selected_actions`` select the bulk edit
+        endpoint. ``fields``/``update`` are applied with concurrent per-issue
+        updates, either directly or as the fallback when the endpoint is missing.
+        """
+        if edited_fields_input is None and not (fields or update):
+            raise ValueError("Provide fields, update or edited_fields_input")
+        if edited_fields_input is not None:
+            try:
+                return await self._run_bulk_task(
+                    "/rest/api/3/bulk/issues/fields",
+                    issue_ids_or_keys,
+                    _edit_body(
+                        edited_fields_input,
+                        selected_actions or list(edited_fields_input),
+                        notify_users,
+                    ),
+                    poll_interval=poll_interval,
+                    poll_timeout=poll_timeout,
+                    on_progress=on_progress,
+                )
+            except NotFoundError:
+                if not (fields or update):
+                    raise
+        return await arun_per_issue(
+            lambda key: self.update(
+                key, fields=fields, update=update, notify_users=notify_users
+            ),
+            issue_ids_or_keys,
+            max_workers=max_workers,
+            on_progress=on_progress,
+        )
+
+    async def _run_bulk_task(
+        self,
+        path: str,
+        issue_ids_or_keys: list[str],
+        build_body: Callable[[list[str]], dict[str, Any]],
+        *,
+        poll_interval: float,
+        poll_timeout: float,
+        on_progress: ProgressCallback | None,
+    ) -> dict[str, BulkResult]:
+        keys = list(dict.fromkeys(issue_ids_or_keys))
+        results: dict[str, BulkResult] = {}
+        for index, chunk in enumerate(chunked(keys)):
+            try:
+                ids = await self._resolve_issue_ids(chunk)
+            except JiraError as exc:
+                results.update({k: BulkResult.from_exception(k, exc) for k in chunk})
+                continue
+            try:
+                response = await self._client.post(path, json=build_body(_submitted(chunk, ids)))
+                raise_for_response(response)
+                task_id = _task_id(response)
+            except JiraError as exc:
+                # Only a missing endpoint on the first submission means the
+                # caller should fall back to per-issue calls.
+                if index == 0 and isinstance(exc, NotFoundError):
+                    raise
+                results.update({k: BulkResult.from_exception(k, exc) for k in chunk})
+                continue
+            deadline = time.monotonic() + poll_timeout
+            try:
+                while True:
+                    progress = await self.get_bulk_operation_progress(task_id)
+                    if on_progress:
+                        percent = progress.progress_percent or 0
+                        on_progress(len(results) + len(chunk) * percent // 100, len(keys))
+                    if progress.is_finished:
+                        break
+                    if time.monotonic() >= deadline:
+                        raise TimeoutError(
+                            f"Bulk task {task_id} did not finish within {poll_timeout}s"
+                        )
+                    await asyncio.sleep(poll_interval)
+            except Exception as exc:
+                results.update({k: BulkResult.from_exception(k, exc) for k in chunk})
+                continue
+            results.update(
+                merge_task_results(
+                    chunk,
+                    progress.status,
+                    progress.processed_accessible_issues,
+                    progress.failed_accessible_issues,
+                    ids,
+                )
+            )
+        return results
+
+    async def _resolve_issue_ids(self, chunk: list[str]) -> dict[str, str]:
+        """Map issue IDs to the identifiers in ``chunk``, looking keys up by JQL."""
+        keys = unresolved_keys(chunk)
+        issues: list[dict[str, Any]] = []
+        while len(issues) < len(keys):
+            response = await self._client.post(
+                "/rest/api/3/search", json=_key_lookup_body(keys, len(issues))
+            )
+            raise_for_response(response)
+            page = response.json().get("issues") or []
+            if not page:
+                break
+            issues.extend(page)
+        return match_issue_ids(chunk, issues)
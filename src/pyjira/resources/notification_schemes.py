@@ -7,6 +7,7 @@ from pyjira.models.notification_scheme import (
     NotificationScheme,
     NotificationSchemePage,
 )
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -35,6 +36,25 @@ class NotificationSchemeResource:
         raise_for_response(response)
         return NotificationSchemePage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        expand: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[NotificationScheme]:
+        """Iterate over every notification scheme."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[NotificationScheme], int]:
+            page = self.search(
+                start_at=start_at,
+                max_results=max_results,
+                expand=expand,
+            )
+            return page.values, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def get(
         self,
         scheme_id: str,
@@ -113,6 +133,25 @@ class AsyncNotificationSchemeResource:
         raise_for_response(response)
         return NotificationSchemePage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        expand: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[NotificationScheme]:
+        """Iterate over every notification scheme."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[NotificationScheme], int]:
+            page = await self.search(
+                start_at=start_at,
+                max_results=max_results,
+                expand=expand,
+            )
+            return page.values, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def get(
         self,
         scheme_id: str,
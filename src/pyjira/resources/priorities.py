@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 from pyjira.exceptions import raise_for_response
 from pyjira.models.priority_full import PriorityDetail, PriorityPage
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -39,6 +40,23 @@ class PriorityResource:
         raise_for_response(response)
         return PriorityPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[PriorityDetail]:
+        """Iterate over every priority."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[PriorityDetail], int]:
+            page = self.search(
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return page.values, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def create(self, body: dict[str, Any]) -> dict[str, Any]:
         response = self._client.post("/rest/api/3/priority", json=body)
         raise_for_response(response)
@@ -104,6 +122,23 @@ class AsyncPriorityResource:
         raise_for_response(response)
         return PriorityPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[PriorityDetail]:
+        """Iterate over every priority."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[PriorityDetail], int]:
+            page = await self.search(
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return page.values, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def create(self, body: dict[str, Any]) -> dict[str, Any]:
         response = await self._client.post("/rest/api/3/priority", json=body)
         raise_for_response(response)
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 from pyjira.exceptions import raise_for_response
 from pyjira.models.resolution_full import ResolutionDetail, ResolutionPage
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -42,6 +43,23 @@ class ResolutionResource:
         raise_for_response(response)
         return ResolutionPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[ResolutionDetail]:
+        """Iterate over every resolution."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[ResolutionDetail], int]:
+            page = self.search(
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return page.values, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def create(self, body: dict[str, Any]) -> dict[str, Any]:
         response = self._client.post("/rest/api/3/resolution", json=body)
         raise_for_response(response)
@@ -109,6 +127,23 @@ class AsyncResolutionResource:
         raise_for_response(response)
         return ResolutionPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[ResolutionDetail]:
+        """Iterate over every resolution."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[ResolutionDetail], int]:
+            page = await self.search(
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return page.values, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def create(self, body: dict[str, Any]) -> dict[str, Any]:
         response = await self._client.post("/rest/api/3/resolution", json=body)
         raise_for_response(response)
@@ -7,9 +7,11 @@ from pyjira.models.screen import (
     Screen,
     ScreenField,
     ScreenPage,
+    ScreenScheme,
     ScreenSchemePage,
     ScreenTab,
 )
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -35,6 +37,23 @@ class ScreenResource:
         raise_for_response(response)
         return ScreenPage.model_validate(response.json())
 
+    def list_paginated(
+        self,
+        *,
+        page_size: int = 100,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[Screen]:
+        """Iterate over every screen."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[Screen], int]:
+            page = self.list(
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return page.values, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def create(self, body: dict[str, Any]) -> Screen:
         response = self._client.post("/rest/api/3/screens", json=body)
         raise_for_response(response)
@@ -131,6 +150,23 @@ class ScreenResource:
         raise_for_response(response)
         return ScreenSchemePage.model_validate(response.json())
 
+    def get_screen_schemes_paginated(
+        self,
+        *,
+        page_size: int = 25,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[ScreenScheme]:
+        """Iterate over every screen scheme."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[ScreenScheme], int]:
+            page = self.get_screen_schemes(
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return page.values, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
 
 class AsyncScreenResource:
     """Async operations for Jira screens, tabs, fields, and screen schemes."""
@@ -152,6 +188,23 @@ class AsyncScreenResource:
         raise_for_response(response)
         return ScreenPage.model_validate(response.json())
 
+    def list_paginated(
+        self,
+        *,
+        page_size: int = 100,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[Screen]:
+        """Iterate over every screen."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[Screen], int]:
+            page = await self.list(
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return page.values, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def create(self, body: dict[str, Any]) -> Screen:
         response = await self._client.post("/rest/api/3/screens", json=body)
         raise_for_response(response)
@@ -247,3 +300,20 @@ class AsyncScreenResource:
         response = await self._client.get("/rest/api/3/screenscheme", params=params)
         raise_for_response(response)
         return ScreenSchemePage.model_validate(response.json())
+
+    def get_screen_schemes_paginated(
+        self,
+        *,
+        page_size: int = 25,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[ScreenScheme]:
+        """Iterate over every screen scheme."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[ScreenScheme], int]:
+            page = await self.get_screen_schemes(
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return page.values, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
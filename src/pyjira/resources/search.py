@@ -1,16 +1,43 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from pyjira.exceptions import raise_for_response
 from pyjira.models.issue import Issue
 from pyjira.models.search import SearchResults
-from pyjira.pagination import AsyncPaginator, Paginator
+from pyjira.pagination import AsyncPaginator, PageSizeTuner, Paginator, PaginatorCheckpoint
+from pyjira.parsing import AsyncPipelinedFetcher, PipelinedFetcher, parse_search_results
 
 if TYPE_CHECKING:
+  from collections.abc import Callable
+  from concurrent.futures import Executor
+
   import httpx
 
 
+def _build_params(
+  jql: str,
+  *,
+  start_at: int,
+  max_results: int,
+  fields: list[str] | None,
+  expand: list[str] | None,
+  validate_query: str | None = None,
+) -> dict[str, str]:
+  params: dict[str, str] = {
+    'jql': jql,
+    'startAt': str(start_at),
+    'maxResults': str(max_results),
+  }
+  if fields:
+    params['fields'] = ','.join(fields)
+  if expand:
+    params['expand'] = ','.join(expand)
+  if validate_query:
+    params['validateQuery'] = validate_query
+  return params
+
+
 class SearchResource:
   """Sync JQL search operations."""
 
@@ -27,29 +54,96 @@ class SearchResource:
     expand: list[str] | None = None,
     validate_query: str | None = None,
   ) -> SearchResults:
-    params: dict[str, str] = {
-      'jql': jql,
-      'startAt': str(start_at),
-      'maxResults': str(max_results),
-    }
-    if fields:
-      params['fields'] = ','.join(fields)
-    if expand:
-      params['expand'] = ','.join(expand)
-    if validate_query:
-      params['validateQuery'] = validate_query
+    params = _build_params(
+      jql,
+      start_at=start_at,
+      max_results=max_results,
+      fields=fields,
+      expand=expand,
+      validate_query=validate_query,
+    )
     response = self._client.get('/rest/api/3/search', params=params)
     raise_for_response(response)
     return SearchResults.model_validate(response.json())
 
+  def jql_raw(
+    self,
+    jql: str,
+    *,
+    start_at: int = 0,
+    max_results: int = 50,
+    fields: list[str] | None = None,
+    expand: list[str] | None = None,
+  ) -> dict[str, Any]:
+    """Like ``jql`` but return the decoded JSON without model validation."""
+    params = _build_params(
+      jql,
+      start_at=start_at,
+      max_results=max_results,
+      fields=fields,
+      expand=expand,
+    )
+    response = self._client.get('/rest/api/3/search', params=params)
+    raise_for_response(response)
+    return response.json()
+
   def jql_paginated(
     self,
     jql: str,
     *,
     page_size: int = 50,
+    limit: int | None = None,
+    adaptive: bool | PageSizeTuner = False,
     fields: list[str] | None = None,
     expand: list[str] | None = None,
+    parse_executor: Executor | None = None,
+    prefetch: int = 0,
+    checkpoint: PaginatorCheckpoint | None = None,
+    checkpoint_every: int | None = None,
+    on_checkpoint: Callable[[PaginatorCheckpoint], None] | None = None,
   ) -> Paginator[Issue]:
+    """Iterate over every issue matching ``jql``, or the first ``limit``.
+
+    ``prefetch=N`` fetches up to N pages ahead. With ``parse_executor``
+    (typically a ``ProcessPoolExecutor``), raw page bodies are decoded and
+    validated in the executor while those pages are fetched, so parsing no
+    longer holds this thread's GIL.
+
+    Pass ``checkpoint`` to resume an earlier iteration of the same query, and
+    ``on_checkpoint`` with ``checkpoint_every=N`` to persist progress every N
+    pages (see ``PaginatorCheckpoint.save``). ``adaptive`` tunes
+    ``maxResults`` per request from latency and response size (see
+    ``PageSizeTuner``); it cannot be combined with ``prefetch`` or
+    ``parse_executor``.
+    """
+    tuner = PageSizeTuner(page_size) if adaptive is True else adaptive or None
+    resume = {
+      'limit': limit,
+      'adaptive': tuner or False,
+      'params': {'jql': jql, 'fields': fields, 'expand': expand},
+      'checkpoint': checkpoint,
+      'checkpoint_every': checkpoint_every,
+      'on_checkpoint': on_checkpoint,
+    }
+    if parse_executor is not None:
+      if tuner is not None:
+        raise ValueError('Adaptive page sizes cannot be combined with parse_executor')
+      def fetch_raw(start_at: int, max_results: int) -> bytes:
+        params = _build_params(
+          jql,
+          start_at=start_at,
+          max_results=max_results,
+          fields=fields,
+          expand=expand,
+        )
+        response = self._client.get('/rest/api/3/search', params=params)
+        raise_for_response(response)
+        return response.content
+
+      stop = None if limit is None else (checkpoint.start_at + limit - checkpoint.yielded if checkpoint else limit)
+      pipelined = PipelinedFetcher(fetch_raw, parse_search_results, parse_executor, prefetch=prefetch, stop=stop)
+      return Paginator(pipelined, page_size=page_size, **resume)
+
     def fetch_page(start_at: int, max_results: int) -> tuple[list[Issue], int]:
       results = self.jql(
         jql,
@@ -60,7 +154,20 @@ class SearchResource:
       )
       return results.issues, results.total
 
-    return Paginator(fetch_page, page_size=page_size)
+    def fetch_tuned(start_at: int, max_results: int) -> tuple[list[Issue], int]:
+      params = _build_params(
+        jql,
+        start_at=start_at,
+        max_results=max_results,
+        fields=fields,
+        expand=expand,
+      )
+      response = self._client.get('/rest/api/3/search', params=params)
+      raise_for_response(response)
+      tuner.record_bytes(len(response.content))
+      return parse_search_results(response.content)
+
+    return Paginator(fetch_page if tuner is None else fetch_tuned, page_size=page_size, prefetch=prefetch, **resume)
 
 
 class AsyncSearchResource:
@@ -79,29 +186,90 @@ class AsyncSearchResource:
     expand: list[str] | None = None,
     validate_query: str | None = None,
   ) -> SearchResults:
-    params: dict[str, str] = {
-      'jql': jql,
-      'startAt': str(start_at),
-      'maxResults': str(max_results),
-    }
-    if fields:
-      params['fields'] = ','.join(fields)
-    if expand:
-      params['expand'] = ','.join(expand)
-    if validate_query:
-      params['validateQuery'] = validate_query
+    params = _build_params(
+      jql,
+      start_at=start_at,
+      max_results=max_results,
+      fields=fields,
+      expand=expand,
+      validate_query=validate_query,
+    )
     response = await self._client.get('/rest/api/3/search', params=params)
     raise_for_response(response)
     return SearchResults.model_validate(response.json())
 
+  async def jql_raw(
+    self,
+    jql: str,
+    *,
+    start_at: int = 0,
+    max_results: int = 50,
+    fields: list[str] | None = None,
+    expand: list[str] | None = None,
+  ) -> dict[str, Any]:
+    """Like ``jql`` but return the decoded JSON without model validation."""
+    params = _build_params(
+      jql,
+      start_at=start_at,
+      max_results=max_results,
+      fields=fields,
+      expand=expand,
+    )
+    response = await self._client.get('/rest/api/3/search', params=params)
+    raise_for_response(response)
+    return response.json()
+
   def jql_paginated(
     self,
     jql: str,
     *,
     page_size: int = 50,
+    limit: int | None = None,
+    adaptive: bool | PageSizeTuner = False,
     fields: list[str] | None = None,
     expand: list[str] | None = None,
+    parse_executor: Executor | None = None,
+    prefetch: int = 0,
+    checkpoint: PaginatorCheckpoint | None = None,
+    checkpoint_every: int | None = None,
+    on_checkpoint: Callable[[PaginatorCheckpoint], None] | None = None,
   ) -> AsyncPaginator[Issue]:
+    """Iterate over every issue matching ``jql``, or the first ``limit``.
+
+    ``prefetch=N`` fetches up to N pages ahead as tasks. With
+    ``parse_executor``, pages are decoded and validated in the executor
+    instead of on the event loop while those pages are fetched.
+    Checkpoint and adaptive options behave as in
+    ``SearchResource.jql_paginated``.
+    """
+    tuner = PageSizeTuner(page_size) if adaptive is True else adaptive or None
+    resume = {
+      'limit': limit,
+      'adaptive': tuner or False,
+      'params': {'jql': jql, 'fields': fields, 'expand': expand},
+      'checkpoint': checkpoint,
+      'checkpoint_every': checkpoint_every,
+      'on_checkpoint': on_checkpoint,
+    }
+    if parse_executor is not None:
+      if tuner is not None:
+        raise ValueError('Adaptive page sizes cannot be combined with parse_executor')
+      async def fetch_raw(start_at: int, max_results: int) -> bytes:
+        params = _build_params(
+          jql,
+          start_at=start_at,
+          max_results=max_results,
+          fields=fields,
+          expand=expand,
+        )
+        response = await self._client.get('/rest/api/3/search', params=params)
+        raise_for_response(response)
+        return response.content
+
+      stop = None if limit is None else (checkpoint.start_at + limit - checkpoint.yielded if checkpoint else limit)
+      pipelined = AsyncPipelinedFetcher(fetch_raw, parse_search_results, parse_executor, prefetch=prefetch, stop=stop)
+      return AsyncPaginator(pipelined, page_size=page_size, **resume)
+
     async def fetch_page(start_at: int, max_results: int) -> tuple[list[Issue], int]:
       results = await self.jql(
         jql,
@@ -112,4 +280,17 @@ class AsyncSearchResource:
       )
       return results.issues, results.total
 
-    return AsyncPaginator(fetch_page, page_size=page_size)
+    async def fetch_tuned(start_at: int, max_results: int) -> tuple[list[Issue], int]:
+      params = _build_params(
+        jql,
+        start_at=start_at,
+        max_results=max_results,
+        fields=fields,
+        expand=expand,
+      )
+      response = await self._client.get('/rest/api/3/search', params=params)
+      raise_for_response(response)
+      tuner.record_bytes(len(response.content))
+      return parse_search_results(response.content)
+
+    return AsyncPaginator(fetch_page if tuner is None else fetch_tuned, page_size=page_size, prefetch=prefetch, **resume)
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 from pyjira.exceptions import raise_for_response
 from pyjira.models.status_full import StatusDetail, StatusPage
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -50,6 +51,27 @@ class StatusResource:
         raise_for_response(response)
         return StatusPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        search_string: str | None = None,
+        expand: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[StatusDetail]:
+        """Iterate over every status matching the search."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[StatusDetail], int]:
+            page = self.search(
+                start_at=start_at,
+                max_results=max_results,
+                search_string=search_string,
+                expand=expand,
+            )
+            return page.values, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def create(self, body: dict[str, Any]) -> list[StatusDetail]:
         response = self._client.post("/rest/api/3/statuses", json=body)
         raise_for_response(response)
@@ -109,6 +131,27 @@ class AsyncStatusResource:
         raise_for_response(response)
         return StatusPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        search_string: str | None = None,
+        expand: list[str] | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[StatusDetail]:
+        """Iterate over every status matching the search."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[StatusDetail], int]:
+            page = await self.search(
+                start_at=start_at,
+                max_results=max_results,
+                search_string=search_string,
+                expand=expand,
+            )
+            return page.values, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def create(self, body: dict[str, Any]) -> list[StatusDetail]:
         response = await self._client.post("/rest/api/3/statuses", json=body)
         raise_for_response(response)
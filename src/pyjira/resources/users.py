@@ -4,10 +4,15 @@ from typing import TYPE_CHECKING
 
 from pyjira.exceptions import raise_for_response
 from pyjira.models.user import User
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
   import httpx
 
+# Empty pages in a row that end a user search. A page whose users were all
+# filtered out does not end the listing on its own.
+_EMPTY_RUN = 2
+
 
 class UserResource:
   """Sync operations for Jira users."""
@@ -42,6 +47,29 @@ class UserResource:
     raise_for_response(response)
     return [User.model_validate(u) for u in response.json()]
 
+  def search_paginated(
+    self,
+    *,
+    page_size: int = 50,
+    limit: int | None = None,
+    query: str | None = None,
+    prefetch: int = 0,
+  ) -> Paginator[User]:
+    """Iterate over every user matching ``query``."""
+    def fetch_page(start_at: int, max_results: int) -> tuple[list[User], int]:
+      users = self.search(
+        start_at=start_at,
+        max_results=max_results,
+        query=query,
+      )
+      # The endpoint reports no total and filters each page for permissions
+      # after applying maxResults: a short or even empty page still covers
+      # max_results offsets. Step by the page size and read on until
+      # _EMPTY_RUN pages in a row come back empty.
+      return users, start_at + max_results * (1 + _EMPTY_RUN if users else 1)
+
+    return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch, fixed_stride=True)
+
 
 class AsyncUserResource:
   """Async operations for Jira users."""
@@ -75,3 +103,26 @@ class AsyncUserResource:
     response = await self._client.get('/rest/api/3/users/search', params=params)
     raise_for_response(response)
     return [User.model_validate(u) for u in response.json()]
+
+  def search_paginated(
+    self,
+    *,
+    page_size: int = 50,
+    limit: int | None = None,
+    query: str | None = None,
+    prefetch: int = 0,
+  ) -> AsyncPaginator[User]:
+    """Iterate over every user matching ``query``."""
+    async def fetch_page(start_at: int, max_results: int) -> tuple[list[User], int]:
+      users = await self.search(
+        start_at=start_at,
+        max_results=max_results,
+        query=query,
+      )
+      # The endpoint reports no total and filters each page for permissions
+      # after applying maxResults: a short or even empty page still covers
+      # max_results offsets. Step by the page size and read on until
+      # _EMPTY_RUN pages in a row come back empty.
+      return users, start_at + max_results * (1 + _EMPTY_RUN if users else 1)
+
+    return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch, fixed_stride=True)
@@ -4,6 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 from pyjira.exceptions import raise_for_response
 from pyjira.models.workflow import Workflow, WorkflowPage, WorkflowScheme
+from pyjira.pagination import AsyncPaginator, Paginator
 
 if TYPE_CHECKING:
     import httpx
@@ -50,6 +51,27 @@ class WorkflowResource:
         raise_for_response(response)
         return WorkflowPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        expand: list[str] | None = None,
+        query_string: str | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[Workflow]:
+        """Iterate over every workflow matching the search."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[Workflow], int]:
+            page = self.search(
+                start_at=start_at,
+                max_results=max_results,
+                expand=expand,
+                query_string=query_string,
+            )
+            return page.values, page.total
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def create(self, body: dict[str, Any]) -> Workflow:
         response = self._client.post("/rest/api/3/workflow", json=body)
         raise_for_response(response)
@@ -73,6 +95,26 @@ class WorkflowResource:
         raise_for_response(response)
         return response.json()
 
+    def get_all_schemes_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> Paginator[WorkflowScheme]:
+        """Iterate over every workflow scheme."""
+        def fetch_page(start_at: int, max_results: int) -> tuple[list[WorkflowScheme], int]:
+            page = self.get_all_schemes(
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return (
+                [WorkflowScheme.model_validate(s) for s in page.get("values", [])],
+                page.get("total", 0),
+            )
+
+        return Paginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     def get_scheme(self, scheme_id: str) -> WorkflowScheme:
         response = self._client.get(f"/rest/api/3/workflowscheme/{scheme_id}")
         raise_for_response(response)
@@ -137,6 +179,27 @@ class AsyncWorkflowResource:
         raise_for_response(response)
         return WorkflowPage.model_validate(response.json())
 
+    def search_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        expand: list[str] | None = None,
+        query_string: str | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[Workflow]:
+        """Iterate over every workflow matching the search."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[Workflow], int]:
+            page = await self.search(
+                start_at=start_at,
+                max_results=max_results,
+                expand=expand,
+                query_string=query_string,
+            )
+            return page.values, page.total
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def create(self, body: dict[str, Any]) -> Workflow:
         response = await self._client.post("/rest/api/3/workflow", json=body)
         raise_for_response(response)
@@ -160,6 +223,26 @@ class AsyncWorkflowResource:
         raise_for_response(response)
         return response.json()
 
+    def get_all_schemes_paginated(
+        self,
+        *,
+        page_size: int = 50,
+        limit: int | None = None,
+        prefetch: int = 0,
+    ) -> AsyncPaginator[WorkflowScheme]:
+        """Iterate over every workflow scheme."""
+        async def fetch_page(start_at: int, max_results: int) -> tuple[list[WorkflowScheme], int]:
+            page = await self.get_all_schemes(
+                start_at=start_at,
+                max_results=max_results,
+            )
+            return (
+                [WorkflowScheme.model_validate(s) for s in page.get("values", [])],
+                page.get("total", 0),
+            )
+
+        return AsyncPaginator(fetch_page, page_size=page_size, limit=limit, prefetch=prefetch)
+
     async def get_scheme(self, scheme_id: str) -> WorkflowScheme:
         response = await self._client.get(f"/rest/api/3/workflowscheme/{scheme_id}")
         raise_for_response(response)
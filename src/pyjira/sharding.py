@@ -0,0 +1,333 @@
+from __future__ import annotations
+
+import asyncio
+import queue
+import threading
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Literal
+
+from pyjira.jql import strip_order_by
+from pyjira.models.issue import Issue
+
+if TYPE_CHECKING:
+  from pyjira.resources.search import AsyncSearchResource, SearchResource
+
+Strategy = Literal['id', 'created']
+
+
+@dataclass(frozen=True)
+class Shard:
+  """A disjoint slice of a JQL query."""
+
+  index: int
+  jql: str
+  estimate: int
+
+
+@dataclass(frozen=True)
+class ShardPage:
+  """A page of issues fetched for one shard."""
+
+  shard: Shard
+  issues: list[Issue]
+
+
+class _Planner:
+  """Pure shard-planning logic shared by the sync and async drivers.
+
+  Ranges are half-open ``[lo, hi)`` over issue IDs or created-epoch-minutes.
+  The first and last shards are left open-ended so the union of all shards
+  always covers the base query, whatever time zone Jira reads dates in.
+  """
+
+  def __init__(self, jql: str, strategy: Strategy, shard_size: int, max_shards: int) -> None:
+    if strategy not in ('id', 'created'):
+      raise ValueError("strategy must be 'id' or 'created'")
+    self.base = strip_order_by(jql)
+    self.strategy = strategy
+    self.shard_size = max(1, shard_size)
+    self.max_shards = max(1, max_shards)
+
+  def where(self, clause: str) -> str:
+    return f'({self.base}) AND {clause}' if self.base else clause
+
+  def bounds_queries(self) -> tuple[str, str]:
+    prefix = f'{self.base} ' if self.base else ''
+    return (
+      f'{prefix}ORDER BY {self.strategy} ASC',
+      f'{prefix}ORDER BY {self.strategy} DESC',
+    )
+
+  def value_of(self, issue: Issue) -> int | None:
+    if self.strategy == 'id':
+      return int(issue.id) if issue.id else None
+    created = issue.fields.created if issue.fields else None
+    return int(created.timestamp() // 60) if created else None
+
+  def literal(self, value: int) -> str:
+    if self.strategy == 'id':
+      return str(value)
+    return f'"{datetime.fromtimestamp(value * 60, UTC):%Y-%m-%d %H:%M}"'
+
+  def range_jql(self, lo: int | None, hi: int | None) -> str:
+    clauses = []
+    if lo is not None:
+      clauses.append(f'{self.strategy} >= {self.literal(lo)}')
+    if hi is not None:
+      clauses.append(f'{self.strategy} < {self.literal(hi)}')
+    return self.where(' AND '.join(clauses)) if clauses else self.base
+
+  def split(self, lo: int, hi: int, estimate: int, planned: int) -> int | None:
+    """Return a midpoint if ``[lo, hi)`` should be bisected, else ``None``."""
+    if estimate <= self.shard_size or planned + 2 > self.max_shards or hi - lo < 2:
+      return None
+    return (lo + hi) // 2
+
+  def shards(self, ranges: list[tuple[int, int, int]]) -> list[Shard]:
+    ranges = sorted(ranges)
+    last = len(ranges) - 1
+    return [
+      Shard(
+        index,
+        self.range_jql(None if index == 0 else lo, None if index == last else hi),
+        estimate,
+      )
+      for index, (lo, hi, estimate) in enumerate(ranges)
+    ]
+
+
+def plan_shards(
+  search: SearchResource,
+  jql: str,
+  *,
+  strategy: Strategy = 'id',
+  shard_size: int = 10_000,
+  max_shards: int = 32,
+) -> list[Shard]:
+  """Split ``jql`` into disjoint shards of roughly ``shard_size`` issues.
+
+  Ranges are bisected using ``maxResults=0`` count queries until each is at
+  most ``shard_size`` issues or ``max_shards`` is reached. Any ORDER BY in
+  ``jql`` is dropped.
+  """
+  planner = _Planner(jql, strategy, shard_size, max_shards)
+  total = search.jql(planner.base, max_results=0).total
+  if total <= planner.shard_size:
+    return [Shard(0, planner.base, total)]
+  first_query, last_query = planner.bounds_queries()
+  first = search.jql(first_query, max_results=1, fields=['created']).issues
+  last = search.jql(last_query, max_results=1, fields=['created']).issues
+  lo = planner.value_of(first[0]) if first else None
+  hi = planner.value_of(last[0]) if last else None
+  if lo is None or hi is None:
+    return [Shard(0, planner.base, total)]
+
+  pending = [(lo, hi + 1, total)]
+  planned: list[tuple[int, int, int]] = []
+  while pending:
+    lo, hi, estimate = pending.pop(0)
+    mid = planner.split(lo, hi, estimate, len(planned) + len(pending))
+    if mid is None:
+      planned.append((lo, hi, estimate))
+      continue
+    left = search.jql(planner.range_jql(lo, mid), max_results=0).total
+    pending += [(lo, mid, left), (mid, hi, max(0, estimate - left))]
+  return planner.shards(planned)
+
+
+async def aplan_shards(
+  search: AsyncSearchResource,
+  jql: str,
+  *,
+  strategy: Strategy = 'id',
+  shard_size: int = 10_000,
+  max_shards: int = 32,
+) -> list[Shard]:
+  """Async counterpart of ``plan_shards``."""
+  planner = _Planner(jql, strategy, shard_size, max_shards)
+  total = (await search.jql(planner.base, max_results=0)).total
+  if total <= planner.shard_size:
+    return [Shard(0, planner.base, total)]
+  first_query, last_query = planner.bounds_queries()
+  first = (await search.jql(first_query, max_results=1, fields=['created'])).issues
+  last = (await search.jql(last_query, max_results=1, fields=['created'])).issues
+  lo = planner.value_of(first[0]) if first else None
+  hi = planner.value_of(last[0]) if last else None
+  if lo is None or hi is None:
+    return [Shard(0, planner.base, total)]
+
+  pending = [(lo, hi + 1, total)]
+  planned: list[tuple[int, int, int]] = []
+  while pending:
+    lo, hi, estimate = pending.pop(0)
+    mid = planner.split(lo, hi, estimate, len(planned) + len(pending))
+    if mid is None:
+      planned.append((lo, hi, estimate))
+      continue
+    left = (await search.jql(planner.range_jql(lo, mid), max_results=0)).total
+    pending += [(lo, mid, left), (mid, hi, max(0, estimate - left))]
+  return planner.shards(planned)
+
+
+@dataclass(frozen=True)
+class _ShardDone:
+  shard: Shard
+  error: BaseException | None = None
+
+
+def iter_shard_pages(
+  search: SearchResource,
+  shards: list[Shard],
+  *,
+  workers: int = 4,
+  page_size: int = 100,
+  fields: list[str] | None = None,
+  expand: list[str] | None = None,
+) -> Iterator[ShardPage]:
+  """Scan shards on a thread pool, yielding pages as they arrive.
+
+  Pages from one shard arrive in order; pages from different shards
+  interleave. A bounded queue applies backpressure to the workers, and
+  closing the iterator early stops them.
+  """
+  results: queue.Queue[ShardPage | _ShardDone] = queue.Queue(maxsize=max(1, workers) * 2)
+  stop = threading.Event()
+
+  def put(item: ShardPage | _ShardDone) -> bool:
+    while not stop.is_set():
+      try:
+        results.put(item, timeout=0.1)
+        return True
+      except queue.Full:
+        continue
+    return False
+
+  def scan(shard: Shard) -> None:
+    error: BaseException | None = None
+    try:
+      batch: list[Issue] = []
+      for issue in search.jql_paginated(shard.jql, page_size=page_size, fields=fields, expand=expand):
+        batch.append(issue)
+        if len(batch) >= page_size:
+          if not put(ShardPage(shard, batch)):
+            return
+          batch = []
+      if batch:
+        put(ShardPage(shard, batch))
+    except BaseException as exc:
+      error = exc
+    finally:
+      put(_ShardDone(shard, error))
+
+  pool = ThreadPoolExecutor(max_workers=max(1, min(workers, len(shards) or 1)))
+  try:
+    for shard in shards:
+      pool.submit(scan, shard)
+    finished = 0
+    while finished < len(shards):
+      item = results.get()
+      if isinstance(item, _ShardDone):
+        finished += 1
+        if item.error is not None:
+          raise item.error
+        continue
+      yield item
+  finally:
+    stop.set()
+    pool.shutdown(wait=True, cancel_futures=True)
+
+
+async def aiter_shard_pages(
+  search: AsyncSearchResource,
+  shards: list[Shard],
+  *,
+  workers: int = 4,
+  page_size: int = 100,
+  fields: list[str] | None = None,
+  expand: list[str] | None = None,
+) -> AsyncIterator[ShardPage]:
+  """Async counterpart of ``iter_shard_pages`` using one task per shard."""
+  results: asyncio.Queue[ShardPage | _ShardDone] = asyncio.Queue(maxsize=max(1, workers) * 2)
+  semaphore = asyncio.Semaphore(max(1, workers))
+
+  async def scan(shard: Shard) -> None:
+    error: BaseException | None = None
+    try:
+      async with semaphore:
+        batch: list[Issue] = []
+        async for issue in search.jql_paginated(shard.jql, page_size=page_size, fields=fields, expand=expand):
+          batch.append(issue)
+          if len(batch) >= page_size:
+            await results.put(ShardPage(shard, batch))
+            batch = []
+        if batch:
+          await results.put(ShardPage(shard, batch))
+    except asyncio.CancelledError:
+      raise
+    except BaseException as exc:
+      error = exc
+    await results.put(_ShardDone(shard, error))
+
+  tasks = [asyncio.create_task(scan(shard)) for shard in shards]
+  try:
+    finished = 0
+    while finished < len(tasks):
+      item = await results.get()
+      if isinstance(item, _ShardDone):
+        finished += 1
+        if item.error is not None:
+          raise item.error
+        continue
+      yield item
+  finally:
+    for task in tasks:
+      task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+def scan_sharded(
+  search: SearchResource,
+  jql: str,
+  *,
+  strategy: Strategy = 'id',
+  shard_size: int = 10_000,
+  max_shards: int = 32,
+  workers: int = 4,
+  page_size: int = 100,
+  fields: list[str] | None = None,
+  expand: list[str] | None = None,
+) -> Iterator[Issue]:
+  """Plan shards for ``jql`` and yield every matching issue, scanned in parallel.
+
+  Issues are yielded in arrival order; use ``iter_shard_pages`` for
+  per-shard grouping.
+  """
+  shards = plan_shards(search, jql, strategy=strategy, shard_size=shard_size, max_shards=max_shards)
+  for page in iter_shard_pages(
+    search, shards, workers=workers, page_size=page_size, fields=fields, expand=expand,
+  ):
+    yield from page.issues
+
+
+async def ascan_sharded(
+  search: AsyncSearchResource,
+  jql: str,
+  *,
+  strategy: Strategy = 'id',
+  shard_size: int = 10_000,
+  max_shards: int = 32,
+  workers: int = 4,
+  page_size: int = 100,
+  fields: list[str] | None = None,
+  expand: list[str] | None = None,
+) -> AsyncIterator[Issue]:
+  """Async counterpart of ``scan_sharded``."""
+  shards = await aplan_shards(search, jql, strategy=strategy, shard_size=shard_size, max_shards=max_shards)
+  async for page in aiter_shard_pages(
+    search, shards, workers=workers, page_size=page_size, fields=fields, expand=expand,
+  ):
+    for issue in page.issues:
+      yield issue
@@ -0,0 +1,389 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from collections.abc import AsyncIterator, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import httpx
+
+from pyjira.hedging import HEDGED_METHODS
+from pyjira.ratelimit import RateLimitInfo, parse_retry_after
+
+if TYPE_CHECKING:
+  from pyjira.circuit import CircuitBreaker
+  from pyjira.hedging import HedgePolicy
+  from pyjira.instrumentation import CallTimer, Instrumentation
+  from pyjira.ratelimit import AdaptiveConcurrency, RateLimitTracker
+
+# Backoff when a 429 carries no usable Retry-After: 1, 2, 4 ... seconds.
+_MAX_BACKOFF = 30.0
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+  """Seconds to wait before retrying a throttled ``response``."""
+  delay = parse_retry_after(response.headers.get('Retry-After'))
+  if delay is None:
+    return min(2.0**attempt, _MAX_BACKOFF)
+  return delay
+
+
+class _TimedResponse(httpx.Response):
+  """Response that adds the time spent in ``json()`` to its call timer."""
+
+  timer: CallTimer
+
+  def json(self, **kwargs: Any) -> Any:
+    started = time.perf_counter()
+    try:
+      return super().json(**kwargs)
+    finally:
+      self.timer.add_decode_time(time.perf_counter() - started)
+
+
+def _timed_response(
+  response: httpx.Response,
+  stream: httpx.SyncByteStream | httpx.AsyncByteStream,
+  timer: CallTimer,
+) -> httpx.Response:
+  timed = _TimedResponse(
+    response.status_code,
+    headers=response.headers,
+    stream=stream,
+    extensions=response.extensions,
+  )
+  timed.timer = timer
+  return timed
+
+
+class _TimedStream(httpx.SyncByteStream):
+  """Response body that finishes its call timer when closed."""
+
+  def __init__(self, stream: httpx.SyncByteStream, finish: _Finish) -> None:
+    self._stream = stream
+    self._finish = finish
+    self._size = 0
+
+  def __iter__(self) -> Iterator[bytes]:
+    for chunk in self._stream:
+      self._size += len(chunk)
+      yield chunk
+
+  def close(self) -> None:
+    self._stream.close()
+    self._finish(self._size)
+
+
+class _AsyncTimedStream(httpx.AsyncByteStream):
+  def __init__(self, stream: httpx.AsyncByteStream, finish: _Finish) -> None:
+    self._stream = stream
+    self._finish = finish
+    self._size = 0
+
+  async def __aiter__(self) -> AsyncIterator[bytes]:
+    async for chunk in self._stream:
+      self._size += len(chunk)
+      yield chunk
+
+  async def aclose(self) -> None:
+    await self._stream.aclose()
+    self._finish(self._size)
+
+
+class _Finish:
+  """Reports the call once, when the final response body is closed."""
+
+  __slots__ = ('_timer', '_status', '_retries', '_waited', '_done')
+
+  def __init__(self, timer: CallTimer, status: int, retries: int, waited: float) -> None:
+    self._timer = timer
+    self._status = status
+    self._retries = retries
+    self._waited = waited
+    self._done = False
+
+  def __call__(self, size: int) -> None:
+    if not self._done:
+      self._done = True
+      self._timer.finish(status=self._status, bytes_in=size, retries=self._retries, rate_limit_wait=self._waited)
+
+
+def _close_when_done(future: Future[httpx.Response]) -> None:
+  if not future.cancelled() and future.exception() is None:
+    future.result().close()
+
+
+def _aclose_when_done(task: asyncio.Task[httpx.Response]) -> None:
+  if not task.cancelled() and task.exception() is None:
+    closing = asyncio.ensure_future(task.result().aclose())
+    _closing.add(closing)
+    closing.add_done_callback(_closing.discard)
+
+
+# Keeps background closes of losing hedged responses alive until they finish.
+_closing: set[asyncio.Future[None]] = set()
+
+
+def _observe_primary(hedging: HedgePolicy, endpoint: str, started: float, attempt: Any) -> None:
+  # Only first attempts are sampled: the faster of two attempts would keep
+  # pulling the hedge deadline down.
+  if not attempt.cancelled() and attempt.exception() is None:
+    hedging.observe(endpoint, time.perf_counter() - started)
+
+
+class JiraTransport(httpx.BaseTransport):
+  """Request path of a ``JiraClient`` around the HTTP transport.
+
+  Retries 429 responses up to ``max_retries`` times after their
+  ``Retry-After``, feeds every response's rate-limit headers to
+  ``rate_limit``, admits requests through ``circuit_breaker``, hedges slow
+  GETs according to ``hedging`` and, while ``instrumentation`` is active,
+  reports every call to it. Hedged requests run on a pool of
+  ``hedge_workers`` threads.
+  """
+
+  def __init__(
+    self,
+    transport: httpx.BaseTransport,
+    *,
+    max_retries: int = 0,
+    instrumentation: Instrumentation | None = None,
+    rate_limit: RateLimitTracker | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    hedging: HedgePolicy | None = None,
+    hedge_workers: int = 100,
+  ) -> None:
+    self._transport = transport
+    self._max_retries = max_retries
+    self._instrumentation = instrumentation
+    self._rate_limit = rate_limit
+    self._circuit_breaker = circuit_breaker
+    self._hedging = hedging
+    self._hedge_workers = hedge_workers
+    self._executor: ThreadPoolExecutor | None = None
+    self._executor_lock = threading.Lock()
+
+  def _get_executor(self) -> ThreadPoolExecutor:
+    with self._executor_lock:
+      if self._executor is None:
+        self._executor = ThreadPoolExecutor(max_workers=self._hedge_workers, thread_name_prefix='pyjira-hedge')
+      return self._executor
+
+  def _send(self, request: httpx.Request) -> httpx.Response:
+    hedging = self._hedging
+    if hedging is None or request.method not in HEDGED_METHODS:
+      return self._transport.handle_request(request)
+    endpoint, delay = hedging.deadline(request.url.path)
+    started = time.perf_counter()
+    if delay is None:
+      response = self._transport.handle_request(request)
+      hedging.observe(endpoint, time.perf_counter() - started)
+      return response
+    executor = self._get_executor()
+    primary = executor.submit(self._transport.handle_request, request)
+    primary.add_done_callback(partial(_observe_primary, hedging, endpoint, started))
+    done, _ = wait([primary], timeout=delay)
+    if done or not hedging.try_hedge():
+      return primary.result()
+    hedge = executor.submit(self._transport.handle_request, request)
+    pending = {primary, hedge}
+    while True:
+      done, pending = wait(pending, return_when=FIRST_COMPLETED)
+      winner = next((future for future in done if future.exception() is None), None)
+      if winner is not None or not pending:
+        break
+    for future in (primary, hedge):
+      if future is not winner:
+        future.cancel()
+        future.add_done_callback(_close_when_done)
+    if winner is None:
+      # Both attempts failed; report the original one.
+      return primary.result()
+    if winner is hedge:
+      hedging.won()
+    return winner.result()
+
+  def handle_request(self, request: httpx.Request) -> httpx.Response:
+    if self._max_retries:
+      # Buffer streamed bodies (multipart uploads) so they can be resent.
+      request.read()
+    instrumentation = self._instrumentation
+    timer = instrumentation.start(request) if instrumentation is not None and instrumentation.active else None
+    retries = 0
+    waited = 0.0
+    record = None
+    try:
+      if self._circuit_breaker is not None:
+        record = self._circuit_breaker.check(request.url.path)
+      while True:
+        response = self._send(request)
+        if self._rate_limit is not None:
+          self._rate_limit.observe(response)
+        if response.status_code != 429 or retries >= self._max_retries:
+          break
+        delay = retry_delay(response, retries)
+        response.read()
+        response.close()
+        time.sleep(delay)
+        retries += 1
+        waited += delay
+    except Exception as exc:
+      if record is not None:
+        record(error=exc)
+      if timer is not None:
+        timer.finish(status=None, retries=retries, rate_limit_wait=waited, error=exc)
+      raise
+    except BaseException:
+      # Cancelled: free a half-open probe slot without a verdict.
+      if record is not None:
+        record()
+      raise
+    if record is not None:
+      record(status_code=response.status_code)
+    if timer is not None:
+      finish = _Finish(timer, response.status_code, retries, waited)
+      response = _timed_response(response, _TimedStream(response.stream, finish), timer)  # type: ignore[arg-type]
+    return response
+
+  def close(self) -> None:
+    with self._executor_lock:
+      executor, self._executor = self._executor, None
+    if executor is not None:
+      executor.shutdown(wait=True)
+    self._transport.close()
+
+
+class AsyncJiraTransport(httpx.AsyncBaseTransport):
+  """Async counterpart of ``JiraTransport``.
+
+  With ``concurrency`` set, every attempt also waits for a slot from the
+  adaptive limit and hands its status and rate-limit headers back to it.
+  A hedged GET and its duplicate share one slot.
+  """
+
+  def __init__(
+    self,
+    transport: httpx.AsyncBaseTransport,
+    *,
+    max_retries: int = 0,
+    instrumentation: Instrumentation | None = None,
+    rate_limit: RateLimitTracker | None = None,
+    concurrency: AdaptiveConcurrency | None = None,
+    circuit_breaker: CircuitBreaker | None = None,
+    hedging: HedgePolicy | None = None,
+  ) -> None:
+    self._transport = transport
+    self._max_retries = max_retries
+    self._instrumentation = instrumentation
+    self._rate_limit = rate_limit
+    self._concurrency = concurrency
+    self._circuit_breaker = circuit_breaker
+    self._hedging = hedging
+
+  async def _dispatch(self, request: httpx.Request) -> httpx.Response:
+    hedging = self._hedging
+    if hedging is None or request.method not in HEDGED_METHODS:
+      return await self._transport.handle_async_request(request)
+    endpoint, delay = hedging.deadline(request.url.path)
+    started = time.perf_counter()
+    if delay is None:
+      response = await self._transport.handle_async_request(request)
+      hedging.observe(endpoint, time.perf_counter() - started)
+      return response
+    primary = asyncio.ensure_future(self._transport.handle_async_request(request))
+    primary.add_done_callback(partial(_observe_primary, hedging, endpoint, started))
+    hedge: asyncio.Task[httpx.Response] | None = None
+    winner = None
+    try:
+      done, _ = await asyncio.wait({primary}, timeout=delay)
+      if done or not hedging.try_hedge():
+        winner = primary
+        return await primary
+      hedge = asyncio.ensure_future(self._transport.handle_async_request(request))
+      pending = {primary, hedge}
+      while True:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        winner = next((task for task in done if task.exception() is None), None)
+        if winner is not None or not pending:
+          break
+      if winner is None:
+        # Both attempts failed; report the original one.
+        return primary.result()
+      if winner is hedge:
+        hedging.won()
+      return winner.result()
+    finally:
+      if hedge is not None and winner is hedge and not primary.done():
+        # Cancelled below: the first attempt took at least this long.
+        hedging.observe(endpoint, time.perf_counter() - started)
+      for task in (primary, hedge):
+        if task is not None and task is not winner:
+          task.cancel()
+          task.add_done_callback(_aclose_when_done)
+
+  async def _send(self, request: httpx.Request) -> httpx.Response:
+    concurrency = self._concurrency
+    if concurrency is None:
+      response = await self._dispatch(request)
+      if self._rate_limit is not None:
+        self._rate_limit.observe(response)
+      return response
+    token = await concurrency.acquire()
+    status_code = info = None
+    try:
+      response = await self._dispatch(request)
+      status_code = response.status_code
+      if self._rate_limit is not None:
+        info = self._rate_limit.observe(response)
+      else:
+        info = RateLimitInfo.from_response(response)
+    finally:
+      # The slot is freed once the headers are in; reading the body does
+      # not hold it.
+      concurrency.release(token, status_code, info)
+    return response
+
+  async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+    if self._max_retries:
+      await request.aread()
+    instrumentation = self._instrumentation
+    timer = instrumentation.start(request) if instrumentation is not None and instrumentation.active else None
+    retries = 0
+    waited = 0.0
+    record = None
+    try:
+      if self._circuit_breaker is not None:
+        record = self._circuit_breaker.check(request.url.path)
+      while True:
+        response = await self._send(request)
+        if response.status_code != 429 or retries >= self._max_retries:
+          break
+        delay = retry_delay(response, retries)
+        await response.aread()
+        await response.aclose()
+        await asyncio.sleep(delay)
+        retries += 1
+        waited += delay
+    except Exception as exc:
+      if record is not None:
+        record(error=exc)
+      if timer is not None:
+        timer.finish(status=None, retries=retries, rate_limit_wait=waited, error=exc)
+      raise
+    except BaseException:
+      # Cancelled: free a half-open probe slot without a verdict.
+      if record is not None:
+        record()
+      raise
+    if record is not None:
+      record(status_code=response.status_code)
+    if timer is not None:
+      finish = _Finish(timer, response.status_code, retries, waited)
+      response = _timed_response(response, _AsyncTimedStream(response.stream, finish), timer)  # type: ignore[arg-type]
+    return response
+
+  async def aclose(self) -> None:
+    await self._transport.aclose()
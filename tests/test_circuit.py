@@ -0,0 +1,102 @@
+import httpx
+import pytest
+
+from pyjira import AsyncJiraClient, JiraClient
+from pyjira.circuit import CircuitBreaker, endpoint_group
+from pyjira.exceptions import CircuitOpenError, NotFoundError, ServerError
+from tests.conftest import BASE_URL, ISSUE_JSON
+
+
+def _client(breaker):
+  return JiraClient(base_url=BASE_URL, email='test@example.com', api_token='test-token', circuit_breaker=breaker)
+
+
+def test_endpoint_group():
+  assert endpoint_group('/rest/api/3/issue/PROJ-1/comment') == 'issue'
+  assert endpoint_group('/rest/api/3/search') == 'search'
+  assert endpoint_group('/rest/agile/1.0/board/1') == 'agile/board'
+
+
+def test_opens_after_consecutive_failures(mock_api):
+  issue = mock_api.get('/rest/api/3/issue/PROJ-123').mock(return_value=httpx.Response(503))
+  mock_api.get('/rest/api/3/myself').mock(return_value=httpx.Response(200, json={'accountId': 'abc'}))
+  breaker = CircuitBreaker(failure_threshold=3, recovery_time=60)
+  with _client(breaker) as client:
+    for _ in range(3):
+      with pytest.raises(ServerError):
+        client.issues.get('PROJ-123')
+    with pytest.raises(CircuitOpenError) as excinfo:
+      client.issues.get('PROJ-123')
+    # Other endpoint groups are unaffected.
+    client.users.myself()
+  assert issue.call_count == 3
+  assert excinfo.value.group == 'issue'
+  assert excinfo.value.retry_after > 0
+  assert breaker.states() == {'issue': 'open', 'myself': 'closed'}
+
+
+def test_client_errors_do_not_trip(mock_api):
+  mock_api.get('/rest/api/3/issue/PROJ-404').mock(return_value=httpx.Response(404, json={'errorMessages': []}))
+  breaker = CircuitBreaker(failure_threshold=1)
+  with _client(breaker) as client:
+    for _ in range(3):
+      with pytest.raises(NotFoundError):
+        client.issues.get('PROJ-404')
+  assert breaker.state('issue') == 'closed'
+
+
+def test_half_open_probe(mock_api, monkeypatch):
+  now = [1000.0]
+  monkeypatch.setattr('pyjira.circuit.time.monotonic', lambda: now[0])
+  route = mock_api.get('/rest/api/3/issue/PROJ-123').mock(side_effect=[
+    httpx.ConnectTimeout('timed out'),
+    httpx.Response(500),
+    httpx.Response(200, json=ISSUE_JSON),
+  ])
+  breaker = CircuitBreaker(failure_threshold=1, recovery_time=10)
+  with _client(breaker) as client:
+    with pytest.raises(httpx.ConnectTimeout):
+      client.issues.get('PROJ-123')
+    assert breaker.state('issue') == 'open'
+
+    now[0] += 10
+    with pytest.raises(ServerError):
+      client.issues.get('PROJ-123')
+    assert breaker.state('issue') == 'open'
+    with pytest.raises(CircuitOpenError):
+      client.issues.get('PROJ-123')
+
+    now[0] += 10
+    assert client.issues.get('PROJ-123').key == 'PROJ-123'
+    assert breaker.state('issue') == 'closed'
+  assert route.call_count == 3
+
+
+def test_half_open_admits_limited_probes():
+  breaker = CircuitBreaker(failure_threshold=1, recovery_time=0)
+  breaker.check('/rest/api/3/search')(status_code=502)
+  record = breaker.check('/rest/api/3/search')
+  assert breaker.state('search') == 'half_open'
+  with pytest.raises(CircuitOpenError):
+    breaker.check('/rest/api/3/search')
+  # A cancelled probe frees its slot without closing the circuit.
+  record()
+  breaker.check('/rest/api/3/search')(status_code=200)
+  assert breaker.state('search') == 'closed'
+
+
+@pytest.mark.asyncio
+async def test_async_client(mock_api):
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(return_value=httpx.Response(502))
+  async with AsyncJiraClient(
+    base_url=BASE_URL,
+    email='test@example.com',
+    api_token='test-token',
+    circuit_breaker=CircuitBreaker(failure_threshold=2),
+  ) as client:
+    for _ in range(2):
+      with pytest.raises(ServerError):
+        await client.issues.get('PROJ-123')
+    with pytest.raises(CircuitOpenError):
+      await client.issues.get('PROJ-123')
+    assert client.circuit_breaker.state('issue') == 'open'
@@ -0,0 +1,95 @@
+import gzip
+import json
+
+import httpx
+
+from pyjira.cli import main
+from tests.conftest import BASE_URL, ISSUE_JSON
+
+AUTH = ['--base-url', BASE_URL, '--email', 'a@b.com', '--api-token', 'tok', '--no-progress']
+TOTAL = 23
+
+
+def _search(request: httpx.Request) -> httpx.Response:
+  start = int(request.url.params['startAt'])
+  limit = int(request.url.params['maxResults'])
+  issues = [{**ISSUE_JSON, 'key': f'PROJ-{i}'} for i in range(start, min(start + limit, TOTAL))]
+  return httpx.Response(200, json={'startAt': start, 'maxResults': limit, 'total': TOTAL, 'issues': issues})
+
+
+def test_export_ndjson_gzip(mock_api, tmp_path):
+  route = mock_api.get('/rest/api/3/search').mock(side_effect=_search)
+  out = tmp_path / 'issues.ndjson.gz'
+  code = main(['export', 'project = PROJ', '-o', str(out), '--page-size', '5', '--workers', '3', '--fields', 'summary,status', *AUTH])
+  assert code == 0
+  lines = gzip.decompress(out.read_bytes()).splitlines()
+  assert [json.loads(line)['key'] for line in lines] == [f'PROJ-{i}' for i in range(TOTAL)]
+  assert route.call_count == 5
+  assert route.calls.last.request.url.params['fields'] == 'summary,status'
+
+
+def test_export_resumes_from_checkpoint(mock_api, tmp_path):
+  mock_api.get('/rest/api/3/search').mock(side_effect=_search)
+  out = tmp_path / 'issues.ndjson'
+  checkpoint = tmp_path / 'export.ckpt'
+  committed = ''.join(json.dumps({'key': f'PROJ-{i}'}) + '\n' for i in range(10)).encode()
+  # A crash mid-page left part of the next page behind the checkpoint.
+  out.write_bytes(committed + b'{"key": "PROJ-10"}\n{"key": "PR')
+  checkpoint.write_text(json.dumps({
+    'query': {'jql': 'project = PROJ', 'fields': None, 'expand': None},
+    'next_start': 10,
+    'written': 10,
+    'offset': len(committed),
+  }))
+  code = main(['export', 'project = PROJ', '-o', str(out), '--page-size', '5', '--checkpoint', str(checkpoint), *AUTH])
+  assert code == 0
+  keys = [json.loads(line)['key'] for line in out.read_text().splitlines()]
+  assert keys == [f'PROJ-{i}' for i in range(TOTAL)]
+  assert not checkpoint.exists()
+
+
+def test_export_gzip_resumes_after_truncated_member(mock_api, tmp_path):
+  mock_api.get('/rest/api/3/search').mock(side_effect=_search)
+  out = tmp_path / 'issues.ndjson.gz'
+  checkpoint = tmp_path / 'export.ckpt'
+  committed = gzip.compress(''.join(json.dumps({'key': f'PROJ-{i}'}) + '\n' for i in range(5)).encode())
+  partial = gzip.compress(b'{"key": "PROJ-5"}\n' * 50)[:-12]
+  out.write_bytes(committed + partial)
+  checkpoint.write_text(json.dumps({
+    'query': {'jql': 'project = PROJ', 'fields': None, 'expand': None},
+    'next_start': 5,
+    'written': 5,
+    'offset': len(committed),
+  }))
+  code = main(['export', 'project = PROJ', '-o', str(out), '--page-size', '5', '--checkpoint', str(checkpoint), *AUTH])
+  assert code == 0
+  keys = [json.loads(line)['key'] for line in gzip.decompress(out.read_bytes()).splitlines()]
+  assert keys == [f'PROJ-{i}' for i in range(TOTAL)]
+
+
+def test_export_reports_jira_errors(mock_api, tmp_path, capsys):
+  mock_api.get('/rest/api/3/search').mock(
+    return_value=httpx.Response(400, json={'errorMessages': ["The value 'NOPE' does not exist for the field 'project'."]}),
+  )
+  code = main(['export', 'project = NOPE', '-o', str(tmp_path / 'out.ndjson'), *AUTH])
+  assert code == 1
+  assert "error: The value 'NOPE' does not exist" in capsys.readouterr().err
+
+
+def test_export_reports_connection_errors(mock_api, tmp_path, capsys):
+  mock_api.get('/rest/api/3/search').mock(side_effect=httpx.ConnectError('Name or service not known'))
+  code = main(['export', 'project = PROJ', '-o', str(tmp_path / 'out.ndjson'), *AUTH])
+  assert code == 1
+  assert 'error: could not reach Jira: Name or service not known' in capsys.readouterr().err
+
+
+def test_export_progress_shows_reported_total(mock_api, tmp_path, capsys):
+  # Two issues were deleted after the total was counted.
+  def search(request: httpx.Request) -> httpx.Response:
+    response = _search(request)
+    return httpx.Response(200, json={**json.loads(response.content), 'total': TOTAL + 2})
+
+  mock_api.get('/rest/api/3/search').mock(side_effect=search)
+  code = main(['export', 'project = PROJ', '-o', str(tmp_path / 'out.ndjson'), '--page-size', '10', *AUTH, '--progress'])
+  assert code == 0
+  assert capsys.readouterr().err.rstrip('\n').rsplit('\r', 1)[-1].startswith(f'Exported {TOTAL}/{TOTAL + 2} issues')
@@ -25,6 +25,14 @@ def test_client_from_base_url():
     client.close()
 
 
+def test_client_keeps_config_max_retries_default():
+  with respx.mock:
+    with JiraClient(domain='myco', email='a@b.com', api_token='tok') as client:
+      assert client.config.max_retries == 3
+    with JiraClient(domain='myco', email='a@b.com', api_token='tok', max_retries=1) as client:
+      assert client.config.max_retries == 1
+
+
 def test_client_has_resource_attributes():
   with respx.mock:
     client = JiraClient(domain='test', email='a@b.com', api_token='tok')
@@ -52,3 +60,31 @@ async def test_async_client_context_manager():
 async def test_async_client_requires_domain_or_base_url():
   with pytest.raises(ValueError, match='Either domain or base_url'):
     AsyncJiraClient(email='a@b.com', api_token='tok')
+
+
+def test_resources_built_lazily_and_cached():
+  with respx.mock:
+    client = JiraClient(domain='test', email='a@b.com', api_token='tok')
+    assert 'issues' not in vars(client)
+    issues = client.issues
+    assert client.issues is issues
+    assert 'comments' not in vars(client)
+    client.close()
+
+
+def test_import_is_lazy():
+  import subprocess
+  import sys
+
+  code = (
+    'import sys, pyjira; '
+    'from pyjira import JiraClient; '
+    'JiraClient(domain="x", email="a", api_token="b"); '
+    'print(sorted(m for m in sys.modules if m.startswith(("pyjira.resources", "pyjira.models"))))'
+  )
+  out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+  assert out.strip() == '[]'
+
+  code = 'import pyjira, pyjira.models; print(pyjira.Issue.__module__, "Issue" in dir(pyjira.models))'
+  out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True).stdout
+  assert out.split() == ['pyjira.models.issue', 'True']
@@ -0,0 +1,51 @@
+import httpx
+import pytest
+
+from pyjira.columnar import iter_batches, to_arrow_table, to_numpy_columns
+from tests.conftest import ISSUE_JSON
+
+
+def _search(request: httpx.Request) -> httpx.Response:
+  start = int(request.url.params['startAt'])
+  limit = int(request.url.params['maxResults'])
+  issues = []
+  for i in range(start, min(start + limit, 3)):
+    fields = {**ISSUE_JSON['fields'], 'customfield_10016': None if i == 2 else i * 1.5}
+    if i == 1:
+      fields['assignee'] = None
+    issues.append({**ISSUE_JSON, 'id': str(10000 + i), 'key': f'PROJ-{i}', 'fields': fields})
+  return httpx.Response(200, json={'startAt': start, 'maxResults': limit, 'total': 3, 'issues': issues})
+
+
+def test_arrow_batches(client, mock_api):
+  pa = pytest.importorskip('pyarrow')
+  route = mock_api.get('/rest/api/3/search').mock(side_effect=_search)
+  batches = list(iter_batches(
+    client.search, 'project = PROJ', page_size=2, custom_fields=['customfield_10016'], backend='arrow',
+  ))
+  assert [b.num_rows for b in batches] == [2, 1]
+  assert 'customfield_10016' in route.calls.last.request.url.params['fields']
+
+  table = to_arrow_table(client.search, 'project = PROJ', page_size=2, custom_fields=['customfield_10016'])
+  assert table.column('key').to_pylist() == ['PROJ-0', 'PROJ-1', 'PROJ-2']
+  assert table.column('assignee_id').to_pylist() == ['abc123', None, 'abc123']
+  assert table.schema.field('created').type == pa.timestamp('ms', tz='UTC')
+  assert table.column('customfield_10016').to_pylist() == [0.0, 1.5, None]
+
+
+def test_numpy_columns(client, mock_api):
+  np = pytest.importorskip('numpy')
+  mock_api.get('/rest/api/3/search').mock(side_effect=_search)
+  columns = to_numpy_columns(
+    client.search, 'project = PROJ', page_size=2, columns=['key', 'id', 'updated'], custom_fields=['customfield_10016'],
+  )
+  assert list(columns['key']) == ['PROJ-0', 'PROJ-1', 'PROJ-2']
+  assert columns['id'].dtype == np.int64
+  assert columns['updated'].dtype == np.dtype('datetime64[ms]')
+  assert str(columns['updated'][0]) == '2025-01-16T14:20:00.000'
+  assert np.isnan(columns['customfield_10016'][2])
+
+
+def test_unknown_column(client):
+  with pytest.raises(ValueError, match='Unknown columns'):
+    list(iter_batches(client.search, 'project = PROJ', columns=['nope'], backend='auto'))
@@ -0,0 +1,55 @@
+import copy
+
+import pydantic
+import pytest
+
+from pyjira.models import Issue, User
+from pyjira.models.compact import CompactIssue, CompactSearchResults, CompactStatus, CompactUser
+from tests.conftest import ISSUE_JSON, SEARCH_RESULTS_JSON
+
+
+def _issue(key, **fields):
+  data = copy.deepcopy(ISSUE_JSON)
+  data['key'] = key
+  data['fields'].update(fields)
+  return data
+
+
+def test_compact_issue_matches_issue():
+  data = _issue('PROJ-1', customfield_10010='sprint 4')
+  issue = Issue.model_validate(data)
+  compact = CompactIssue.model_validate(data)
+  assert compact.model_dump() == issue.model_dump()
+  assert isinstance(compact, Issue)
+  assert isinstance(compact.fields.assignee, User)
+  # Custom fields stay on the fields object.
+  assert compact.fields.model_extra == {'customfield_10010': 'sprint 4'}
+
+
+def test_reference_models_are_shared_and_frozen():
+  first = CompactIssue.model_validate(_issue('PROJ-1'))
+  second = CompactIssue.model_validate(_issue('PROJ-2'))
+  assert first.fields.status is second.fields.status
+  assert first.fields.assignee is second.fields.assignee
+  assert first.fields.assignee is not first.fields.reporter
+  with pytest.raises(pydantic.ValidationError):
+    first.fields.status.name = 'Done'
+
+
+def test_unknown_keys_are_dropped():
+  user = CompactUser.model_validate({'accountId': 'abc123', 'displayName': 'Test User', 'groups': {'size': 3}})
+  assert user.__pydantic_extra__ is None
+  assert user.display_name == 'Test User'
+  assert not hasattr(user, 'groups')
+
+
+def test_different_values_are_not_merged():
+  open_ = CompactStatus.model_validate({'id': '1', 'name': 'Open'})
+  renamed = CompactStatus.model_validate({'id': '1', 'name': 'Backlog'})
+  assert open_ is not renamed
+  assert renamed.name == 'Backlog'
+
+
+def test_compact_search_results():
+  results = CompactSearchResults.model_validate(SEARCH_RESULTS_JSON)
+  assert all(isinstance(issue, CompactIssue) for issue in results.issues)
@@ -0,0 +1,151 @@
+import asyncio
+from contextlib import aclosing
+
+import httpx
+import pytest
+
+from pyjira import AsyncJiraClient
+from pyjira.fanout import amap, resolve_concurrency
+from tests.conftest import BASE_URL, ISSUE_JSON
+
+
+class _Tracker:
+  def __init__(self) -> None:
+    self.active = 0
+    self.peak = 0
+    self.started: list[int] = []
+    self.cancelled: list[int] = []
+
+  async def __call__(self, n: int) -> int:
+    self.started.append(n)
+    self.active += 1
+    self.peak = max(self.peak, self.active)
+    try:
+      await asyncio.sleep(0.001 * (n % 3))
+      if n == 13:
+        raise ValueError('boom')
+      return n * 2
+    except asyncio.CancelledError:
+      self.cancelled.append(n)
+      raise
+    finally:
+      self.active -= 1
+
+
+@pytest.mark.asyncio
+async def test_amap_ordered_bounded():
+  tracker = _Tracker()
+  results = [r async for r in amap(tracker, range(12), concurrency=4)]
+  assert results == [n * 2 for n in range(12)]
+  assert tracker.peak <= 4
+
+
+@pytest.mark.asyncio
+async def test_amap_as_completed():
+  async def delayed(n: int) -> int:
+    await asyncio.sleep(0.02 if n == 0 else 0)
+    return n
+
+  results = [r async for r in amap(delayed, range(4), concurrency=4, ordered=False)]
+  assert sorted(results) == [0, 1, 2, 3]
+  assert results[-1] == 0
+
+
+@pytest.mark.asyncio
+async def test_amap_errors_cancel_or_collect():
+  tracker = _Tracker()
+  with pytest.raises(ValueError):
+    async for _ in amap(tracker, range(30), concurrency=5):
+      pass
+  assert tracker.active == 0
+  assert max(tracker.started) < 30
+
+  collected = [r async for r in amap(_Tracker(), range(15), return_exceptions=True)]
+  assert isinstance(collected[13], ValueError)
+  assert collected[14] == 28
+
+
+@pytest.mark.asyncio
+async def test_amap_early_exit_cancels_in_flight():
+  tracker = _Tracker()
+  async with aclosing(amap(tracker, range(100), concurrency=8)) as results:
+    async for r in results:
+      if r == 4:
+        break
+  assert tracker.active == 0
+  assert len(tracker.started) < 100
+
+
+def test_resolve_concurrency():
+  assert resolve_concurrency(None, 100) == 10
+  assert resolve_concurrency(50, 20) == 20
+  with pytest.raises(ValueError):
+    resolve_concurrency(0, 100)
+
+
+@pytest.mark.asyncio
+async def test_client_map(mock_api):
+  mock_api.get(url__regex=r'/rest/api/3/issue/PROJ-\d+$').mock(
+    side_effect=lambda r: httpx.Response(200, json={**ISSUE_JSON, 'key': r.url.path.rsplit('/', 1)[1]}),
+  )
+  keys = [f'PROJ-{i}' for i in range(6)]
+  async with AsyncJiraClient(
+    base_url=BASE_URL, email='a@b.com', api_token='tok', limits=httpx.Limits(max_connections=2),
+  ) as client:
+    issues = [i async for i in client.map(client.issues.get, keys, concurrency=50)]
+  assert [i.key for i in issues] == keys
+
+
+def test_client_map_threads(client, mock_api):
+  import threading
+
+  lock = threading.Lock()
+  active = peak = 0
+
+  def side_effect(request: httpx.Request) -> httpx.Response:
+    nonlocal active, peak
+    with lock:
+      active += 1
+      peak = max(peak, active)
+    threading.Event().wait(0.005)
+    with lock:
+      active -= 1
+    key = request.url.path.split('/')[5]
+    if key == 'PROJ-3':
+      return httpx.Response(404, json={'errorMessages': ['Issue does not exist']})
+    return httpx.Response(200, json={**ISSUE_JSON, 'key': key})
+
+  mock_api.get(url__regex=r'/rest/api/3/issue/PROJ-\d+$').mock(side_effect=side_effect)
+  keys = [f'PROJ-{i}' for i in range(12)]
+  results = list(client.map(client.issues.get, keys, workers=4, return_exceptions=True))
+  assert peak <= 4
+  assert [getattr(r, 'key', None) for r in results] == [k if k != 'PROJ-3' else None for k in keys]
+  assert type(results[3]).__name__ == 'NotFoundError'
+
+  from pyjira import NotFoundError
+  with pytest.raises(NotFoundError):
+    list(client.map(client.issues.get, keys, workers=4, ordered=False))
+
+
+def test_client_map_shares_one_pool_and_forbids_nesting(client):
+  import threading
+
+  barrier = threading.Barrier(8)
+
+  def first_call() -> object:
+    barrier.wait()
+    return client._get_executor()
+
+  threads = [threading.Thread(target=lambda: pools.append(first_call())) for _ in range(8)]
+  pools: list[object] = []
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  assert len({id(pool) for pool in pools}) == 1
+
+  def nested(item: int) -> list[int]:
+    return list(client.map(lambda x: x, [item]))
+
+  with pytest.raises(RuntimeError, match='cannot be called from a function it is running'):
+    list(client.map(nested, [1, 2]))
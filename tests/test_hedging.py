@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+
+import httpx
+import pytest
+
+from pyjira import AsyncJiraClient, JiraClient
+from pyjira.hedging import HedgePolicy
+from pyjira.transport import AsyncJiraTransport, JiraTransport
+from tests.conftest import BASE_URL, ISSUE_JSON
+
+_ENDPOINT = '/rest/api/3/issue/{key}'
+
+
+def _policy(latency=0.02, **kwargs):
+  policy = HedgePolicy(percentile=0.9, min_delay=0.01, **kwargs)
+  for _ in range(policy.min_samples):
+    policy.observe(_ENDPOINT, latency)
+  return policy
+
+
+def _client(policy):
+  return JiraClient(base_url=BASE_URL, email='test@example.com', api_token='test-token', hedging=policy)
+
+
+def test_deadline_needs_samples_and_budget():
+  policy = HedgePolicy(percentile=0.5, min_samples=4, budget=0.5, burst=1)
+  assert policy.deadline('/rest/api/3/issue/PROJ-1') == (_ENDPOINT, None)
+  for latency in [0.01, 0.02, 0.03, 0.04]:
+    policy.observe(_ENDPOINT, latency)
+  assert policy.deadline('/rest/api/3/issue/PROJ-2') == (_ENDPOINT, 0.02)
+  assert policy.try_hedge()
+  assert not policy.try_hedge()
+  # Half a token per request: the next request has no budget, the one after does.
+  assert policy.deadline('/rest/api/3/issue/PROJ-3')[1] is None
+  assert policy.deadline('/rest/api/3/issue/PROJ-4')[1] == 0.02
+
+
+def test_slow_get_is_hedged(mock_api):
+  calls = []
+
+  def respond(request):
+    calls.append(request)
+    if len(calls) == 1:
+      time.sleep(0.5)
+    return httpx.Response(200, json=ISSUE_JSON)
+
+  route = mock_api.get('/rest/api/3/issue/PROJ-123').mock(side_effect=respond)
+  policy = _policy()
+  with _client(policy) as client:
+    started = time.perf_counter()
+    assert client.issues.get('PROJ-123').key == 'PROJ-123'
+    assert time.perf_counter() - started < 0.4
+  assert route.call_count == 2
+  assert (policy.hedged, policy.hedge_wins) == (1, 1)
+  # The slow first attempt ran to completion and is what was sampled.
+  samples = policy._latencies[_ENDPOINT].samples
+  assert len(samples) == policy.min_samples + 1
+  assert samples[-1] >= 0.5
+
+
+def test_fast_get_and_writes_are_not_hedged(mock_api):
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(return_value=httpx.Response(200, json=ISSUE_JSON))
+  create = mock_api.post('/rest/api/3/issue').mock(side_effect=lambda request: time.sleep(0.05) or httpx.Response(201, json={'id': '1', 'key': 'PROJ-1', 'self': ''}))
+  policy = _policy()
+  with _client(policy) as client:
+    client.issues.get('PROJ-123')
+    client.issues.create({'summary': 'x'})
+  assert create.call_count == 1
+  assert policy.hedged == 0
+
+
+def test_budget_bounds_hedges(mock_api):
+  def respond(request):
+    time.sleep(0.03)
+    return httpx.Response(200, json=ISSUE_JSON)
+
+  route = mock_api.get('/rest/api/3/issue/PROJ-123').mock(side_effect=respond)
+  policy = _policy(budget=0.0, burst=1)
+  with _client(policy) as client:
+    for _ in range(3):
+      client.issues.get('PROJ-123')
+  assert policy.hedged == 1
+  assert route.call_count == 4
+
+
+@pytest.mark.asyncio
+async def test_async_hedge(mock_api):
+  calls = []
+
+  async def respond(request):
+    calls.append(request)
+    if len(calls) == 1:
+      await asyncio.sleep(0.5)
+    return httpx.Response(200, json=ISSUE_JSON)
+
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(side_effect=respond)
+  policy = _policy()
+  async with AsyncJiraClient(
+    base_url=BASE_URL, email='test@example.com', api_token='test-token', hedging=policy,
+  ) as client:
+    started = time.perf_counter()
+    assert (await client.issues.get('PROJ-123')).key == 'PROJ-123'
+    assert time.perf_counter() - started < 0.4
+    assert client.hedging is policy
+  assert (policy.hedged, policy.hedge_wins) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_async_cancel_before_hedge_is_not_sampled():
+  async def respond(request):
+    await asyncio.sleep(1)
+    return httpx.Response(200, json=ISSUE_JSON)
+
+  policy = _policy(latency=0.3)
+  transport = AsyncJiraTransport(httpx.MockTransport(respond), hedging=policy)
+  request = httpx.Request('GET', f'{BASE_URL}/rest/api/3/issue/PROJ-123')
+  with pytest.raises(asyncio.TimeoutError):
+    await asyncio.wait_for(transport.handle_async_request(request), timeout=0.05)
+  assert policy.hedged == 0
+  assert len(policy._latencies[_ENDPOINT].samples) == policy.min_samples
+
+
+def test_hedge_pool_is_created_once_under_concurrency():
+  transport = JiraTransport(httpx.MockTransport(lambda request: httpx.Response(200)), hedging=_policy())
+  barrier = threading.Barrier(8)
+  pools = []
+
+  def get():
+    barrier.wait()
+    pools.append(transport._get_executor())
+
+  threads = [threading.Thread(target=get) for _ in range(8)]
+  for thread in threads:
+    thread.start()
+  for thread in threads:
+    thread.join()
+  assert len({id(pool) for pool in pools}) == 1
+  transport.close()
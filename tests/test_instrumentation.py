@@ -0,0 +1,158 @@
+import httpx
+import pytest
+
+from pyjira import AsyncJiraClient, JiraClient
+from pyjira.exceptions import RateLimitError
+from pyjira.instrumentation import CallEvent, Histogram, Instrumentation, endpoint_template
+from pyjira.resources.issues import IssueResource
+from tests.conftest import BASE_URL, ISSUE_JSON
+
+
+def _client(**kwargs):
+  return JiraClient(base_url=BASE_URL, email='test@example.com', api_token='test-token', **kwargs)
+
+
+def test_endpoint_template():
+  assert endpoint_template('/rest/api/3/issue/PROJ-1') == '/rest/api/3/issue/{key}'
+  assert endpoint_template('/rest/api/3/issue/10001/comment/42') == '/rest/api/3/issue/{id}/comment/{id}'
+  assert endpoint_template('/rest/api/3/project/PROJ') == '/rest/api/3/project/{key}'
+  assert endpoint_template('/rest/api/3/serverInfo') == '/rest/api/3/serverInfo'
+
+
+def test_histogram_quantiles():
+  histogram = Histogram([1, 2, 4, 8])
+  for value in [0.5, 1.5, 1.5, 3, 7]:
+    histogram.observe(value)
+  assert histogram.count == 5
+  assert histogram.counts == [1, 2, 1, 1, 0]
+  assert 1 <= histogram.quantile(0.5) <= 2
+  assert histogram.quantile(1.0) == 7
+  assert histogram.summary()['max'] == 7
+
+
+def test_sinks_can_change_while_emitting():
+  instrumentation = Instrumentation(metrics=False)
+  seen: list[str] = []
+  event = CallEvent('GET', '/rest/api/3/myself', 200, 0.01, 0, 0)
+
+  def sink(_: CallEvent) -> None:
+    seen.append('sink')
+    instrumentation.add_sink(late)
+    instrumentation.remove_sink(sink)
+
+  def late(_: CallEvent) -> None:
+    seen.append('late')
+
+  instrumentation.add_sink(sink)
+  instrumentation.emit(event)
+  instrumentation.emit(event)
+  assert seen == ['sink', 'late']
+
+
+def test_events_and_metrics(mock_api):
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(return_value=httpx.Response(200, json=ISSUE_JSON))
+  mock_api.get('/rest/api/3/issue/PROJ-404').mock(return_value=httpx.Response(404, json={'errorMessages': []}))
+  events: list[CallEvent] = []
+  with _client(instrumentation=Instrumentation(events.append)) as client:
+    assert isinstance(client.issues, IssueResource)
+    client.issues.get('PROJ-123')
+    with pytest.raises(Exception):
+      client.issues.get('PROJ-404')
+    metrics = client.instrumentation.metrics
+
+  assert [(e.method, e.endpoint, e.status) for e in events] == [
+    ('GET', '/rest/api/3/issue/{key}', 200),
+    ('GET', '/rest/api/3/issue/{key}', 404),
+  ]
+  assert events[0].bytes_in == len(httpx.Response(200, json=ISSUE_JSON).content)
+  assert events[0].duration > 0
+  assert events[0].parse_time is not None
+  stats = metrics.get('GET', '/rest/api/3/issue/{key}')
+  assert stats.calls == 2
+  assert stats.errors == 1
+  assert stats.statuses == {200: 1, 404: 1}
+  assert metrics.summary()[0]['calls'] == 2
+
+
+def test_transport_errors_are_reported(mock_api):
+  mock_api.get('/rest/api/3/issue/PROJ-1').mock(side_effect=httpx.ConnectTimeout('timed out'))
+  events: list[CallEvent] = []
+  with _client(instrumentation=Instrumentation(events.append, metrics=False)) as client:
+    with pytest.raises(httpx.ConnectTimeout):
+      client.issues.get('PROJ-1')
+  assert events[0].status is None
+  assert events[0].error == 'ConnectTimeout'
+
+
+def test_retries_429(mock_api, monkeypatch):
+  sleeps: list[float] = []
+  monkeypatch.setattr('pyjira.transport.time.sleep', sleeps.append)
+  route = mock_api.get('/rest/api/3/issue/PROJ-123').mock(side_effect=[
+    httpx.Response(429, headers={'Retry-After': '2'}),
+    httpx.Response(429),
+    httpx.Response(200, json=ISSUE_JSON),
+  ])
+  events: list[CallEvent] = []
+  with _client(max_retries=2, instrumentation=Instrumentation(events.append)) as client:
+    assert client.issues.get('PROJ-123').key == 'PROJ-123'
+  assert route.call_count == 3
+  assert sleeps == [2.0, 2.0]
+  assert events[0].retries == 2
+  assert events[0].rate_limit_wait == 4.0
+
+
+def test_retries_exhausted(mock_api, monkeypatch):
+  monkeypatch.setattr('pyjira.transport.time.sleep', lambda _: None)
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(return_value=httpx.Response(429, headers={'Retry-After': '1'}))
+  with _client(max_retries=1) as client:
+    with pytest.raises(RateLimitError):
+      client.issues.get('PROJ-123')
+
+
+def test_idle_by_default(client, mock_api):
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(return_value=httpx.Response(200, json=ISSUE_JSON))
+  assert client.instrumentation.metrics is None
+  assert not client.instrumentation.active
+  response = client._http.get('/rest/api/3/issue/PROJ-123')
+  assert type(response) is httpx.Response
+
+
+def test_profile_splits_network_decode_validation(client, mock_api):
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(return_value=httpx.Response(200, json=ISSUE_JSON))
+  with client.profile() as profile:
+    client.issues.get('PROJ-123')
+    client.issues.get('PROJ-123')
+  client.issues.get('PROJ-123')
+
+  assert len(profile.calls) == 2
+  event = profile.calls[0]
+  assert event.decode_time is not None and event.decode_time > 0
+  assert event.validation_time is not None and event.validation_time >= 0
+  assert event.decode_time + event.validation_time == pytest.approx(event.parse_time)
+  assert profile.decode > 0 and profile.validation > 0 and profile.network > 0
+  assert profile.bound in ('io', 'cpu')
+  assert profile.by_endpoint()[0]['calls'] == 2
+  assert 'GET' in profile.report()
+  assert not client.instrumentation.active
+
+
+@pytest.mark.asyncio
+async def test_async_events(mock_api):
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(return_value=httpx.Response(200, json=ISSUE_JSON))
+  async with AsyncJiraClient(
+    base_url=BASE_URL,
+    email='test@example.com',
+    api_token='test-token',
+    instrumentation=True,
+  ) as client:
+    keys = ['PROJ-123'] * 5
+    async for _ in client.map(client.issues.get, keys, concurrency=3):
+      pass
+    stats = client.instrumentation.metrics.get('GET', '/rest/api/3/issue/{key}')
+    assert stats.calls == 5
+    assert stats.parse_time.count == 5
+    assert stats.decode_time.count == 5
+    with client.profile() as profile:
+      await client.issues.get('PROJ-123')
+  assert len(profile.calls) == 1
+  assert profile.calls[0].decode_time > 0
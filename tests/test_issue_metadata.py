@@ -0,0 +1,92 @@
+import httpx
+
+from pyjira.cache import MetadataCache
+
+
+FIELDS_PAGE = {
+  'startAt': 0,
+  'maxResults': 50,
+  'total': 2,
+  'fields': [
+    {'fieldId': 'summary', 'key': 'summary', 'name': 'Summary', 'required': True},
+    {'fieldId': 'labels', 'key': 'labels', 'name': 'Labels', 'required': False},
+  ],
+}
+
+
+def test_get_create_issue_types(client, mock_api):
+  mock_api.get('/rest/api/3/issue/createmeta/PROJ/issuetypes').mock(
+    return_value=httpx.Response(200, json={
+      'startAt': 0,
+      'maxResults': 50,
+      'total': 1,
+      'issueTypes': [{'id': '10001', 'name': 'Task'}],
+    }),
+  )
+  page = client.issue_metadata.get_create_issue_types('PROJ')
+  assert page.total == 1
+  assert page.issue_types[0].name == 'Task'
+
+
+def test_create_fields_are_cached(client, mock_api):
+  route = mock_api.get('/rest/api/3/issue/createmeta/PROJ/issuetypes/10001').mock(
+    return_value=httpx.Response(200, json=FIELDS_PAGE),
+  )
+  first = client.issue_metadata.get_all_create_fields('PROJ', '10001')
+  second = client.issue_metadata.get_all_create_fields('PROJ', '10001')
+  assert [f.field_id for f in first] == ['summary', 'labels']
+  assert first == second
+  assert route.call_count == 1
+
+  assert client.issue_metadata.invalidate(project='PROJ') == 1
+  client.issue_metadata.get_all_create_fields('PROJ', '10001')
+  assert route.call_count == 2
+
+
+def test_create_fields_results_do_not_share_state(client, mock_api):
+  page = {**FIELDS_PAGE, 'fields': [{**FIELDS_PAGE['fields'][0], 'operations': ['set']}]}
+  mock_api.get('/rest/api/3/issue/createmeta/PROJ/issuetypes/10001').mock(
+    return_value=httpx.Response(200, json={**page, 'total': 1}),
+  )
+  first = client.issue_metadata.get_all_create_fields('PROJ', '10001')
+  first[0].required = False
+  first[0].operations.append('add')
+  second = client.issue_metadata.get_all_create_fields('PROJ', '10001')
+  second[0].name = 'Title'
+  third = client.issue_metadata.get_all_create_fields('PROJ', '10001')
+  assert (third[0].name, third[0].required, third[0].operations) == ('Summary', True, ['set'])
+
+
+def test_edit_meta_shared_across_issues(client, mock_api):
+  route = mock_api.get(url__regex=r'/rest/api/3/issue/PROJ-\d+/editmeta').mock(
+    return_value=httpx.Response(200, json={'fields': {'summary': {'required': True}}}),
+  )
+  for key in ('PROJ-1', 'PROJ-2', 'PROJ-3'):
+    meta = client.issue_metadata.get_edit_meta(key, project='PROJ', issue_type='10001')
+    assert 'summary' in meta['fields']
+  assert route.call_count == 1
+
+
+def test_edit_meta_results_do_not_share_state(client, mock_api):
+  route = mock_api.get(url__regex=r'/rest/api/3/issue/PROJ-\d+/editmeta').mock(
+    return_value=httpx.Response(200, json={'fields': {'summary': {'required': True}}}),
+  )
+  first = client.issue_metadata.get_edit_meta('PROJ-1', project='PROJ', issue_type='10001')
+  first['fields'].clear()
+  # IssueResource.get_edit_meta shares the client's cache when given the pair.
+  second = client.issues.get_edit_meta('PROJ-2', project='PROJ', issue_type='10001')
+  assert second == {'fields': {'summary': {'required': True}}}
+  client.issues.get_edit_meta('PROJ-3')
+  client.issues.get_edit_meta('PROJ-4', project='PROJ', issue_type='10001', override_editable_flag=True)
+  assert route.call_count == 3
+
+
+def test_metadata_cache_ttl(monkeypatch):
+  now = [100.0]
+  monkeypatch.setattr('pyjira.cache.time.monotonic', lambda: now[0])
+  cache = MetadataCache(ttl=10)
+  cache.set('edit', 'PROJ', '1', {'fields': {}})
+  assert cache.get('edit', 'PROJ', '1') == {'fields': {}}
+  now[0] += 11
+  assert cache.get('edit', 'PROJ', '1') is None
+  assert len(cache) == 0
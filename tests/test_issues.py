@@ -1,8 +1,11 @@
+import json
+
 import httpx
 import pytest
 import respx
 
 from pyjira import AuthenticationError, NotFoundError
+from pyjira.bulk import merge_task_results
 from tests.conftest import BASE_URL, ISSUE_JSON
 
 
@@ -113,3 +116,136 @@ def test_transition_issue(client, mock_api):
     return_value=httpx.Response(204),
   )
   client.issues.transition('PROJ-123', '11')
+
+
+def test_bulk_transition_uses_bulk_endpoint(client, mock_api):
+  submit = mock_api.post('/rest/api/3/bulk/issues/transition').mock(
+    return_value=httpx.Response(201, json={'taskId': '42'}),
+  )
+  mock_api.get('/rest/api/3/bulk/queue/42').mock(
+    return_value=httpx.Response(200, json={
+      'taskId': '42',
+      'status': 'COMPLETE',
+      'progressPercent': 100,
+      'processedAccessibleIssues': [10001, 10002],
+      'failedAccessibleIssues': {'10002': ['Transition not allowed']},
+    }),
+  )
+  progress = []
+  results = client.issues.bulk_transition(
+    ['10001', '10002'],
+    '31',
+    on_progress=lambda done, total: progress.append((done, total)),
+  )
+  body = submit.calls.last.request.read()
+  assert b'"transitionId":"31"' in body.replace(b' ', b'')
+  assert results['10001'].ok
+  assert not results['10002'].ok
+  assert results['10002'].error_messages == ['Transition not allowed']
+  assert progress[-1] == (2, 2)
+
+
+def test_bulk_transition_maps_failures_back_to_keys(client, mock_api):
+  search = mock_api.post('/rest/api/3/search').mock(
+    return_value=httpx.Response(200, json={
+      'startAt': 0,
+      'total': 2,
+      'issues': [{'id': '10001', 'key': 'PROJ-1'}, {'id': '10002', 'key': 'PROJ-2'}],
+    }),
+  )
+  submit = mock_api.post('/rest/api/3/bulk/issues/transition').mock(
+    return_value=httpx.Response(201, json={'taskId': '42'}),
+  )
+  mock_api.get('/rest/api/3/bulk/queue/42').mock(
+    return_value=httpx.Response(200, json={
+      'status': 'COMPLETE',
+      'processedAccessibleIssues': [10001, 10002],
+      'failedAccessibleIssues': {'10002': ['Transition not allowed']},
+    }),
+  )
+  results = client.issues.bulk_transition(['PROJ-1', 'PROJ-2'], '31')
+  assert json.loads(search.calls.last.request.read())['jql'] == 'key in (PROJ-1, PROJ-2)'
+  inputs = json.loads(submit.calls.last.request.read())['bulkTransitionInputs']
+  assert inputs[0]['selectedIssueIdsOrKeys'] == ['10001', '10002']
+  assert list(results) == ['PROJ-1', 'PROJ-2']
+  assert results['PROJ-1'].ok
+  assert results['PROJ-2'].error_messages == ['Transition not allowed']
+
+
+def test_merge_task_results_never_reports_unmatched_failures_as_ok():
+  results = merge_task_results(['PROJ-1', 'PROJ-2'], 'COMPLETE', [10001, 10002], {'10002': ['No']})
+  assert list(results) == ['PROJ-1', 'PROJ-2']
+  assert not any(r.ok for r in results.values())
+
+
+def test_merge_task_results_fails_unreported_issues_on_complete():
+  results = merge_task_results(['A-1', 'A-2'], 'COMPLETE', [10001], {}, {'10001': 'A-1'})
+  assert results['A-1'].ok
+  assert not results['A-2'].ok
+  assert 'not processed' in results['A-2'].error_messages[0]
+
+
+def test_bulk_transition_records_polling_errors_per_chunk(client, mock_api):
+  ids = [str(10000 + i) for i in range(1001)]
+  mock_api.post('/rest/api/3/bulk/issues/transition').mock(side_effect=[
+    httpx.Response(201, json={'taskId': '1'}),
+    httpx.Response(201, json={'taskId': '2'}),
+  ])
+  mock_api.get('/rest/api/3/bulk/queue/1').mock(
+    return_value=httpx.Response(200, json={'status': 'COMPLETE', 'processedAccessibleIssues': [int(i) for i in ids[:1000]]}),
+  )
+  mock_api.get('/rest/api/3/bulk/queue/2').mock(
+    return_value=httpx.Response(404, json={'errorMessages': ['Task expired'], 'errors': {}}),
+  )
+  results = client.issues.bulk_transition(ids, '31')
+  assert all(results[i].ok for i in ids[:1000])
+  assert results[ids[-1]].error_messages == ['Task expired']
+  assert isinstance(results[ids[-1]].exception, NotFoundError)
+
+
+def test_bulk_transition_stops_polling_after_timeout(client, mock_api):
+  mock_api.post('/rest/api/3/bulk/issues/transition').mock(return_value=httpx.Response(201, json={'taskId': '42'}))
+  mock_api.get('/rest/api/3/bulk/queue/42').mock(return_value=httpx.Response(200, json={'status': 'RUNNING'}))
+  results = client.issues.bulk_transition(['10001'], '31', poll_timeout=0)
+  assert not results['10001'].ok
+  assert isinstance(results['10001'].exception, TimeoutError)
+
+
+def test_bulk_transition_requires_task_id(client, mock_api):
+  mock_api.post('/rest/api/3/bulk/issues/transition').mock(return_value=httpx.Response(201, json={}))
+  results = client.issues.bulk_transition(['10001'], '31')
+  assert not results['10001'].ok
+  assert 'taskId' in results['10001'].error_messages[0]
+
+
+def test_bulk_transition_falls_back_to_per_issue(client, mock_api):
+  mock_api.post('/rest/api/3/search').mock(
+    return_value=httpx.Response(200, json={'startAt': 0, 'total': 0, 'issues': []}),
+  )
+  mock_api.post('/rest/api/3/bulk/issues/transition').mock(
+    return_value=httpx.Response(404, json={'errorMessages': ['Not found'], 'errors': {}}),
+  )
+  mock_api.post('/rest/api/3/issue/PROJ-1/transitions').mock(
+    return_value=httpx.Response(204),
+  )
+  mock_api.post('/rest/api/3/issue/PROJ-2/transitions').mock(
+    return_value=httpx.Response(400, json={'errorMessages': [], 'errors': {'resolution': 'required'}}),
+  )
+  results = client.issues.bulk_transition(['PROJ-1', 'PROJ-2'], '31', max_workers=2)
+  assert list(results) == ['PROJ-1', 'PROJ-2']
+  assert results['PROJ-1'].ok
+  assert results['PROJ-2'].error_messages == ['resolution: required']
+
+
+def test_bulk_edit_per_issue(client, mock_api):
+  route = mock_api.put(url__regex=r'/rest/api/3/issue/PROJ-\d+$').mock(
+    return_value=httpx.Response(204),
+  )
+  results = client.issues.bulk_edit([f'PROJ-{i}' for i in range(5)], fields={'labels': ['done']})
+  assert route.call_count == 5
+  assert all(r.ok for r in results.values())
+
+
+def test_bulk_edit_requires_changes(client):
+  with pytest.raises(ValueError, match='Provide fields'):
+    client.issues.bulk_edit(['PROJ-1'])
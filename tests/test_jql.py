@@ -0,0 +1,70 @@
+import httpx
+import pytest
+
+from pyjira.jql import UnsupportedJQLError, evaluate, parse, search_with_fallback
+from pyjira.models.issue import Issue
+from tests.conftest import ISSUE_JSON, SEARCH_RESULTS_JSON
+
+
+def _issue(key: str, status: str, assignee: str | None, updated: str, **extra) -> Issue:
+  fields = {
+    **ISSUE_JSON['fields'],
+    'status': {'id': '1', 'name': status},
+    'assignee': {'accountId': assignee, 'displayName': assignee} if assignee else None,
+    'updated': updated,
+    **extra,
+  }
+  return Issue.model_validate({**ISSUE_JSON, 'key': key, 'fields': fields})
+
+
+ISSUES = [
+  _issue('PROJ-1', 'Open', 'alice', '2025-01-10T10:00:00.000+0000', customfield_10016=3),
+  _issue('PROJ-2', 'In Progress', 'bob', '2025-01-12T10:00:00.000+0000', customfield_10016=8),
+  _issue('PROJ-3', 'Done', 'alice', '2025-01-11T10:00:00.000+0000'),
+  _issue('PROJ-10', 'Open', None, '2025-01-09T10:00:00.000+0000', labels=['backend']),
+]
+
+
+def _keys(jql: str) -> list[str]:
+  return [i.key for i in evaluate(jql, ISSUES)]
+
+
+def test_evaluate_common_clauses():
+  assert _keys('project = PROJ AND status in (Open, "In Progress") AND assignee = alice') == ['PROJ-1']
+  assert _keys('status != Done ORDER BY updated DESC') == ['PROJ-2', 'PROJ-1', 'PROJ-10']
+  assert _keys('assignee IS EMPTY') == ['PROJ-10']
+  assert _keys('assignee != alice') == ['PROJ-2']
+  assert _keys('labels = backend OR key = PROJ-3') == ['PROJ-3', 'PROJ-10']
+  assert _keys('NOT (status = open)') == ['PROJ-2', 'PROJ-3']
+  assert _keys('summary ~ "test"') == ['PROJ-1', 'PROJ-2', 'PROJ-3', 'PROJ-10']
+
+
+def test_evaluate_ordering_and_comparisons():
+  assert _keys('key > PROJ-2 ORDER BY key') == ['PROJ-3', 'PROJ-10']
+  assert _keys('updated >= "2025-01-11" ORDER BY updated ASC') == ['PROJ-3', 'PROJ-2']
+  assert _keys('cf[10016] > 5') == ['PROJ-2']
+  assert _keys('ORDER BY cf[10016] DESC, key ASC') == ['PROJ-2', 'PROJ-1', 'PROJ-3', 'PROJ-10']
+
+
+@pytest.mark.parametrize('jql', [
+  'assignee = currentUser()',
+  'status WAS Open',
+  '"Story Points" > 3',
+  'summary = foo',
+])
+def test_unsupported_jql(jql):
+  with pytest.raises(UnsupportedJQLError):
+    parse(jql)
+
+
+def test_search_with_fallback(client, mock_api):
+  route = mock_api.get('/rest/api/3/search').mock(
+    return_value=httpx.Response(200, json=SEARCH_RESULTS_JSON),
+  )
+  local = search_with_fallback(client.search, 'status = Open', ISSUES)
+  assert [i.key for i in local] == ['PROJ-1', 'PROJ-10']
+  assert route.call_count == 0
+
+  remote = search_with_fallback(client.search, 'assignee = currentUser()', ISSUES)
+  assert [i.key for i in remote] == ['PROJ-123']
+  assert route.call_count == 1
@@ -0,0 +1,94 @@
+import re
+from datetime import UTC, datetime
+from zoneinfo import ZoneInfo
+
+import httpx
+import pytest
+
+from pyjira.mirror import IssueMirror
+from tests.conftest import ISSUE_JSON, USER_JSON
+
+
+def _issue(key: str, status: str, updated: str) -> dict:
+  fields = {**ISSUE_JSON['fields'], 'updated': updated, 'status': {'id': '1', 'name': status}}
+  return {**ISSUE_JSON, 'key': key, 'fields': fields}
+
+
+def _page(*issues: dict) -> dict:
+  return {'startAt': 0, 'maxResults': 50, 'total': len(issues), 'issues': list(issues)}
+
+
+def test_mirror_sync_and_query(client, mock_api):
+  mock_api.get('/rest/api/3/myself').mock(return_value=httpx.Response(200, json=USER_JSON))
+  search = mock_api.get('/rest/api/3/search').mock(
+    return_value=httpx.Response(200, json=_page(
+      _issue('PROJ-1', 'Open', '2025-01-16T14:20:00.000+0000'),
+      _issue('PROJ-2', 'Done', '2025-01-17T09:00:00.000+0000'),
+    )),
+  )
+  with IssueMirror() as mirror:
+    stats = mirror.sync(client, 'project = PROJ ORDER BY key', reconcile=False)
+    assert stats.upserted == 2
+    assert 'ORDER BY updated ASC' in search.calls.last.request.url.params['jql']
+    assert mirror.get('PROJ-1').fields.status.name == 'Open'
+    assert [i.key for i in mirror.query(project='PROJ')] == ['PROJ-2', 'PROJ-1']
+    assert [i.key for i in mirror.query(status=['Open'])] == ['PROJ-1']
+
+    search.mock(return_value=httpx.Response(200, json=_page()))
+    mirror.sync(client, 'project = PROJ', reconcile=False)
+    jql = search.calls.last.request.url.params['jql']
+    # Cursor 2025-01-17 09:00 UTC, minus overlap, in the user's New York time zone.
+    assert 'updated >= "2025-01-17 03:59"' in jql
+
+
+def test_mirror_reconcile_drops_deleted(client, mock_api):
+  mock_api.get('/rest/api/3/myself').mock(return_value=httpx.Response(200, json=USER_JSON))
+  search = mock_api.get('/rest/api/3/search').mock(
+    return_value=httpx.Response(200, json=_page(
+      _issue('PROJ-1', 'Open', '2025-01-16T14:20:00.000+0000'),
+      _issue('PROJ-2', 'Open', '2025-01-16T14:20:00.000+0000'),
+    )),
+  )
+  mirror = IssueMirror()
+  mirror.sync(client, 'project = PROJ', reconcile=False)
+  assert len(mirror) == 2
+
+  search.mock(return_value=httpx.Response(200, json=_page(
+    _issue('PROJ-1', 'Open', '2025-01-16T14:20:00.000+0000'),
+  )))
+  stats = mirror.sync(client, 'project = PROJ', reconcile=True)
+  assert stats.reconciled
+  assert stats.deleted == 1
+  assert mirror.keys() == ['PROJ-1']
+  mirror.close()
+
+
+def test_mirror_delta_scan_survives_updates_during_the_scan(client, mock_api):
+  mock_api.get('/rest/api/3/myself').mock(return_value=httpx.Response(200, json=USER_JSON))
+  updated = {f'PROJ-{i}': datetime(2025, 1, 16, 14, i, tzinfo=UTC) for i in range(1, 6)}
+
+  def search(request: httpx.Request) -> httpx.Response:
+    jql = request.url.params['jql']
+    start = int(request.url.params['startAt'])
+    limit = int(request.url.params['maxResults'])
+    since = datetime.min.replace(tzinfo=UTC)
+    if match := re.search(r'updated >= "([^"]+)"', jql):
+      since = datetime.strptime(match[1], '%Y-%m-%d %H:%M').replace(tzinfo=ZoneInfo('America/New_York'))
+    ordered = sorted((u, k) for k, u in updated.items() if u >= since)
+    page = [_issue(k, 'Open', u.strftime('%Y-%m-%dT%H:%M:%S.000+0000')) for u, k in ordered[start:start + limit]]
+    if search_route.call_count == 1:
+      # PROJ-1 is edited after the first page: it moves to the end of the ordering.
+      updated['PROJ-1'] = datetime(2025, 1, 16, 15, 0, tzinfo=UTC)
+    return httpx.Response(200, json={'startAt': start, 'maxResults': limit, 'total': len(ordered), 'issues': page})
+
+  search_route = mock_api.get('/rest/api/3/search').mock(side_effect=search)
+  with IssueMirror() as mirror:
+    stats = mirror.sync(client, 'project = PROJ', page_size=2, reconcile=False)
+    assert mirror.keys() == [f'PROJ-{i}' for i in range(1, 6)]
+    assert mirror.get('PROJ-1').fields.updated == datetime(2025, 1, 16, 15, 0, tzinfo=UTC)
+    assert stats.cursor == datetime(2025, 1, 16, 15, 0, tzinfo=UTC)
+
+
+def test_mirror_rejects_projection_without_stored_fields(client):
+  with IssueMirror() as mirror, pytest.raises(ValueError, match='project, status'):
+    mirror.sync(client, 'project = PROJ', fields=['summary', 'updated'])
@@ -1,3 +1,5 @@
+import time
+
 import httpx
 import pytest
 import respx
@@ -106,3 +108,375 @@ async def test_async_paginator_multiple_pages():
   paginator = AsyncPaginator(fetch_page, page_size=2)
   results = [item async for item in paginator]
   assert len(results) == 5
+
+
+def test_jql_paginated_with_parse_executor(client, mock_api):
+  import multiprocessing
+  from concurrent.futures import ProcessPoolExecutor
+
+  total = 7
+
+  def side_effect(request: httpx.Request) -> httpx.Response:
+    start = int(request.url.params['startAt'])
+    limit = int(request.url.params['maxResults'])
+    keys = [f'PROJ-{i}' for i in range(start, min(start + limit, total))]
+    return httpx.Response(200, json={
+      'startAt': start,
+      'maxResults': limit,
+      'total': total,
+      'issues': [{**ISSUE_JSON, 'key': key} for key in keys],
+    })
+
+  route = mock_api.get('/rest/api/3/search').mock(side_effect=side_effect)
+  with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context('spawn')) as pool:
+    paginator = client.search.jql_paginated('project = PROJ', page_size=3, parse_executor=pool)
+    issues = list(paginator)
+  assert [i.key for i in issues] == [f'PROJ-{i}' for i in range(total)]
+  assert route.call_count == 3
+
+
+def test_sniff_page_header():
+  from pyjira.parsing import sniff_page_header
+
+  raw = b'{"expand":"names","startAt":0,"maxResults":100,"total":4321,"issues":[{"total":1}]}'
+  assert sniff_page_header(raw) == (4321, 100)
+  assert sniff_page_header(b'{"issues":[{"total":1}],"total":5}') == (None, None)
+
+
+def test_paginator_checkpoint_resume():
+  from pyjira.pagination import PaginatorCheckpoint
+
+  all_items = [_make_issue(f'PROJ-{i}') for i in range(7)]
+  calls: list[int] = []
+
+  def fetch_page(start_at: int, max_results: int) -> tuple[list[Issue], int]:
+    calls.append(start_at)
+    return all_items[start_at:start_at + max_results], 7
+
+  params = {'jql': 'project = PROJ'}
+  paginator = Paginator(fetch_page, page_size=3, params=params)
+  assert [next(paginator).key for _ in range(4)] == ['PROJ-0', 'PROJ-1', 'PROJ-2', 'PROJ-3']
+  checkpoint = PaginatorCheckpoint.from_dict(paginator.checkpoint().to_dict())
+  assert checkpoint.start_at == 4
+
+  calls.clear()
+  resumed = Paginator(fetch_page, page_size=3, params=params, checkpoint=checkpoint)
+  assert [i.key for i in resumed] == ['PROJ-4', 'PROJ-5', 'PROJ-6']
+  assert calls == [4]
+
+  with pytest.raises(ValueError):
+    Paginator(fetch_page, params={'jql': 'project = OTHER'}, checkpoint=checkpoint)
+
+
+def test_paginator_checkpoint_resume_keeps_limit():
+  from pyjira.pagination import PaginatorCheckpoint
+
+  all_items = [_make_issue(f'PROJ-{i}') for i in range(10)]
+
+  def fetch_page(start_at: int, max_results: int) -> tuple[list[Issue], int]:
+    return all_items[start_at:start_at + max_results], 10
+
+  paginator = Paginator(fetch_page, page_size=2, limit=5)
+  assert [next(paginator).key for _ in range(3)] == ['PROJ-0', 'PROJ-1', 'PROJ-2']
+  checkpoint = PaginatorCheckpoint.from_dict(paginator.checkpoint().to_dict())
+  assert (checkpoint.start_at, checkpoint.limit, checkpoint.yielded) == (3, 5, 3)
+
+  resumed = Paginator(fetch_page, page_size=2, limit=5, checkpoint=checkpoint)
+  assert [i.key for i in resumed] == ['PROJ-3', 'PROJ-4']
+  with pytest.raises(ValueError, match='limit=5'):
+    Paginator(fetch_page, limit=10, checkpoint=checkpoint)
+
+
+def test_jql_paginated_checkpoint_every(client, mock_api, tmp_path):
+  from pyjira.pagination import PaginatorCheckpoint
+
+  total = 5
+
+  def side_effect(request: httpx.Request) -> httpx.Response:
+    start = int(request.url.params['startAt'])
+    limit = int(request.url.params['maxResults'])
+    keys = [f'PROJ-{i}' for i in range(start, min(start + limit, total))]
+    return httpx.Response(200, json={
+      'startAt': start,
+      'maxResults': limit,
+      'total': total,
+      'issues': [{**ISSUE_JSON, 'key': key} for key in keys],
+    })
+
+  mock_api.get('/rest/api/3/search').mock(side_effect=side_effect)
+  path = tmp_path / 'scan.json'
+  seen: list[int] = []
+
+  def on_checkpoint(checkpoint: PaginatorCheckpoint) -> None:
+    seen.append(checkpoint.start_at)
+    checkpoint.save(path)
+
+  issues = list(client.search.jql_paginated(
+    'project = PROJ', page_size=2, checkpoint_every=1, on_checkpoint=on_checkpoint,
+  ))
+  assert len(issues) == total
+  assert seen == [2, 4, 5]
+  loaded = PaginatorCheckpoint.load(path)
+  assert loaded.start_at == 5
+  assert loaded.params['jql'] == 'project = PROJ'
+  assert PaginatorCheckpoint.load(tmp_path / 'missing.json') is None
+
+  resumed = client.search.jql_paginated('project = PROJ', page_size=2, checkpoint=PaginatorCheckpoint(
+    start_at=4, page_size=2, params=loaded.params,
+  ))
+  assert [i.key for i in resumed] == ['PROJ-4']
+
+
+def test_paginator_iter_pages():
+  all_items = [_make_issue(f'PROJ-{i}') for i in range(7)]
+
+  def fetch_page(start_at: int, max_results: int) -> tuple[list[Issue], int]:
+    return all_items[start_at:start_at + max_results], 7
+
+  paginator = Paginator(fetch_page, page_size=3)
+  assert next(paginator).key == 'PROJ-0'
+  pages = list(paginator.iter_pages())
+  assert [(p.start_at, len(p), p.total) for p in pages] == [(1, 2, 7), (3, 3, 7), (6, 1, 7)]
+  assert [i.key for i in pages[1]] == ['PROJ-3', 'PROJ-4', 'PROJ-5']
+  assert pages[-1].next_start == 7
+  assert paginator.checkpoint().start_at == 7
+  assert list(paginator) == []
+
+
+@pytest.mark.asyncio
+async def test_async_paginator_aiter_pages():
+  all_items = [_make_issue(f'PROJ-{i}') for i in range(5)]
+
+  async def fetch_page(start_at: int, max_results: int) -> tuple[list[Issue], int]:
+    return all_items[start_at:start_at + max_results], 5
+
+  paginator = AsyncPaginator(fetch_page, page_size=2)
+  pages = [page async for page in paginator.aiter_pages()]
+  assert [[i.key for i in p] for p in pages] == [['PROJ-0', 'PROJ-1'], ['PROJ-2', 'PROJ-3'], ['PROJ-4']]
+
+
+def _offset_page(request: httpx.Request, total: int, key: str, make) -> httpx.Response:
+  start = int(request.url.params['startAt'])
+  limit = int(request.url.params['maxResults'])
+  return httpx.Response(200, json={
+    'startAt': start,
+    'maxResults': limit,
+    'total': total,
+    key: [make(i) for i in range(start, min(start + limit, total))],
+  })
+
+
+def test_comments_list_paginated_prefetch(client, mock_api):
+  route = mock_api.get('/rest/api/3/issue/PROJ-1/comment').mock(
+    side_effect=lambda r: _offset_page(r, 5, 'comments', lambda i: {'id': str(i), 'body': 'hi'}),
+  )
+  comments = list(client.comments.list_paginated('PROJ-1', page_size=2, prefetch=2))
+  assert [c.id for c in comments] == ['0', '1', '2', '3', '4']
+  assert sorted(int(c.request.url.params['startAt']) for c in route.calls) == [0, 2, 4]
+
+
+def test_users_search_paginated_stops_on_empty_page(client, mock_api):
+  users = [{'accountId': f'u{i}'} for i in range(3)]
+
+  def side_effect(request: httpx.Request) -> httpx.Response:
+    start = int(request.url.params['startAt'])
+    limit = int(request.url.params['maxResults'])
+    return httpx.Response(200, json=users[start:start + limit])
+
+  route = mock_api.get('/rest/api/3/users/search').mock(side_effect=side_effect)
+  found = list(client.users.search_paginated(page_size=2))
+  assert [u.account_id for u in found] == ['u0', 'u1', 'u2']
+  # Two empty pages in a row end the listing.
+  assert route.call_count == 4
+
+
+@pytest.mark.parametrize('prefetch', [0, 2])
+def test_users_search_paginated_steps_over_empty_middle_page(client, mock_api, prefetch):
+  # Every user on the second page is hidden from the caller.
+  users = [{'accountId': f'u{i}'} for i in range(6)]
+  hidden = {'u2', 'u3'}
+
+  def side_effect(request: httpx.Request) -> httpx.Response:
+    start = int(request.url.params['startAt'])
+    limit = int(request.url.params['maxResults'])
+    return httpx.Response(200, json=[u for u in users[start:start + limit] if u['accountId'] not in hidden])
+
+  mock_api.get('/rest/api/3/users/search').mock(side_effect=side_effect)
+  found = [u.account_id for u in client.users.search_paginated(page_size=2, prefetch=prefetch)]
+  assert found == ['u0', 'u1', 'u4', 'u5']
+
+
+@pytest.mark.parametrize('prefetch', [0, 1])
+def test_users_search_paginated_short_pages_do_not_repeat(client, mock_api, prefetch):
+  # u1 and u4 are hidden from the caller: their pages come back short.
+  users = [{'accountId': f'u{i}'} for i in range(8)]
+  hidden = {'u1', 'u4'}
+
+  def side_effect(request: httpx.Request) -> httpx.Response:
+    start = int(request.url.params['startAt'])
+    limit = int(request.url.params['maxResults'])
+    return httpx.Response(200, json=[u for u in users[start:start + limit] if u['accountId'] not in hidden])
+
+  route = mock_api.get('/rest/api/3/users/search').mock(side_effect=side_effect)
+  found = [u.account_id for u in client.users.search_paginated(page_size=3, prefetch=prefetch)]
+  assert found == ['u0', 'u2', 'u3', 'u5', 'u6', 'u7']
+  assert sorted({int(c.request.url.params['startAt']) for c in route.calls}) == [0, 3, 6, 9, 12]
+
+
+def test_users_search_paginated_limit_bounds_prefetch(client, mock_api):
+  users = [{'accountId': f'u{i}'} for i in range(40)]
+
+  def side_effect(request: httpx.Request) -> httpx.Response:
+    start = int(request.url.params['startAt'])
+    limit = int(request.url.params['maxResults'])
+    return httpx.Response(200, json=users[start:start + limit])
+
+  route = mock_api.get('/rest/api/3/users/search').mock(side_effect=side_effect)
+  found = list(client.users.search_paginated(page_size=10, limit=10, prefetch=3))
+  assert len(found) == 10
+  assert [c.request.url.params['startAt'] for c in route.calls] == ['0']
+  route.reset()
+  found = list(client.users.search_paginated(page_size=10, limit=25, prefetch=3))
+  assert len(found) == 25
+  assert sorted((int(c.request.url.params['startAt']), c.request.url.params['maxResults']) for c in route.calls) == [
+    (0, '10'), (10, '10'), (20, '5'),
+  ]
+
+
+def test_group_members_paginated_limit(client, mock_api):
+  route = mock_api.get('/rest/api/3/group/member').mock(
+    side_effect=lambda r: _offset_page(r, 10, 'values', lambda i: {'accountId': f'u{i}'}),
+  )
+  members = list(client.groups.get_members_paginated(group_name='devs', page_size=4, limit=6))
+  assert [m.account_id for m in members] == [f'u{i}' for i in range(6)]
+  assert [c.request.url.params['maxResults'] for c in route.calls] == ['4', '2']
+
+
+@pytest.mark.asyncio
+async def test_async_workflow_schemes_paginated_prefetch():
+  from pyjira import AsyncJiraClient
+
+  with respx.mock(base_url=BASE_URL) as mock:
+    route = mock.get('/rest/api/3/workflowscheme').mock(
+      side_effect=lambda r: _offset_page(r, 5, 'values', lambda i: {'id': i, 'name': f'Scheme {i}'}),
+    )
+    async with AsyncJiraClient(base_url=BASE_URL, email='a@b.com', api_token='tok') as client:
+      paginator = client.workflows.get_all_schemes_paginated(page_size=2, prefetch=1)
+      schemes = [s async for s in paginator]
+  assert [s.id for s in schemes] == [0, 1, 2, 3, 4]
+  assert route.call_count == 3
+
+
+def test_new_listing_paginators(client, mock_api):
+  mock_api.get('/rest/api/3/dashboard').mock(
+    side_effect=lambda r: _offset_page(r, 3, 'dashboards', lambda i: {'id': str(i), 'name': f'D{i}'}),
+  )
+  mock_api.get('/rest/api/3/group/bulk').mock(
+    side_effect=lambda r: _offset_page(r, 3, 'values', lambda i: {'groupId': str(i), 'name': f'g{i}'}),
+  )
+  components = mock_api.get('/rest/api/3/component').mock(
+    side_effect=lambda r: _offset_page(r, 5, 'values', lambda i: {'id': str(i), 'name': f'C{i}'}),
+  )
+  mock_api.get('/rest/api/3/issue/createmeta/PROJ/issuetypes').mock(
+    side_effect=lambda r: _offset_page(r, 3, 'issueTypes', lambda i: {'id': str(i), 'name': f'T{i}'}),
+  )
+  assert [d.id for d in client.dashboards.list_paginated(page_size=2)] == ['0', '1', '2']
+  assert [g.name for g in client.groups.bulk_get_paginated(group_names=['g'], page_size=2)] == ['g0', 'g1', 'g2']
+  found = client.components.find_for_projects_paginated(project_ids=['PROJ'], page_size=2, limit=3)
+  assert [c.name for c in found] == ['C0', 'C1', 'C2']
+  assert components.calls.last.request.url.params['projectIdsOrKeys'] == 'PROJ'
+  types = client.issue_metadata.get_create_issue_types_paginated('PROJ', page_size=2)
+  assert [t.name for t in types] == ['T0', 'T1', 'T2']
+
+
+def test_jql_paginated_prefetch(client, mock_api):
+  route = mock_api.get('/rest/api/3/search').mock(
+    side_effect=lambda r: _offset_page(r, 10, 'issues', lambda i: {**ISSUE_JSON, 'key': f'PROJ-{i}'}),
+  )
+  paginator = client.search.jql_paginated('project = PROJ', page_size=4, prefetch=2)
+  assert next(paginator).key == 'PROJ-0'
+  # The first page is being consumed while both later pages are requested.
+  deadline = time.monotonic() + 2
+  while route.call_count < 3 and time.monotonic() < deadline:
+    time.sleep(0.01)
+  assert route.call_count == 3
+  assert len(list(paginator)) == 9
+  with pytest.raises(ValueError, match='prefetch'):
+    client.search.jql_paginated('project = PROJ', adaptive=True, prefetch=2)
+
+
+def test_jql_paginated_limit_shrinks_last_page(client, mock_api):
+  route = mock_api.get('/rest/api/3/search').mock(
+    side_effect=lambda r: _offset_page(r, 500, 'issues', lambda i: {**ISSUE_JSON, 'key': f'PROJ-{i}'}),
+  )
+  issues = list(client.search.jql_paginated('project = PROJ', page_size=100, limit=120))
+  assert len(issues) == 120
+  assert [c.request.url.params['maxResults'] for c in route.calls] == ['100', '20']
+
+
+def test_paginator_limit_with_prefetch():
+  all_items = [_make_issue(f'PROJ-{i}') for i in range(20)]
+  calls: list[tuple[int, int]] = []
+
+  def fetch_page(start_at: int, max_results: int) -> tuple[list[Issue], int]:
+    calls.append((start_at, max_results))
+    return all_items[start_at:start_at + max_results], 20
+
+  paginator = Paginator(fetch_page, page_size=4, limit=10, prefetch=3)
+  assert [i.key for i in paginator] == [f'PROJ-{i}' for i in range(10)]
+  assert sorted(calls) == [(0, 4), (4, 4), (8, 2)]
+  assert list(Paginator(fetch_page, limit=0)) == []
+
+
+def test_page_size_tuner():
+  from pyjira.pagination import PageSizeTuner
+
+  tuner = PageSizeTuner(50, max_size=1000, target_seconds=1.0, max_bytes=1_000_000)
+  tuner.observe(50, 50, 0.1, final=False)
+  assert tuner.size == 100
+  tuner.record_bytes(4_000_000)
+  tuner.observe(100, 100, 0.1, final=False)
+  assert tuner.size == 50
+  tuner.observe(50, 50, 4.0, final=False)
+  assert tuner.size == 25
+  tuner.observe(25, 20, 0.1, final=False)
+  assert tuner.server_cap == 20
+  tuner.observe(20, 20, 0.01, final=False)
+  assert tuner.size == 20
+  tuner.observe(20, 3, 9.0, final=True)
+  assert tuner.size == 20
+
+
+def test_paginator_adaptive_shrinks_after_server_error():
+  from pyjira.exceptions import ServerError
+
+  all_items = [_make_issue(f'PROJ-{i}') for i in range(30)]
+  sizes: list[int] = []
+
+  def fetch_page(start_at: int, max_results: int) -> tuple[list[Issue], int]:
+    sizes.append(max_results)
+    if max_results > 20:
+      raise ServerError('Gateway timeout', status_code=504)
+    return all_items[start_at:start_at + max_results], 30
+
+  paginator = Paginator(fetch_page, page_size=40, adaptive=True)
+  assert len(list(paginator)) == 30
+  assert sizes[:3] == [40, 20, 40]
+
+  with pytest.raises(ValueError):
+    Paginator(fetch_page, adaptive=True, prefetch=1)
+
+
+def test_paginator_adaptive_does_not_shrink_on_open_circuit():
+  from pyjira.exceptions import CircuitOpenError
+
+  sizes: list[int] = []
+
+  def fetch_page(start_at: int, max_results: int) -> tuple[list[Issue], int]:
+    sizes.append(max_results)
+    raise CircuitOpenError('Circuit open', group='search')
+
+  paginator = Paginator(fetch_page, page_size=40, adaptive=True)
+  with pytest.raises(CircuitOpenError):
+    next(paginator)
+  assert sizes == [40]
@@ -0,0 +1,117 @@
+import asyncio
+from datetime import UTC, datetime
+
+import httpx
+import pytest
+
+from pyjira import AsyncJiraClient
+from pyjira.exceptions import RateLimitError
+from pyjira.ratelimit import AdaptiveConcurrency, RateLimitInfo, parse_retry_after
+from tests.conftest import BASE_URL, ISSUE_JSON
+
+_HEADERS = {
+  'X-RateLimit-Limit': '100',
+  'X-RateLimit-Remaining': '12',
+  'X-RateLimit-Reset': '2026-01-01T00:00:10Z',
+  'X-RateLimit-NearLimit': 'true',
+  'RateLimit-Reason': 'jira-burst-based',
+}
+
+
+def test_parse_headers():
+  info = RateLimitInfo.from_response(httpx.Response(200, headers=_HEADERS))
+  assert info is not None
+  assert (info.limit, info.remaining, info.reason) == (100, 12, 'jira-burst-based')
+  assert info.reset == datetime(2026, 1, 1, 0, 0, 10, tzinfo=UTC)
+  assert info.near_limit and info.nearly_exhausted
+  assert info.remaining_fraction == 0.12
+  assert not info.throttled
+  assert RateLimitInfo.from_response(httpx.Response(200)) is None
+
+
+def test_parse_retry_after():
+  assert parse_retry_after('5') == 5.0
+  assert parse_retry_after('0.5') == 0.5
+  assert parse_retry_after('Wed, 21 Oct 2015 07:28:00 GMT') == 0.0
+  assert parse_retry_after('soon') is None
+  assert parse_retry_after(None) is None
+
+
+def test_client_tracks_headers(client, mock_api):
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(
+    return_value=httpx.Response(200, json=ISSUE_JSON, headers=_HEADERS),
+  )
+  client.issues.get('PROJ-123')
+  assert client.rate_limit.latest is not None
+  assert client.rate_limit.latest.remaining == 12
+  assert client.rate_limit.near_limit == 1
+
+
+def test_rate_limit_error_carries_headers(client, mock_api):
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(
+    return_value=httpx.Response(429, headers={'Retry-After': '1.5', 'RateLimit-Reason': 'jira-quota-tenant-based'}),
+  )
+  with pytest.raises(RateLimitError) as excinfo:
+    client.issues.get('PROJ-123')
+  assert excinfo.value.retry_after == 2
+  assert excinfo.value.rate_limit.reason == 'jira-quota-tenant-based'
+  assert client.rate_limit.throttled == 1
+
+
+@pytest.mark.asyncio
+async def test_additive_increase_and_multiplicative_decrease():
+  limiter = AdaptiveConcurrency(4, max_limit=8)
+  for _ in range(8):
+    tokens = [await limiter.acquire() for _ in range(limiter.limit)]
+    for token in tokens:
+      limiter.release(token, 200)
+  assert limiter.limit > 4
+
+  before = limiter.limit
+  tokens = [await limiter.acquire() for _ in range(3)]
+  throttled = RateLimitInfo(status_code=429, retry_after=0.0)
+  for token in tokens:
+    limiter.release(token, 429, throttled)
+  # One decrease per round trip, not one per throttled response.
+  assert limiter.limit == max(1, int(before * 0.5))
+
+
+@pytest.mark.asyncio
+async def test_backs_off_near_limit():
+  limiter = AdaptiveConcurrency(10)
+  token = await limiter.acquire()
+  limiter.release(token, 200, RateLimitInfo(status_code=200, limit=100, remaining=5))
+  assert limiter.limit == 9
+
+
+@pytest.mark.asyncio
+async def test_waits_for_a_free_slot():
+  limiter = AdaptiveConcurrency(1, max_limit=1)
+  token = await limiter.acquire()
+  waiter = asyncio.ensure_future(limiter.acquire())
+  await asyncio.sleep(0)
+  assert not waiter.done()
+  limiter.release(token, 200)
+  limiter.release(await waiter, 200)
+  assert limiter.in_flight == 0
+
+
+@pytest.mark.asyncio
+async def test_client_adapts_concurrency(mock_api):
+  async def slow(request):
+    await asyncio.sleep(0.001)
+    return httpx.Response(200, json=ISSUE_JSON)
+
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(side_effect=slow)
+  limiter = AdaptiveConcurrency(2, max_limit=16)
+  async with AsyncJiraClient(
+    base_url=BASE_URL,
+    email='test@example.com',
+    api_token='test-token',
+    adaptive_concurrency=limiter,
+  ) as client:
+    assert client.adaptive_concurrency is limiter
+    results = [issue async for issue in client.map(client.issues.get, ['PROJ-123'] * 40)]
+  assert len(results) == 40
+  assert limiter.limit > 2
+  assert limiter.in_flight == 0
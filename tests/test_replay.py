@@ -0,0 +1,89 @@
+import httpx
+import pytest
+
+from pyjira import AsyncJiraClient, JiraClient
+from pyjira.replay import Cassette, ReplayMissError
+from tests.conftest import BASE_URL, ISSUE_JSON, SEARCH_RESULTS_JSON
+
+
+def _client(cassette, base_url=BASE_URL):
+  return JiraClient(base_url=base_url, email='test@example.com', api_token='test-token', cassette=cassette)
+
+
+def test_record_then_replay(tmp_path, mock_api):
+  path = tmp_path / 'jira.cassette'
+  issue = mock_api.get('/rest/api/3/issue/PROJ-123').mock(return_value=httpx.Response(200, json=ISSUE_JSON))
+  search = mock_api.get('/rest/api/3/search').mock(return_value=httpx.Response(200, json=SEARCH_RESULTS_JSON))
+  create = mock_api.post('/rest/api/3/issue').mock(
+    return_value=httpx.Response(201, json={'id': '10001', 'key': 'PROJ-2', 'self': ''}),
+  )
+  with _client(Cassette(path, mode='record')) as client:
+    client.issues.get('PROJ-123')
+    client.search.jql('project = PROJ')
+    client.issues.create({'summary': 'Recorded'})
+    assert client.cassette.recorded == 3
+  assert path.exists()
+  assert b'test-token' not in path.read_bytes()
+
+  cassette = Cassette(path)
+  assert len(cassette) == 3
+  with _client(cassette, base_url='https://elsewhere.example.com') as client:
+    assert client.issues.get('PROJ-123').key == 'PROJ-123'
+    assert client.search.jql('project = PROJ').total == SEARCH_RESULTS_JSON['total']
+    assert client.issues.create({'summary': 'Recorded'}).key == 'PROJ-2'
+    with pytest.raises(ReplayMissError):
+      client.search.jql('project = OTHER')
+    with pytest.raises(ReplayMissError):
+      client.issues.create({'summary': 'Different body'})
+  assert cassette.replayed == 3
+  assert (issue.call_count, search.call_count, create.call_count) == (1, 1, 1)
+
+
+def test_repeated_requests_replay_in_order(tmp_path, mock_api):
+  path = tmp_path / 'jira.cassette'
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(side_effect=[
+    httpx.Response(404, json={'errorMessages': ['gone'], 'errors': {}}),
+    httpx.Response(200, json=ISSUE_JSON),
+  ])
+  with _client(Cassette(path, mode='record')) as client:
+    for _ in range(2):
+      try:
+        client.issues.get('PROJ-123')
+      except Exception:
+        pass
+
+  with _client(Cassette(path)) as client:
+    with pytest.raises(Exception):
+      client.issues.get('PROJ-123')
+    assert client.issues.get('PROJ-123').key == 'PROJ-123'
+    # The last response repeats.
+    assert client.issues.get('PROJ-123').key == 'PROJ-123'
+
+
+def test_auto_mode_records_misses(tmp_path, mock_api):
+  path = tmp_path / 'jira.cassette'
+  route = mock_api.get('/rest/api/3/issue/PROJ-123').mock(return_value=httpx.Response(200, json=ISSUE_JSON))
+  for _ in range(2):
+    with _client(Cassette(path, mode='auto')) as client:
+      client.issues.get('PROJ-123')
+  assert route.call_count == 1
+
+
+def test_replay_requires_file(tmp_path):
+  with pytest.raises(FileNotFoundError):
+    Cassette(tmp_path / 'missing.cassette')
+
+
+@pytest.mark.asyncio
+async def test_async_replay(tmp_path, mock_api):
+  path = tmp_path / 'jira.cassette'
+  mock_api.get('/rest/api/3/issue/PROJ-123').mock(return_value=httpx.Response(200, json=ISSUE_JSON))
+  async with AsyncJiraClient(
+    base_url=BASE_URL, email='test@example.com', api_token='test-token', cassette=Cassette(path, mode='record'),
+  ) as client:
+    await client.issues.get('PROJ-123')
+
+  async with AsyncJiraClient(
+    base_url=BASE_URL, email='test@example.com', api_token='test-token', cassette=Cassette(path),
+  ) as client:
+    assert (await client.issues.get('PROJ-123')).key == 'PROJ-123'
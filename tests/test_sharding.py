@@ -0,0 +1,54 @@
+import re
+
+import httpx
+import pytest
+
+from pyjira import AsyncJiraClient
+from pyjira.sharding import ascan_sharded, plan_shards, scan_sharded
+from tests.conftest import BASE_URL, ISSUE_JSON
+
+
+ISSUE_IDS = list(range(10_000, 10_100))
+
+
+def _fake_search(request: httpx.Request) -> httpx.Response:
+  params = request.url.params
+  jql = params['jql']
+  ids = ISSUE_IDS
+  for op, value in re.findall(r'id (>=|<) (\d+)', jql):
+    ids = [i for i in ids if (i >= int(value) if op == '>=' else i < int(value))]
+  if 'ORDER BY id DESC' in jql:
+    ids = ids[::-1]
+  start, limit = int(params['startAt']), int(params['maxResults'])
+  page = [{**ISSUE_JSON, 'id': str(i), 'key': f'PROJ-{i}'} for i in ids[start:start + limit]]
+  return httpx.Response(200, json={'startAt': start, 'maxResults': limit, 'total': len(ids), 'issues': page})
+
+
+def test_plan_shards_bisects_by_id(client, mock_api):
+  mock_api.get('/rest/api/3/search').mock(side_effect=_fake_search)
+  shards = plan_shards(client.search, 'project = PROJ ORDER BY key', shard_size=30)
+  assert len(shards) == 4
+  assert all(s.estimate <= 30 for s in shards)
+  assert sum(s.estimate for s in shards) == len(ISSUE_IDS)
+  assert shards[0].jql == '(project = PROJ) AND id < 10025'
+  assert shards[-1].jql == '(project = PROJ) AND id >= 10075'
+
+
+def test_plan_shards_small_query_is_single_shard(client, mock_api):
+  mock_api.get('/rest/api/3/search').mock(side_effect=_fake_search)
+  shards = plan_shards(client.search, 'project = PROJ', shard_size=1000)
+  assert [s.jql for s in shards] == ['project = PROJ']
+
+
+def test_scan_sharded_yields_every_issue_once(client, mock_api):
+  mock_api.get('/rest/api/3/search').mock(side_effect=_fake_search)
+  issues = list(scan_sharded(client.search, 'project = PROJ', shard_size=20, workers=4, page_size=7))
+  assert sorted(int(i.id) for i in issues) == ISSUE_IDS
+
+
+@pytest.mark.asyncio
+async def test_ascan_sharded_yields_every_issue_once(mock_api):
+  mock_api.get('/rest/api/3/search').mock(side_effect=_fake_search)
+  async with AsyncJiraClient(base_url=BASE_URL, email='a@b.com', api_token='tok') as client:
+    issues = [i async for i in ascan_sharded(client.search, 'project = PROJ', shard_size=20, page_size=9)]
+  assert sorted(int(i.id) for i in issues) == ISSUE_IDS